@@ -0,0 +1 @@
+"""Benchmarks for plotski (run using `asv`)."""
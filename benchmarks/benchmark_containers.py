@@ -0,0 +1,30 @@
+"""Benchmarks of adding many items to plotski.store.PlotStore"""
+
+from plotski.store import PlotStore
+from plotski.store.containers import Individual
+
+
+class ScalingSuite:
+    """Add many (empty) layout containers to single tab."""
+
+    params = [1_000, 10_000, 100_000]
+    param_names = ["n_items"]
+    timeout = 600
+
+    def setup(self, n_items):
+        self.store = PlotStore()
+        self.store.add_tab("tab")
+
+    def time_add_rows(self, n_items):
+        for _ in range(n_items):
+            self.store.add_row("tab")
+
+    def time_add_items(self, n_items):
+        tab = self.store.tabs["tab"]
+        for _ in range(n_items):
+            tab[self.store.get_unique_name("tab")] = Individual()
+
+    def peakmem_add_items(self, n_items):
+        tab = self.store.tabs["tab"]
+        for _ in range(n_items):
+            tab[self.store.get_unique_name("tab")] = Individual()
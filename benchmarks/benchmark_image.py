@@ -0,0 +1,71 @@
+"""Benchmarks for plotski.image"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from plotski.rgb import ImageRGBA
+from plotski.store import PlotStore
+from plotski.utilities import get_label_contours
+
+
+def get_smooth_images(n_channels: int, shape=(1024, 1024)):
+    y, x = np.mgrid[: shape[0], : shape[1]]
+    return [np.sin(x / (20 + i)) * np.cos(y / (30 + i)) + 1 for i in range(n_channels)]
+
+
+class EncodeSuite:
+    """Build and save document with raw vs PNG/WebP-encoded images."""
+
+    params = [["image", "rgba"], [None, "png", "webp"]]
+    param_names = ["kind", "encode"]
+
+    def setup(self, kind, encode):
+        self.tmpdir = tempfile.mkdtemp()
+        self.image = get_smooth_images(1)[0]
+        self.rgba = ImageRGBA(get_smooth_images(3))
+
+    def teardown(self, kind, encode):
+        shutil.rmtree(self.tmpdir)
+
+    def _save(self, kind, encode):
+        store = PlotStore(self.tmpdir)
+        if kind == "image":
+            store.plot_image("tab", {"image": [self.image]}, encode=encode, hover_factor=4)
+        else:
+            store.plot_rgb_image("tab", self.rgba, encode=encode, hover_factor=4)
+        return store.save(show=False)
+
+    def time_save(self, kind, encode):
+        self._save(kind, encode)
+
+    def track_output_bytes(self, kind, encode):
+        return os.path.getsize(self._save(kind, encode))
+
+    track_output_bytes.unit = "bytes"
+
+
+def get_label_image(n_labels: int, shape=(1000, 1000), seed: int = 42):
+    """Return label image of `n_labels` watershed cells."""
+    from skimage.filters import gaussian
+    from skimage.segmentation import watershed
+
+    rng = np.random.default_rng(seed)
+    markers = np.zeros(shape, dtype=np.int32)
+    markers.flat[rng.choice(markers.size, n_labels, replace=False)] = np.arange(1, n_labels + 1)
+    return watershed(gaussian(rng.random(shape), 2), markers)
+
+
+class LabelContoursSuite:
+    """Extract outlines of all cells in a label image."""
+
+    params = [[500, 5_000], [0, 0.5]]
+    param_names = ["n_labels", "tolerance"]
+
+    def setup(self, n_labels, tolerance):
+        self.labels = get_label_image(n_labels)
+
+    def time_get_label_contours(self, n_labels, tolerance):
+        get_label_contours(self.labels, tolerance)
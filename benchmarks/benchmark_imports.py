@@ -0,0 +1,20 @@
+"""Benchmarks of import time (each run in fresh interpreter)."""
+
+
+def timeraw_import_plotski():
+    return "import plotski"
+
+
+def timeraw_import_image_rgba():
+    return "from plotski.rgb import ImageRGBA"
+
+
+def timeraw_import_plot_store():
+    return "from plotski import PlotStore"
+
+
+def timeraw_convert_colormap_to_mapper():
+    return (
+        "convert_colormap_to_mapper(np.ones((2, 2)), 'viridis')",
+        "import numpy as np; from plotski.utilities import convert_colormap_to_mapper",
+    )
@@ -0,0 +1,192 @@
+"""Benchmarks for plotski.rgb"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from plotski.rgb import ImageRGBA
+
+
+def get_images(n_channels: int, shape=(1024, 1024)):
+    rng = np.random.default_rng(42)
+    return [rng.random(shape) for _ in range(n_channels)]
+
+
+class CombineSuite:
+    """Combine multiple channels into single RGBA image."""
+
+    params = [1, 5, 10, 30]
+    param_names = ["n_channels"]
+
+    def setup(self, n_channels):
+        self.image_rgba = ImageRGBA(get_images(n_channels))
+
+    def time_combine(self, n_channels):
+        # the accumulator is cached after the first call, so discard it to time the accumulation on every repeat
+        self.image_rgba._accumulator = None
+        self.image_rgba.combine()
+
+    def peakmem_combine(self, n_channels):
+        self.image_rgba._accumulator = None
+        self.image_rgba.combine()
+
+
+class SetupSuite:
+    """Create RGBA image from multiple channels."""
+
+    params = ([1, 5, 10, 30], ["uint8", "float32"])
+    param_names = ["n_channels", "dtype"]
+
+    def setup(self, n_channels, dtype):
+        self.images = get_images(n_channels)
+
+    def time_setup(self, n_channels, dtype):
+        ImageRGBA(self.images, dtype=dtype)
+
+    def peakmem_setup(self, n_channels, dtype):
+        ImageRGBA(self.images, dtype=dtype)
+
+
+class RecolorSuite:
+    """Recolor single channel of already combined RGBA image."""
+
+    params = [10, 40]
+    param_names = ["n_channels"]
+
+    def setup(self, n_channels):
+        self.image_rgba = ImageRGBA(get_images(n_channels))
+        _ = self.image_rgba.rgba
+
+    def time_recolor(self, n_channels):
+        self.image_rgba.recolor(0, "#FF00FF")
+        _ = self.image_rgba.rgba
+
+    def time_set_visible(self, n_channels):
+        self.image_rgba.set_visible(0, False)
+        _ = self.image_rgba.rgba
+
+
+class ParallelSuite:
+    """Create and combine RGBA image using multiple threads."""
+
+    params = ([1, 4, 16], [100])
+    param_names = ["n_jobs", "n_channels"]
+    timeout = 300
+
+    def setup(self, n_jobs, n_channels):
+        self.images = get_images(n_channels, shape=(512, 512))
+
+    def time_setup_and_combine(self, n_jobs, n_channels):
+        ImageRGBA(self.images, n_jobs=n_jobs).combine()
+
+
+class TiledSuite:
+    """Combine memory-mapped channels one tile at a time."""
+
+    params = [256, 1024]
+    param_names = ["tile_size"]
+
+    def setup(self, tile_size):
+        self.tmpdir = tempfile.mkdtemp()
+        self.images = []
+        for i, image in enumerate(get_images(10, shape=(2048, 2048))):
+            mmap = np.lib.format.open_memmap(os.path.join(self.tmpdir, f"{i}.npy"), mode="w+", shape=image.shape)
+            mmap[:] = image
+            self.images.append(mmap)
+
+    def teardown(self, tile_size):
+        del self.images
+        shutil.rmtree(self.tmpdir)
+
+    def time_combine_tiled(self, tile_size):
+        ImageRGBA.combine_tiled(self.images, path=os.path.join(self.tmpdir, "rgba.npy"), tile_size=tile_size)
+
+
+class QuantileSuite:
+    """Compute quantiles of RGBA image using histogram/sampling and the full sort-based path."""
+
+    params = ["uint8", "float32"]
+    param_names = ["dtype"]
+
+    def setup(self, dtype):
+        rng = np.random.default_rng(42)
+        if dtype == "uint8":
+            self.image = rng.integers(0, 256, (2048, 2048, 4), dtype=np.uint8)
+        else:
+            self.image = rng.random((2048, 2048, 4), dtype=np.float32) * 255
+
+    def time_get_quantiles(self, dtype):
+        ImageRGBA.get_quantiles(self.image, [0.02, 0.98])
+
+    def time_np_quantile(self, dtype):
+        np.quantile(self.image, [0.02, 0.98])
+
+    def peakmem_get_quantiles(self, dtype):
+        ImageRGBA.get_quantiles(self.image, [0.02, 0.98])
+
+    def peakmem_np_quantile(self, dtype):
+        np.quantile(self.image, [0.02, 0.98])
+
+
+class ContrastSuite:
+    """Contrast enhancement of uint8 RGBA image using lookup table and scikit-image."""
+
+    def setup(self):
+        self.image_rgba = ImageRGBA(get_images(5, shape=(2048, 2048)))
+        _ = self.image_rgba.rgba
+
+    def time_apply_contrast(self):
+        self.image_rgba.apply_contrast(["quantile_rescale", "equalize_histogram"])
+
+    def time_quantile_rescale_equalize_histogram(self):
+        image = self.image_rgba.quantile_rescale()
+        self.image_rgba.equalize_histogram(image=image, as_int=True)
+
+
+class AdaptiveHistogramSuite:
+    """Contrast Limited Adaptive Histogram Equalization of RGBA image."""
+
+    params = [1, 4]
+    param_names = ["n_jobs"]
+    timeout = 300
+
+    def setup(self, n_jobs):
+        self.image_rgba = ImageRGBA(get_images(5, shape=(2048, 2048)))
+        _ = self.image_rgba.rgba
+
+    def time_adaptive_histogram_tiled(self, n_jobs):
+        self.image_rgba.adaptive_histogram_tiled(n_jobs=n_jobs)
+
+
+class AdaptiveHistogramSkimageSuite:
+    """Contrast Limited Adaptive Histogram Equalization of RGBA image using scikit-image."""
+
+    timeout = 300
+
+    def setup(self):
+        self.image_rgba = ImageRGBA(get_images(5, shape=(2048, 2048)))
+        _ = self.image_rgba.rgba
+
+    def time_adaptive_histogram(self):
+        self.image_rgba.adaptive_histogram()
+
+
+class DominantSuite:
+    """Combine many channels using the channel-dominance mode."""
+
+    params = ([10, 100], ["additive", "dominant"])
+    param_names = ["n_channels", "mode"]
+    timeout = 300
+
+    def setup(self, n_channels, mode):
+        self.image_rgba = ImageRGBA(get_images(n_channels, shape=(512, 512)), mode=mode)
+
+    def time_combine(self, n_channels, mode):
+        self.image_rgba._accumulator = None
+        self.image_rgba.combine()
+
+    def peakmem_combine(self, n_channels, mode):
+        self.image_rgba._accumulator = None
+        self.image_rgba.combine()
@@ -0,0 +1,88 @@
+"""End-to-end benchmarks for plotski.store
+
+Each workload consists of `n_tabs` tabs with `n_plots` plots of `n_points` points (or pixels) each. To spot
+regressions between two commits, run e.g.
+
+    asv continuous --factor 1.1 main HEAD -b StoreSuite
+    asv compare main HEAD
+
+or, when working on a single environment, `asv run --python=same --set-commit-hash <hash>` for each commit followed by
+`asv compare`.
+"""
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from plotski.rgb import ImageRGBA
+from plotski.store import PlotStore
+
+KINDS = ["spectrum", "multiline", "image", "rgba"]
+N_LINES = 10
+
+
+def get_data(kind: str, n_points: int, seed: int = 42):
+    """Return data (or factory of the data) for single plot."""
+    rng = np.random.default_rng(seed)
+    if kind == "spectrum":
+        return {"x": np.arange(n_points, dtype=np.float64), "y": rng.random(n_points)}
+    if kind == "multiline":
+        n_points = n_points // N_LINES
+        return {
+            "xs": [np.arange(n_points, dtype=np.float64)] * N_LINES,
+            "ys": [rng.random(n_points) for _ in range(N_LINES)],
+        }
+    side = int(np.sqrt(n_points))
+    if kind == "image":
+        return {"image": [rng.random((side, side))]}
+    return ImageRGBA([rng.random((side, side)) for _ in range(3)])
+
+
+def build_store(output_dir: str, kind: str, n_tabs: int, n_plots: int, data) -> PlotStore:
+    """Build store with `n_tabs` x `n_plots` plots of the specified kind."""
+    store = PlotStore(output_dir)
+    func = {
+        "spectrum": store.plot_spectrum,
+        "multiline": store.plot_multiline_spectrum,
+        "image": store.plot_image,
+        "rgba": store.plot_rgb_image,
+    }[kind]
+    for i in range(n_tabs):
+        for _ in range(n_plots):
+            func(f"tab {i}", data if isinstance(data, ImageRGBA) else dict(data))
+    return store
+
+
+class StoreSuite:
+    """Build, lay out and save synthetic documents."""
+
+    params = [KINDS, [1, 4], [1, 8], [10_000, 100_000]]
+    param_names = ["kind", "n_tabs", "n_plots", "n_points"]
+    timeout = 300
+
+    def setup(self, kind, n_tabs, n_plots, n_points):
+        self.tmpdir = tempfile.mkdtemp()
+        self.data = get_data(kind, n_points)
+        self.store = build_store(self.tmpdir, kind, n_tabs, n_plots, self.data)
+
+    def teardown(self, kind, n_tabs, n_plots, n_points):
+        shutil.rmtree(self.tmpdir)
+
+    def time_build(self, kind, n_tabs, n_plots, n_points):
+        build_store(self.tmpdir, kind, n_tabs, n_plots, self.data)
+
+    def time_get_layout(self, kind, n_tabs, n_plots, n_points):
+        self.store.get_layout()
+
+    def time_save(self, kind, n_tabs, n_plots, n_points):
+        self.store.save(show=False)
+
+    def peakmem_build_and_save(self, kind, n_tabs, n_plots, n_points):
+        build_store(self.tmpdir, kind, n_tabs, n_plots, self.data).save(show=False)
+
+    def track_output_bytes(self, kind, n_tabs, n_plots, n_points):
+        return os.path.getsize(self.store.save(show=False))
+
+    track_output_bytes.unit = "bytes"
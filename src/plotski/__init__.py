@@ -3,10 +3,39 @@
 Plotski is meant to make it easier to create static HTML documents.
 """
 
-from plotski.base import Plot  # noqa
-from plotski.store import PlotStore  # noqa
-from plotski.store.custom import CustomPlotStore  # noqa
+import typing as ty
+from importlib import import_module
+
+if ty.TYPE_CHECKING:
+    from plotski.base import Plot
+    from plotski.rgb import ImageRGBA
+    from plotski.store import PlotStore
+    from plotski.store.custom import CustomPlotStore
 
 __author__ = "Lukasz G. Migas"
 __email__ = "l.g.migas@tudelft.nl"
 __version__ = "0.1.0"
+
+# public API is imported on first access so that `import plotski` does not pull in Bokeh
+_LAZY_ATTRIBUTES = {
+    "Plot": "plotski.base",
+    "PlotStore": "plotski.store",
+    "CustomPlotStore": "plotski.store.custom",
+    "ImageRGBA": "plotski.rgb",
+}
+
+__all__ = ["CustomPlotStore", "ImageRGBA", "Plot", "PlotStore"]
+
+
+def __getattr__(name: str):
+    """Import public attributes on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> ty.List[str]:
+    """List module attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
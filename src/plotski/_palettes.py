@@ -0,0 +1,551 @@
+"""Precomputed palettes of common matplotlib colormaps.
+
+Generated by `tools/generate_palettes.py` using matplotlib 3.11.2 - do not edit manually.
+"""
+
+PALETTES = {
+    "viridis": (
+        "44015444025645045745055946075a46085c460a5d460b5e470d60470e6147106347116447136548146748166848176948186a481a6c"
+        "481b6d481c6e481d6f481f70482071482173482374482475482576482677482878482979472a7a472c7a472d7b472e7c472f7d46307e"
+        "46327e46337f463480453581453781453882443983443a83443b84433d84433e85423f85424086424186414287414487404588404688"
+        "3f47883f48893e49893e4a893e4c8a3d4d8a3d4e8a3c4f8a3c508b3b518b3b528b3a538b3a548c39558c39568c38588c38598c375a8c"
+        "375b8d365c8d365d8d355e8d355f8d34608d34618d33628d33638d32648e32658e31668e31678e31688e30698e306a8e2f6b8e2f6c8e"
+        "2e6d8e2e6e8e2e6f8e2d708e2d718e2c718e2c728e2c738e2b748e2b758e2a768e2a778e2a788e29798e297a8e297b8e287c8e287d8e"
+        "277e8e277f8e27808e26818e26828e26828e25838e25848e25858e24868e24878e23888e23898e238a8d228b8d228c8d228d8d218e8d"
+        "218f8d21908d21918c20928c20928c20938c1f948c1f958b1f968b1f978b1f988b1f998a1f9a8a1e9b8a1e9c891e9d891f9e891f9f88"
+        "1fa0881fa1881fa1871fa28720a38620a48621a58521a68522a78522a88423a98324aa8325ab8225ac8226ad8127ad8128ae8029af7f"
+        "2ab07f2cb17e2db27d2eb37c2fb47c31b57b32b67a34b67935b77937b87838b9773aba763bbb753dbc743fbc7340bd7242be7144bf70"
+        "46c06f48c16e4ac16d4cc26c4ec36b50c46a52c56954c56856c66758c7655ac8645cc8635ec96260ca6063cb5f65cb5e67cc5c69cd5b"
+        "6ccd5a6ece5870cf5773d05675d05477d1537ad1517cd2507fd34e81d34d84d44b86d54989d5488bd6468ed64590d74393d74195d840"
+        "98d83e9bd93c9dd93ba0da39a2da37a5db36a8db34aadc32addc30b0dd2fb2dd2db5de2bb8de29bade28bddf26c0df25c2df23c5e021"
+        "c8e020cae11fcde11dd0e11cd2e21bd5e21ad8e219dae319dde318dfe318e2e418e5e419e7e419eae51aece51befe51cf1e51df4e61e"
+        "f6e620f8e621fbe723fde725"
+    ),
+    "plasma": (
+        "0d088710078813078916078a19068c1b068d1d068e20068f2206902406912605912805922a05932c05942e05952f0596310597330597"
+        "35049837049938049a3a049a3c049b3e049c3f049c41049d43039e44039e46039f48039f4903a04b03a14c02a14e02a25002a25102a3"
+        "5302a35502a45601a45801a45901a55b01a55c01a65e01a66001a66100a76300a76400a76600a76700a86900a86a00a86c00a86e00a8"
+        "6f00a87100a87201a87401a87501a87701a87801a87a02a87b02a87d03a87e03a88004a88104a78305a78405a78606a68707a68808a6"
+        "8a09a58b0aa58d0ba58e0ca48f0da4910ea3920fa39410a29511a19613a19814a099159f9a169f9c179e9d189d9e199da01a9ca11b9b"
+        "a21d9aa31e9aa51f99a62098a72197a82296aa2395ab2494ac2694ad2793ae2892b02991b12a90b22b8fb32c8eb42e8db52f8cb6308b"
+        "b7318ab83289ba3388bb3488bc3587bd3786be3885bf3984c03a83c13b82c23c81c33d80c43e7fc5407ec6417dc7427cc8437bc9447a"
+        "ca457acb4679cc4778cc4977cd4a76ce4b75cf4c74d04d73d14e72d24f71d35171d45270d5536fd5546ed6556dd7566cd8576bd9586a"
+        "da5a6ada5b69db5c68dc5d67dd5e66de5f65de6164df6263e06363e16462e26561e26660e3685fe4695ee56a5de56b5de66c5ce76e5b"
+        "e76f5ae87059e97158e97257ea7457eb7556eb7655ec7754ed7953ed7a52ee7b51ef7c51ef7e50f07f4ff0804ef1814df1834cf2844b"
+        "f3854bf3874af48849f48948f58b47f58c46f68d45f68f44f79044f79143f79342f89441f89540f9973ff9983ef99a3efa9b3dfa9c3c"
+        "fa9e3bfb9f3afba139fba238fca338fca537fca636fca835fca934fdab33fdac33fdae32fdaf31fdb130fdb22ffdb42ffdb52efeb72d"
+        "feb82cfeba2cfebb2bfebd2afebe2afec029fdc229fdc328fdc527fdc627fdc827fdca26fdcb26fccd25fcce25fcd025fcd225fbd324"
+        "fbd524fbd724fad824fada24f9dc24f9dd25f8df25f8e125f7e225f7e425f6e626f6e826f5e926f5eb27f4ed27f3ee27f3f027f2f227"
+        "f1f426f1f525f0f724f0f921"
+    ),
+    "inferno": (
+        "00000401000501010601010802010a02020c02020e03021004031204031405041706041907051b08051d09061f0a07220b07240c0826"
+        "0d08290e092b10092d110a30120a32140b34150b37160b39180c3c190c3e1b0c411c0c431e0c451f0c48210c4a230c4c240c4f260c51"
+        "280b53290b552b0b572d0b592f0a5b310a5c320a5e340a5f3609613809623909633b09643d09653e0966400a67420a68440a68450a69"
+        "470b6a490b6a4a0c6b4c0c6b4d0d6c4f0d6c510e6c520e6d540f6d550f6d57106e59106e5a116e5c126e5d126e5f136e61136e62146e"
+        "64156e65156e67166e69166e6a176e6c186e6d186e6f196e71196e721a6e741a6e751b6e771c6d781c6d7a1d6d7c1d6d7d1e6d7f1e6c"
+        "801f6c82206c84206b85216b87216b88226a8a226a8c23698d23698f24699025689225689326679526679727669827669a28659b2964"
+        "9d29649f2a63a02a63a22b62a32c61a52c60a62d60a82e5fa92e5eab2f5ead305dae305cb0315bb1325ab3325ab43359b63458b73557"
+        "b93556ba3655bc3754bd3853bf3952c03a51c13a50c33b4fc43c4ec63d4dc73e4cc83f4bca404acb4149cc4248ce4347cf4446d04545"
+        "d24644d34743d44842d54a41d74b3fd84c3ed94d3dda4e3cdb503bdd513ade5238df5337e05536e15635e25734e35933e45a31e55c30"
+        "e65d2fe75e2ee8602de9612bea632aeb6429eb6628ec6726ed6925ee6a24ef6c23ef6e21f06f20f1711ff1731df2741cf3761bf37819"
+        "f47918f57b17f57d15f67e14f68013f78212f78410f8850ff8870ef8890cf98b0bf98c0af98e09fa9008fa9207fa9407fb9606fb9706"
+        "fb9906fb9b06fb9d07fc9f07fca108fca309fca50afca60cfca80dfcaa0ffcac11fcae12fcb014fcb216fcb418fbb61afbb81dfbba1f"
+        "fbbc21fbbe23fac026fac228fac42afac62df9c72ff9c932f9cb35f8cd37f8cf3af7d13df7d340f6d543f6d746f5d949f5db4cf4dd4f"
+        "f4df53f4e156f3e35af3e55df2e661f2e865f2ea69f1ec6df1ed71f1ef75f1f179f2f27df2f482f3f586f3f68af4f88ef5f992f6fa96"
+        "f8fb9af9fc9dfafda1fcffa4"
+    ),
+    "magma": (
+        "00000401000501010601010802010902020b02020d03030f03031204041405041606051806051a07061c08071e0907200a08220b0924"
+        "0c09260d0a290e0b2b100b2d110c2f120d31130d34140e36150e38160f3b180f3d19103f1a10421c10441d11471e114920114b21114e"
+        "22115024125325125527125829115a2a115c2c115f2d11612f116331116533106734106936106b38106c390f6e3b0f703d0f713f0f72"
+        "400f74420f75440f764510774710784910784a10794c117a4e117b4f127b51127c52137c54137d56147d57157e59157e5a167e5c167f"
+        "5d177f5f187f601880621980641a80651a80671b80681c816a1c816b1d816d1d816e1e81701f81721f81732081752181762181782281"
+        "7922827b23827c23827e24828025828125818326818426818627818827818928818b29818c29818e2a81902a81912b81932b80942c80"
+        "962c80982d80992d809b2e7f9c2e7f9e2f7fa02f7fa1307ea3307ea5317ea6317da8327daa337dab337cad347cae347bb0357bb2357b"
+        "b3367ab5367ab73779b83779ba3878bc3978bd3977bf3a77c03a76c23b75c43c75c53c74c73d73c83e73ca3e72cc3f71cd4071cf4070"
+        "d0416fd2426fd3436ed5446dd6456cd8456cd9466bdb476adc4869de4968df4a68e04c67e24d66e34e65e44f64e55064e75263e85362"
+        "e95462ea5661eb5760ec5860ed5a5fee5b5eef5d5ef05f5ef1605df2625df2645cf3655cf4675cf4695cf56b5cf66c5cf66e5cf7705c"
+        "f7725cf8745cf8765cf9785df9795df97b5dfa7d5efa7f5efa815ffb835ffb8560fb8761fc8961fc8a62fc8c63fc8e64fc9065fd9266"
+        "fd9467fd9668fd9869fd9a6afd9b6bfe9d6cfe9f6dfea16efea36ffea571fea772fea973feaa74feac76feae77feb078feb27afeb47b"
+        "feb67cfeb77efeb97ffebb81febd82febf84fec185fec287fec488fec68afec88cfeca8dfecc8ffecd90fecf92fed194fed395fed597"
+        "fed799fed89afdda9cfddc9efddea0fde0a1fde2a3fde3a5fde5a7fde7a9fde9aafdebacfcecaefceeb0fcf0b2fcf2b4fcf4b6fcf6b8"
+        "fcf7b9fcf9bbfcfbbdfcfdbf"
+    ),
+    "cividis": (
+        "00224e00234f00245100255300255400265600275800285900285b00295d002a5f002a61002b62002c64002c66002d68002e6a002e6c"
+        "002f6d00306f0030700031700031710132710533710833700c34700f357012357014367016377018376f1a386f1c396f1e3a6f203a6f"
+        "213b6e233c6e243c6e263d6e273e6e293f6e2a3f6d2b406d2d416d2e416d2f426d31436d32436d33446d34456c35456c36466c38476c"
+        "39486c3a486c3b496c3c4a6c3d4a6c3e4b6c3f4c6c404c6c414d6c424e6c434e6c444f6c45506c46516c47516c48526c49536c4a536c"
+        "4b546c4c556c4d556c4e566c4f576c50576c51586d52596d535a6d545a6d555b6d555c6d565c6d575d6d585e6d595e6e5a5f6e5b606e"
+        "5c616e5d616e5e626e5e636f5f636f60646f61656f62656f636670646770656870656870666970676a71686a71696b716a6c716b6d72"
+        "6c6d726c6e726d6f726e6f736f70737071737172747272747273747374757474757575757676767777767777777878777979777a7a78"
+        "7b7a787c7b787d7c787e7c787e7d787f7e78807f78817f788280798381798482798582798683798784788885788985788a86788b8778"
+        "8c88788d88788e89788f8a78908b78918b78928c78928d78938e78948e77958f779690779791779892779992779a93769b94769c9576"
+        "9d95769e96769f9775a09875a19975a29975a39a74a49b74a59c74a69c74a79d73a89e73a99f73aaa073aba072aca172ada272aea371"
+        "afa471b0a571b1a570b3a670b4a76fb5a86fb6a96fb7a96eb8aa6eb9ab6dbaac6dbbad6dbcae6cbdae6cbeaf6bbfb06bc0b16ac1b26a"
+        "c2b369c3b369c4b468c5b568c6b667c7b767c8b866c9b965cbb965ccba64cdbb63cebc63cfbd62d0be62d1bf61d2c060d3c05fd4c15f"
+        "d5c25ed6c35dd7c45cd9c55cdac65bdbc75adcc859ddc858dec958dfca57e0cb56e1cc55e2cd54e4ce53e5cf52e6d051e7d150e8d24f"
+        "e9d34eead34cebd44bedd54aeed649efd748f0d846f1d945f2da44f3db42f5dc41f6dd3ff7de3ef8df3cf9e03afbe138fce236fde334"
+        "fee434fee535fee636fee838"
+    ),
+    "turbo": (
+        "30123b32154333184a341b51351e5836215f37246638276d392a733a2d793b2f803c32863d358b3e38913f3b973f3e9c4040a24143a7"
+        "4146ac4249b1424bb5434eba4451bf4454c34456c74559cb455ccf455ed34661d64664da4666dd4669e0466be3476ee64771e94773eb"
+        "4776ee4778f0477bf2467df44680f64682f84685fa4687fb458afc458cfd448ffe4391fe4294ff4196ff4099ff3e9bfe3d9efe3ba0fd"
+        "3aa3fc38a5fb37a8fa35abf833adf731aff52fb2f42eb4f22cb7f02ab9ee28bceb27bee925c0e723c3e422c5e220c7df1fc9dd1ecbda"
+        "1ccdd81bd0d51ad2d21ad4d019d5cd18d7ca18d9c818dbc518ddc218dec018e0bd19e2bb19e3b91ae4b61ce6b41de7b21fe9af20eaac"
+        "22ebaa25eca727eea42aefa12cf09e2ff19b32f29835f39438f4913cf58e3ff68a43f78746f8844af8804ef97d52fa7a55fa7659fb73"
+        "5dfc6f61fc6c65fd6969fd666dfe6271fe5f75fe5c79fe597dff5680ff5384ff5188ff4e8bff4b8fff4992ff4796fe4499fe429cfe40"
+        "9ffd3fa1fd3da4fc3ca7fc3aa9fb39acfb38affa37b1f936b4f836b7f735b9f635bcf534bef434c1f334c3f134c6f034c8ef34cbed34"
+        "cdec34d0ea34d2e935d4e735d7e535d9e436dbe236dde037dfdf37e1dd37e3db38e5d938e7d739e9d539ebd339ecd13aeecf3aefcd3a"
+        "f1cb3af2c93af4c73af5c53af6c33af7c13af8be39f9bc39faba39fbb838fbb637fcb336fcb136fdae35fdac34fea933fea732fea431"
+        "fea130fe9e2ffe9b2dfe992cfe962bfe932afe9029fd8d27fd8a26fc8725fc8423fb8122fb7e21fa7b1ff9781ef9751df8721cf76f1a"
+        "f66c19f56918f46617f36315f26014f15d13f05b12ef5811ed5510ec530feb500eea4e0de84b0ce7490ce5470be4450ae2430ae14109"
+        "df3f08dd3d08dc3b07da3907d83706d63506d43305d23105d02f05ce2d04cc2b04ca2a04c82803c52603c32503c12302be2102bc2002"
+        "b91e02b71d02b41b01b21a01af1801ac1701a91601a71401a41301a112019e10019b0f01980e01950d01920b018e0a018b0902880802"
+        "8507028106027e05027a0403"
+    ),
+    "Greys": (
+        "fffffffffffffefefefefefefdfdfdfdfdfdfcfcfcfcfcfcfbfbfbfbfbfbfafafafafafaf9f9f9f9f9f9f8f8f8f8f8f8f7f7f7f7f7f7"
+        "f7f7f7f6f6f6f6f6f6f5f5f5f5f5f5f4f4f4f4f4f4f3f3f3f3f3f3f2f2f2f2f2f2f1f1f1f1f1f1f0f0f0f0f0f0efefefeeeeeeeeeeee"
+        "edededececececececebebebeaeaeae9e9e9e9e9e9e8e8e8e7e7e7e7e7e7e6e6e6e5e5e5e4e4e4e4e4e4e3e3e3e2e2e2e1e1e1e1e1e1"
+        "e0e0e0dfdfdfdfdfdfdedededddddddcdcdcdcdcdcdbdbdbdadadadadadad9d9d9d8d8d8d7d7d7d6d6d6d5d5d5d4d4d4d4d4d4d3d3d3"
+        "d2d2d2d1d1d1d0d0d0cfcfcfcecececdcdcdcccccccccccccbcbcbcacacac9c9c9c8c8c8c7c7c7c6c6c6c5c5c5c5c5c5c4c4c4c3c3c3"
+        "c2c2c2c1c1c1c0c0c0bfbfbfbebebebebebebdbdbdbbbbbbbababab9b9b9b8b8b8b6b6b6b5b5b5b4b4b4b3b3b3b2b2b2b0b0b0afafaf"
+        "aeaeaeadadadabababaaaaaaa9a9a9a8a8a8a7a7a7a5a5a5a4a4a4a3a3a3a2a2a2a0a0a09f9f9f9e9e9e9d9d9d9c9c9c9a9a9a999999"
+        "9898989797979595959494949393939292929191919090908f8f8f8e8e8e8d8d8d8c8c8c8a8a8a898989888888878787868686858585"
+        "8484848383838282828181817f7f7f7e7e7e7d7d7d7c7c7c7b7b7b7a7a7a797979787878777777767676757575737373727272717171"
+        "7070706f6f6f6e6e6e6d6d6d6c6c6c6b6b6b6a6a6a6969696868686767676666666565656464646363636262626161616060605f5f5f"
+        "5e5e5e5d5d5d5c5c5c5b5b5b5a5a5a5858585757575656565555555454545353535252525151515050504e4e4e4d4d4d4b4b4b4a4a4a"
+        "4848484747474646464444444343434141414040403f3f3f3d3d3d3c3c3c3a3a3a393939383838363636353535333333323232303030"
+        "2f2f2f2e2e2e2c2c2c2b2b2b2929292828282727272525252424242323232222222121211f1f1f1e1e1e1d1d1d1c1c1c1b1b1b1a1a1a"
+        "1818181717171616161515151414141313131111111010100f0f0f0e0e0e0d0d0d0c0c0c0a0a0a090909080808070707060606050505"
+        "030303020202010101000000"
+    ),
+    "gray": (
+        "0000000101010202020303030404040505050606060707070808080909090a0a0a0b0b0b0c0c0c0d0d0d0e0e0e0f0f0f101010111111"
+        "1212121313131414141515151616161717171818181919191a1a1a1b1b1b1c1c1c1d1d1d1e1e1e1f1f1f202020212121222222232323"
+        "2424242525252626262727272828282929292a2a2a2b2b2b2c2c2c2d2d2d2e2e2e2f2f2f303030313131323232333333343434353535"
+        "3636363737373838383939393a3a3a3b3b3b3c3c3c3d3d3d3e3e3e3f3f3f404040414141424242434343444444454545464646474747"
+        "4848484949494a4a4a4b4b4b4c4c4c4d4d4d4e4e4e4f4f4f505050515151525252535353545454555555565656575757585858595959"
+        "5a5a5a5b5b5b5c5c5c5d5d5d5e5e5e5f5f5f6060606161616262626363636464646565656666666767676868686969696a6a6a6b6b6b"
+        "6c6c6c6d6d6d6e6e6e6f6f6f7070707171717272727373737474747575757676767777777878787979797a7a7a7b7b7b7c7c7c7d7d7d"
+        "7e7e7e7f7f7f8080808181818282828383838484848585858686868787878888888989898a8a8a8b8b8b8c8c8c8d8d8d8e8e8e8f8f8f"
+        "9090909191919292929393939494949595959696969797979898989999999a9a9a9b9b9b9c9c9c9d9d9d9e9e9e9f9f9fa0a0a0a1a1a1"
+        "a2a2a2a3a3a3a4a4a4a5a5a5a6a6a6a7a7a7a8a8a8a9a9a9aaaaaaabababacacacadadadaeaeaeafafafb0b0b0b1b1b1b2b2b2b3b3b3"
+        "b4b4b4b5b5b5b6b6b6b7b7b7b8b8b8b9b9b9babababbbbbbbcbcbcbdbdbdbebebebfbfbfc0c0c0c1c1c1c2c2c2c3c3c3c4c4c4c5c5c5"
+        "c6c6c6c7c7c7c8c8c8c9c9c9cacacacbcbcbcccccccdcdcdcecececfcfcfd0d0d0d1d1d1d2d2d2d3d3d3d4d4d4d5d5d5d6d6d6d7d7d7"
+        "d8d8d8d9d9d9dadadadbdbdbdcdcdcdddddddedededfdfdfe0e0e0e1e1e1e2e2e2e3e3e3e4e4e4e5e5e5e6e6e6e7e7e7e8e8e8e9e9e9"
+        "eaeaeaebebebecececedededeeeeeeefefeff0f0f0f1f1f1f2f2f2f3f3f3f4f4f4f5f5f5f6f6f6f7f7f7f8f8f8f9f9f9fafafafbfbfb"
+        "fcfcfcfdfdfdfefefeffffff"
+    ),
+    "binary": (
+        "fffffffefefefdfdfdfcfcfcfbfbfbfafafaf9f9f9f8f8f8f7f7f7f6f6f6f5f5f5f4f4f4f3f3f3f2f2f2f1f1f1f0f0f0efefefeeeeee"
+        "edededecececebebebeaeaeae9e9e9e8e8e8e7e7e7e6e6e6e5e5e5e4e4e4e3e3e3e2e2e2e1e1e1e0e0e0dfdfdfdedededddddddcdcdc"
+        "dbdbdbdadadad9d9d9d8d8d8d7d7d7d6d6d6d5d5d5d4d4d4d3d3d3d2d2d2d1d1d1d0d0d0cfcfcfcecececdcdcdcccccccbcbcbcacaca"
+        "c9c9c9c8c8c8c7c7c7c6c6c6c5c5c5c4c4c4c3c3c3c2c2c2c1c1c1c0c0c0bfbfbfbebebebdbdbdbcbcbcbbbbbbbababab9b9b9b8b8b8"
+        "b7b7b7b6b6b6b5b5b5b4b4b4b3b3b3b2b2b2b1b1b1b0b0b0afafafaeaeaeadadadacacacabababaaaaaaa9a9a9a8a8a8a7a7a7a6a6a6"
+        "a5a5a5a4a4a4a3a3a3a2a2a2a1a1a1a0a0a09f9f9f9e9e9e9d9d9d9c9c9c9b9b9b9a9a9a999999989898979797969696959595949494"
+        "9393939292929191919090908f8f8f8e8e8e8d8d8d8c8c8c8b8b8b8a8a8a898989888888878787868686858585848484838383828282"
+        "8181818080807f7f7f7e7e7e7d7d7d7c7c7c7b7b7b7a7a7a797979787878777777767676757575747474737373727272717171707070"
+        "6f6f6f6e6e6e6d6d6d6c6c6c6b6b6b6a6a6a6969696868686767676666666565656464646363636262626161616060605f5f5f5e5e5e"
+        "5d5d5d5c5c5c5b5b5b5a5a5a5959595858585757575656565555555454545353535252525151515050504f4f4f4e4e4e4d4d4d4c4c4c"
+        "4b4b4b4a4a4a4949494848484747474646464545454444444343434242424141414040403f3f3f3e3e3e3d3d3d3c3c3c3b3b3b3a3a3a"
+        "3939393838383737373636363535353434343333333232323131313030302f2f2f2e2e2e2d2d2d2c2c2c2b2b2b2a2a2a292929282828"
+        "2727272626262525252424242323232222222121212020201f1f1f1e1e1e1d1d1d1c1c1c1b1b1b1a1a1a191919181818171717161616"
+        "1515151414141313131212121111111010100f0f0f0e0e0e0d0d0d0c0c0c0b0b0b0a0a0a090909080808070707060606050505040404"
+        "030303020202010101000000"
+    ),
+    "bone": (
+        "00000001010102020203030404030504040605050706060907070a08080b09090c0a0a0d0a0a0f0b0b100c0c110d0d120e0e130f0f15"
+        "10101611111712111812121a13131b14141c15151d16161e1717201818211818221919231a1a251b1b261c1c271d1d281e1e291f1f2b"
+        "201f2c20202d21212e22222f2323312424322525332626342626362727372828382929392a2a3a2b2b3c2c2c3d2d2d3e2e2d3f2e2e41"
+        "2f2f4230304331314432324533334734344834344935354a36364b37374d38384e39394f3a3a503b3b523c3b533c3c543d3d553e3e56"
+        "3f3f5840405941415a42425b42425d43435e44445f4545604646614747634848644949654a49664a4a674b4b694c4c6a4d4d6b4e4e6c"
+        "4f4f6e50506f505070515171525372535473545574555675565776575976575a77585b78595c795a5d7a5b5f7b5c607c5d617d5e627d"
+        "5e637e5f657f606680616781626882636983646b84656c84666d85666e86676f876871886972896a738a6b748b6c758b6c778c6d788d"
+        "6e798e6f7a8f707b90717d91727e92737f927380937481947583957684967785977886987987997a89997a8a9a7b8b9b7c8c9c7d8d9d"
+        "7e8f9e7f909f8091a08192a08194a18295a28396a38497a48598a5869aa6879ba7889ca7889da8899ea98aa0aa8ba1ab8ca2ac8da3ad"
+        "8ea4ae8fa6ae8fa7af90a8b091a9b192aab293acb394adb495aeb596afb596b0b697b2b798b3b899b4b99ab5ba9bb6bb9cb8bc9db9bc"
+        "9dbabd9ebbbe9fbcbfa0bec0a1bfc1a2c0c2a3c1c3a4c2c3a4c4c4a5c5c5a6c6c6a7c7c7a9c8c8aac9c9accacaadcacaaecbcbb0cccc"
+        "b1cdcdb2ceceb4cfcfb5d0d0b7d1d1b8d2d1b9d2d2bbd3d3bcd4d4bdd5d5bfd6d6c0d7d7c1d8d8c3d8d8c4d9d9c6dadac7dbdbc8dcdc"
+        "caddddcbdedeccdfdfcee0dfcfe0e0d1e1e1d2e2e2d3e3e3d5e4e4d6e5e5d7e6e6d9e6e6dae7e7dbe8e8dde9e9deeaeae0ebebe1ecec"
+        "e2edede4eeede5eeeee6efefe8f0f0e9f1f1eaf2f2ecf3f3edf4f4eff4f4f0f5f5f1f6f6f3f7f7f4f8f8f5f9f9f7fafaf8fbfbfafcfb"
+        "fbfcfcfcfdfdfefefeffffff"
+    ),
+    "bone_r": (
+        "fffffffefefefcfdfdfbfcfcfafcfbf8fbfbf7fafaf5f9f9f4f8f8f3f7f7f1f6f6f0f5f5eff4f4edf4f4ecf3f3eaf2f2e9f1f1e8f0f0"
+        "e6efefe5eeeee4eeede2edede1ecece0ebebdeeaeadde9e9dbe8e8dae7e7d9e6e6d7e6e6d6e5e5d5e4e4d3e3e3d2e2e2d1e1e1cfe0e0"
+        "cee0dfccdfdfcbdedecaddddc8dcdcc7dbdbc6dadac4d9d9c3d8d8c1d8d8c0d7d7bfd6d6bdd5d5bcd4d4bbd3d3b9d2d2b8d2d1b7d1d1"
+        "b5d0d0b4cfcfb2ceceb1cdcdb0ccccaecbcbadcacaaccacaaac9c9a9c8c8a7c7c7a6c6c6a5c5c5a4c4c4a4c2c3a3c1c3a2c0c2a1bfc1"
+        "a0bec09fbcbf9ebbbe9dbabd9db9bc9cb8bc9bb6bb9ab5ba99b4b998b3b897b2b796b0b696afb595aeb594adb493acb392aab291a9b1"
+        "90a8b090a7af8fa6ae8ea4ae8da3ad8ca2ac8ba1ab8aa0aa899ea9889da8889ca7879ba7869aa68598a58497a48396a38295a28294a1"
+        "8192a08091a07f909f7e8f9e7d8d9d7c8c9c7b8b9b7a8a9a7a8999798799788698778597768496758395748194738093737f92727e92"
+        "717d91707b906f7a8f6e798e6d788d6c778c6c758b6b748b6a738a697289687188676f87666e86666d85656c84646b84636983626882"
+        "6167816066805f657f5e637e5e627d5d617d5c607c5b5f7b5a5d7a595c79585b78575a77575976565776555675545574535473525372"
+        "51517150507050506f4f4f6e4e4e6c4d4d6b4c4c6a4b4b694a4a6749496649496548486447476346466145456044445f43435e42425d"
+        "42425b41415a4040593f3f583e3e563d3d553c3c543b3b533b3b523a3a5039394f38384e37374d36364b35354a343449343448333347"
+        "3232453131443030432f2f422e2e412d2d3f2d2d3e2c2c3d2b2b3c2a2a3a292939282838272737272636262634252533242432232331"
+        "22222f21212e20202d201f2c1f1f2b1e1e291d1d281c1c271b1b261a1a2519192318182218182117172016161e15151d14141c13131b"
+        "12121a1111181111171010160f0f150e0e130d0d120c0c110b0b100a0a0f0a0a0d09090c08080b07070a060609050507040406030305"
+        "030304020202010101000000"
+    ),
+    "hot": (
+        "0b00000d00001000001200001500001800001a00001d00002000002200002500002700002a00002d00002f0000320000350000370000"
+        "3a00003c00003f00004200004400004700004a00004c00004f00005100005400005700005900005c00005f0000610000640000660000"
+        "6900006c00006e00007100007400007600007900007b00007e00008100008300008600008900008b00008e0000900000930000960000"
+        "9800009b00009e0000a00000a30000a50000a80000ab0000ad0000b00000b30000b50000b80000ba0000bd0000c00000c20000c50000"
+        "c80000ca0000cd0000cf0000d20000d50000d70000da0000dd0000df0000e20000e40000e70000ea0000ec0000ef0000f20000f40000"
+        "f70000f90000fc0000ff0000ff0200ff0500ff0800ff0a00ff0d00ff1000ff1200ff1500ff1700ff1a00ff1d00ff1f00ff2200ff2500"
+        "ff2700ff2a00ff2c00ff2f00ff3200ff3400ff3700ff3a00ff3c00ff3f00ff4100ff4400ff4700ff4900ff4c00ff4f00ff5100ff5400"
+        "ff5600ff5900ff5c00ff5e00ff6100ff6400ff6600ff6900ff6b00ff6e00ff7100ff7300ff7600ff7900ff7b00ff7e00ff8000ff8300"
+        "ff8600ff8800ff8b00ff8e00ff9000ff9300ff9500ff9800ff9b00ff9d00ffa000ffa200ffa500ffa800ffaa00ffad00ffb000ffb200"
+        "ffb500ffb700ffba00ffbd00ffbf00ffc200ffc500ffc700ffca00ffcc00ffcf00ffd200ffd400ffd700ffda00ffdc00ffdf00ffe100"
+        "ffe400ffe700ffe900ffec00ffef00fff100fff400fff600fff900fffc00fffe00ffff03ffff07ffff0bffff0fffff13ffff17ffff1b"
+        "ffff1fffff22ffff26ffff2affff2effff32ffff36ffff3affff3effff42ffff46ffff4affff4effff52ffff56ffff5affff5effff61"
+        "ffff65ffff69ffff6dffff71ffff75ffff79ffff7dffff81ffff85ffff89ffff8dffff91ffff95ffff99ffff9dffffa0ffffa4ffffa8"
+        "ffffacffffb0ffffb4ffffb8ffffbcffffc0ffffc4ffffc8ffffccffffd0ffffd4ffffd8ffffdcffffdfffffe3ffffe7ffffebffffef"
+        "fffff3fffff7fffffbffffff"
+    ),
+    "afmhot": (
+        "0000000200000400000600000800000a00000c00000e00001000001200001400001600001800001a00001c00001e0000200000220000"
+        "2400002600002800002a00002c00002e00003000003200003400003600003800003a00003c00003e0000400000420000440000460000"
+        "4800004a00004c00004e00005000005200005400005600005800005a00005c00005e00006000006200006400006600006800006a0000"
+        "6c00006e00007000007200007400007600007800007a00007c00007e00008000008202008404008607008808008a0a008c0d008e0f00"
+        "9010009212009414009617009818009a1a009c1d009e1f00a02000a22200a42400a62700a82800aa2a00ac2d00ae2f00b03000b23200"
+        "b43400b63700b83800ba3a00bc3d00be3f00c04000c24200c44400c64600c84800ca4a00cc4d00ce4e00d05000d25200d45400d65600"
+        "d85800da5a00dc5d00de5e00e06000e26200e46400e66600e86800ea6a00ec6d00ee6e00f07000f27200f47400f67600f87800fa7a00"
+        "fc7d00fe7e00ff8001ff8203ff8405ff8607ff8809ff8b0bff8c0dff8e0fff9011ff9213ff9415ff9617ff9919ff9b1bff9c1dff9e1f"
+        "ffa021ffa223ffa425ffa627ffa829ffab2bffac2dffae2fffb031ffb233ffb435ffb637ffb939ffbb3bffbc3dffbe3fffc041ffc243"
+        "ffc445ffc647ffc849ffcb4bffcc4dffce4fffd051ffd253ffd455ffd657ffd959ffdb5bffdc5dffde5fffe061ffe263ffe465ffe667"
+        "ffe869ffeb6bffec6dffee6ffff071fff273fff475fff677fff979fffb7bfffc7dfffe7fffff81ffff83ffff85ffff87ffff89ffff8b"
+        "ffff8dffff8fffff91ffff93ffff95ffff97ffff99ffff9bffff9dffff9fffffa1ffffa3ffffa5ffffa7ffffa9ffffabffffadffffaf"
+        "ffffb1ffffb3ffffb5ffffb7ffffb9ffffbbffffbdffffbfffffc1ffffc3ffffc5ffffc7ffffc9ffffcbffffcdffffcfffffd1ffffd3"
+        "ffffd5ffffd7ffffd9ffffdbffffddffffdfffffe1ffffe3ffffe5ffffe7ffffe9ffffebffffedffffeffffff1fffff3fffff5fffff7"
+        "fffff9fffffbfffffdffffff"
+    ),
+    "afmhot_r": (
+        "fffffffffffdfffffbfffff9fffff7fffff5fffff3fffff1ffffefffffedffffebffffe9ffffe7ffffe5ffffe3ffffe1ffffdfffffdd"
+        "ffffdbffffd9ffffd7ffffd5ffffd3ffffd1ffffcfffffcdffffcbffffc9ffffc7ffffc5ffffc3ffffc1ffffbfffffbdffffbbffffb9"
+        "ffffb7ffffb5ffffb3ffffb1ffffafffffadffffabffffa9ffffa7ffffa5ffffa3ffffa1ffff9fffff9dffff9bffff99ffff97ffff95"
+        "ffff93ffff91ffff8fffff8dffff8bffff89ffff87ffff85ffff83ffff81fffe7ffffc7dfffb7bfff979fff777fff575fff273fff071"
+        "ffee6fffec6dffeb6bffe869ffe667ffe465ffe263ffe061ffde5fffdc5dffdb5bffd959ffd757ffd555ffd253ffd051ffce4fffcc4d"
+        "ffcb4bffc849ffc647ffc445ffc243ffc041ffbe3fffbc3dffbb3bffb939ffb737ffb535ffb233ffb031ffae2fffac2dffab2bffa829"
+        "ffa627ffa425ffa223ffa021ff9e1fff9c1dff9b1bff9919ff9717ff9515ff9213ff9011ff8e0fff8c0dff8b0bff8809ff8607ff8405"
+        "ff8203ff8001fe7e00fc7d00fa7b00f87900f67700f47400f27200f07000ee6e00ec6d00ea6b00e86900e66600e46400e26200e06000"
+        "de5e00dc5d00da5b00d85900d65700d45400d25200d05000ce4e00cc4d00ca4b00c84900c64600c44400c24200c04000be3f00bc3d00"
+        "ba3b00b83900b63700b43400b23200b03000ae2f00ac2d00aa2b00a82900a62600a42400a22200a020009e1f009c1d009a1b00981900"
+        "9617009414009212009010008e0f008c0d008a0b008809008606008404008202008000007e00007c00007a0000780000760000740000"
+        "7200007000006e00006c00006a00006800006600006400006200006000005e00005c00005a0000580000560000540000520000500000"
+        "4e00004c00004a00004800004600004400004200004000003e00003c00003a00003800003600003400003200003000002e00002c0000"
+        "2a00002800002600002400002200002000001e00001c00001a00001800001600001400001200001000000e00000c00000a0000080000"
+        "060000040000020000000000"
+    ),
+    "Blues": (
+        "f7fbfff6fafff5fafef5f9fef4f9fef3f8fef2f8fdf2f7fdf1f7fdf0f6fdeff6fceef5fceef5fcedf4fcecf4fbebf3fbeaf3fbeaf2fb"
+        "e9f2fae8f1fae7f1fae7f0fae6f0f9e5eff9e4eff9e3eef9e3eef8e2edf8e1edf8e0ecf8dfecf7dfebf7deebf7ddeaf7dceaf6dce9f6"
+        "dbe9f6dae8f6d9e8f5d9e7f5d8e7f5d7e6f5d6e6f4d6e5f4d5e5f4d4e4f4d3e4f3d3e3f3d2e3f3d1e2f3d0e2f2d0e1f2cfe1f2cee0f2"
+        "cde0f1cddff1ccdff1cbdef1cadef0caddf0c9ddf0c8dcf0c7dcefc7dbefc6dbefc4daeec3daeec2d9eec1d9edbfd8edbed8ecbdd7ec"
+        "bcd7ebbad6ebb9d6eab8d5eab7d4eab5d4e9b4d3e9b3d3e8b2d2e8b0d2e7afd1e7aed1e7add0e6abd0e6aacfe5a9cfe5a8cee4a6cee4"
+        "a5cde3a4cce3a3cce3a1cbe2a0cbe29fcae19dcae19cc9e19ac8e099c7e097c6df95c5df94c4df92c4de91c3de8fc2de8dc1dd8cc0dd"
+        "8abfdd89bedc87bddc85bcdc84bcdb82bbdb81badb7fb9da7db8da7cb7da7ab6d979b5d977b5d975b4d874b3d872b2d871b1d76fb0d7"
+        "6dafd76caed66aaed669add568acd566abd465aad464a9d363a8d361a7d260a7d25fa6d15da5d15ca4d05ba3d05aa2cf58a1cf57a0ce"
+        "56a0ce549fcd539ecd529dcc519ccc4f9bcb4e9acb4d99ca4b98ca4a98c94997c94896c84695c84594c74493c74292c64191c64090c5"
+        "3f8fc53e8ec43d8dc43c8cc33b8bc23a8ac23989c13888c13787c03686c03585bf3484bf3383be3282be3181bd3080bd2f7fbc2e7ebc"
+        "2d7dbb2c7cba2b7bba2a7ab92979b92777b82676b82575b72474b72373b62272b62171b52070b4206fb41f6eb31e6db21d6cb11c6bb0"
+        "1c6ab01b69af1a68ae1967ad1966ad1865ac1764ab1663aa1562a91561a91460a8135fa7125ea6125da6115ca5105ba40f5aa30e59a2"
+        "0e58a20d57a10c56a00b559f0a549e0a539e09529d08519c08509b084f99084e98084d96084c95084b93084a9108499008488e08478d"
+        "08468b08458a084488084387084285084184084082083e81083d7f083c7d083b7c083a7a083979083877083776083674083573083471"
+        "08337008326e08316d08306b"
+    ),
+    "Reds": (
+        "fff5f0fff4effff4eefff3edfff2ecfff2ebfff1eafff0e9fff0e8ffefe8ffeee7ffeee6ffede5ffece4ffece3ffebe2feeae1feeae0"
+        "fee9dffee8defee8ddfee7dcfee7dbfee6dafee5d9fee5d8fee4d8fee3d7fee3d6fee2d5fee1d4fee1d3fee0d2fedfd0fedecffedccd"
+        "fedbccfedacafed9c9fed8c7fdd7c6fdd5c4fdd4c2fdd3c1fdd2bffdd1befdd0bcfdcebbfdcdb9fdccb8fdcbb6fdcab5fdc9b3fdc7b2"
+        "fdc6b0fdc5aefcc4adfcc3abfcc2aafcc1a8fcbfa7fcbea5fcbda4fcbca2fcbba1fcb99ffcb89efcb79cfcb69bfcb499fcb398fcb296"
+        "fcb095fcaf93fcae92fcad90fcab8ffcaa8dfca98cfca78bfca689fca588fca486fca285fca183fca082fc9e80fc9d7ffc9c7dfc9b7c"
+        "fc997afc9879fc9777fc9576fc9474fc9373fc9272fc9070fc8f6ffc8e6efc8d6dfc8b6bfc8a6afc8969fc8767fc8666fc8565fc8464"
+        "fc8262fc8161fc8060fc7f5ffb7d5dfb7c5cfb7b5bfb7a5afb7858fb7757fb7656fb7555fb7353fb7252fb7151fb7050fb6e4efb6d4d"
+        "fb6c4cfb6b4bfb694afa6849fa6648fa6547f96346f96245f96044f85f43f85d42f75c41f75b40f7593ff6583ef6563df6553cf5533b"
+        "f5523af4503af44f39f44d38f34c37f34a36f34935f24734f24633f14432f14331f14130f0402ff03f2ef03d2def3c2cee3a2ced392b"
+        "ec382beb372aea362ae93529e83429e63328e53228e43027e32f27e22e27e12d26e02c26de2b25dd2a25dc2924db2824da2723d92523"
+        "d82422d72322d52221d42121d32020d21f20d11e1fd01d1fcf1c1fce1a1ecc191ecb181dca181dc9181dc8171cc7171cc5171cc4161c"
+        "c3161bc2161bc1161bbf151bbe151abd151abc141abb141ab91419b81419b71319b61319b51318b31218b21218b11218b01217af1117"
+        "ad1117ac1117ab1016aa1016a91016a81016a60f15a50f15a30f15a10e159f0e149d0d149c0d149a0c14980c13960b13940b13920a13"
+        "900a128e09128c09128a08128808118608118407118207118006107e06107c05107a051079040f77040f75030f73030f71020e6f020e"
+        "6d010e6b010e69000d67000d"
+    ),
+    "Greens": (
+        "f7fcf5f6fcf4f6fcf4f5fbf3f5fbf2f4fbf2f4fbf1f3faf0f2faf0f2faeff1faeef1faeef0f9edf0f9eceff9eceff9ebeef8eaedf8ea"
+        "edf8e9ecf8e8ecf8e8ebf7e7ebf7e7eaf7e6e9f7e5e9f7e5e8f6e4e8f6e3e7f6e3e7f6e2e6f5e1e5f5e1e5f5e0e4f5dfe3f4dee2f4dd"
+        "e1f3dce0f3dbdff3dadef2d9ddf2d8dcf2d7dbf1d6dbf1d5daf0d4d9f0d3d8f0d2d7efd1d6efd0d5efcfd4eeced3eecdd2edccd1edcb"
+        "d0edcacfecc9ceecc8cdecc7ccebc6cbebc5cbeac4caeac3c9eac2c8e9c1c7e9c0c6e8bfc4e8bdc3e7bcc2e7bbc1e6bac0e6b9bee5b8"
+        "bde5b6bce4b5bbe4b4bae3b3b8e3b2b7e2b1b6e2afb5e1aeb4e1adb2e0acb1e0abb0dfaaafdfa8aedea7acdea6abdda5aadda4a9dca3"
+        "a8dca2a7dba0a5db9fa4da9ea3da9da2d99ca0d99b9fd8999ed7989cd7979bd69699d59598d59497d49295d39194d39092d28f91d28e"
+        "90d18d8ed08b8dd08a8bcf898ace8888ce8787cd8686cc8584cc8383cb8281ca8180ca807fc97f7dc87e7cc87c7ac77b79c67a78c679"
+        "76c57875c47773c47672c37570c2746ec1736dc0726bc0726abf7168be7066bd6f65bd6f63bc6e62bb6d60ba6c5eb96b5db96b5bb86a"
+        "5ab76958b66856b56755b56753b46652b36550b2644eb2644db1634bb0624aaf6148ae6046ae6045ad5f43ac5e42ab5d40aa5d3fa95c"
+        "3fa85b3ea75a3da65a3ca5593ba4583aa35739a25738a15637a055369f54359e53349d53339c52329b51319a503099502f984f2f974e"
+        "2e964d2d954d2c944c2b934b2a924a29914a289049278f48268e47258d47248c46238b45228a442189442088431f87421e87411d8640"
+        "1c85401a843f19833e18823d17813d16803c157f3b147e3a137d39127c39117b38107a370e79360d78360c77350b77340a7633097532"
+        "08743207733106723005712f03702e026f2e016e2d006d2c006c2c006b2b00692a00682a006729006529006428006328006227006027"
+        "005f26005e26005c25005b25005a24005924005723005622005522005321005221005120005020004e1f004d1f004c1e004a1e00491d"
+        "00481d00471c00451c00441b"
+    ),
+    "Purples": (
+        "fcfbfdfcfbfdfbfafcfbfafcfaf9fcfaf9fcfaf8fbf9f8fbf9f7fbf8f7fbf8f7faf8f6faf7f6faf7f5faf6f5f9f6f4f9f5f4f9f5f4f9"
+        "f5f3f8f4f3f8f4f2f8f3f2f8f3f1f7f3f1f7f2f0f7f2f0f7f1f0f6f1eff6f1eff6f0eef6f0eef5efedf5efedf5eeecf5eeecf4edebf4"
+        "ecebf4eceaf3ebe9f3eae9f3eae8f2e9e8f2e8e7f2e8e6f2e7e6f1e6e5f1e6e5f1e5e4f0e4e3f0e4e3f0e3e2efe2e2efe2e1efe1e0ee"
+        "e0e0eee0dfeedfdfeddedeeddeddedddddecdcdcecdcdcecdbdbecdadaebdadaebd9d9ead8d8ead7d7e9d6d6e9d5d5e9d4d4e8d3d3e8"
+        "d2d2e7d1d2e7d0d1e6cfd0e6cecfe5cecee5cdcde4cccce4cbcbe3cacae3c9c9e2c8c8e2c7c8e1c6c7e1c5c6e1c4c5e0c3c4e0c2c3df"
+        "c1c2dfc0c1debfc0debebfddbebeddbdbedcbcbddcbbbbdbbabadbb9b9dab8b8d9b7b7d9b6b6d8b5b5d7b4b4d7b3b3d6b2b2d5b1b1d5"
+        "b0afd4afaed4aeadd3aeacd2adabd2acaad1aba9d0aaa8d0a9a7cfa8a6cfa7a4cea6a3cda5a2cda4a1cca3a0cba29fcba19ecaa09dca"
+        "9f9cc99e9bc89e9ac89d99c79c98c79b97c69a96c69995c69894c59793c59692c49591c49490c39390c3928fc3918ec2908dc28f8cc1"
+        "8e8bc18e8ac08d89c08c88bf8b87bf8a86bf8986be8885be8784bd8683bd8582bc8481bc8380bb827fbb817ebb807dba807cba7f7bb9"
+        "7e79b87d78b77d77b77c75b67b74b57b72b47a71b47970b3796eb2786db2776cb1776ab07669af7567af7566ae7465ad7363ad7262ac"
+        "7261ab715faa705eaa705ca96f5ba86e5aa86e58a76d57a66c55a56c54a56b53a46a51a36950a3694fa2684da1674ca1674ba066499f"
+        "65489f65479e64459e63449d63439c62429c61409b613f9a603e9a5f3c995e3b985e3a985d38975c37975c36965b34955a33955a3294"
+        "593093582f93582e92572c92562b91552a9055289054278f53268f53258e52238d51228d51218c50208c4f1f8b4f1d8b4e1c8a4d1b89"
+        "4d1a894c18884c17884b16874a15874a1486491285481185481084470f84460d83460c83450b82440a8244098143078042068042057f"
+        "41047f40027e40017e3f007d"
+    ),
+    "Oranges": (
+        "fff5ebfff5eafff4e9fff4e8fff3e7fff3e6fff2e6fff2e5fff1e4fff1e3fff0e2fff0e1ffefe0ffefdfffeedeffeeddfeeddcfeeddc"
+        "feeddbfeecdafeecd9feebd8feebd7feead6feead5fee9d4fee9d3fee8d2fee8d2fee7d1fee7d0fee6cffee6cefee5ccfee5cbfee4ca"
+        "fee3c8fee2c7fee2c6fee1c4fee0c3fee0c1fedfc0fedebffedebdfeddbcfedcbbfedcb9fddbb8fddab6fdd9b5fdd9b4fdd8b2fdd7b1"
+        "fdd7affdd6aefdd5adfdd5abfdd4aafdd3a9fdd3a7fdd2a6fdd1a4fdd1a3fdd0a2fdcfa0fdce9efdcd9cfdcb9bfdca99fdc997fdc895"
+        "fdc794fdc692fdc590fdc48ffdc38dfdc28bfdc189fdc088fdbf86fdbe84fdbd83fdbb81fdba7ffdb97dfdb87cfdb77afdb678fdb576"
+        "fdb475fdb373fdb271fdb170fdb06efdaf6cfdae6afdad69fdac67fdab66fda965fda863fda762fda660fda55ffda45dfda35cfda25a"
+        "fda159fda057fd9f56fd9e54fd9d53fd9c51fd9b50fd9a4efd994dfd984bfd974afd9649fd9547fd9446fd9344fd9243fd9141fd9040"
+        "fd8f3efd8e3dfd8c3bfc8b3afc8a39fc8937fb8836fb8735fb8634fa8532fa8331f98230f9812ef9802df87f2cf87e2bf87d29f77b28"
+        "f77a27f67925f67824f67723f57622f57520f5741ff4721ef4711cf3701bf36f1af36e19f26d17f26c16f26b15f16913f16813f06712"
+        "ef6612ee6511ee6410ed6310ec620feb610feb600eea5f0ee95e0de85d0ce75c0ce75b0be65a0be5590ae4580ae45709e35608e25508"
+        "e15407e15307e05206df5106de5005de4e05dd4d04dc4c03db4b03db4a02da4902d94801d84801d64701d54601d34601d14501d04501"
+        "ce4401cd4401cb4302c94202c84202c64102c54102c34002c14002c03f02be3f02bd3e02bb3d02b93d02b83c02b63c02b53b02b33b02"
+        "b13a03b03903ae3903ad3803ab3803a93703a83703a63603a53603a43503a23503a13403a034039f33039e33039c32039b32039a3103"
+        "993103973003963003952f03942f03932f03912e04902e048f2d048e2d048c2c048b2c048a2b04892b04882a04862a04852904842904"
+        "8328048128048027047f2704"
+    ),
+    "YlOrRd": (
+        "ffffccfffecbfffec9fffdc8fffdc6fffcc5fffcc4fffbc2fffac1fffac0fff9befff9bdfff8bbfff8bafff7b9fff7b7fff6b6fff5b5"
+        "fff5b3fff4b2fff4b0fff3affff3aefff2acfff1abfff1a9fff0a8fff0a7ffefa5ffefa4ffeea3ffeda1ffeda0ffec9fffec9dffeb9c"
+        "ffea9bffea99ffe998ffe997ffe895ffe794ffe793ffe691ffe590ffe58fffe48dffe48cfee38bfee289fee288fee187fee085fee084"
+        "fedf83fede82fede80fedd7ffedd7efedc7cfedb7bfedb7afeda78fed977fed976fed774fed673fed572fed470fed36ffed16efed06c"
+        "fecf6bfece6afecc68fecb67feca66fec965fec863fec662fec561fec45ffec35efec15dfec05bfebf5afebe59febd57febb56feba55"
+        "feb953feb852feb651feb54ffeb44efeb34dfeb24cfeb04bfeaf4bfeae4afead4afeac49feab49fea948fea848fea747fea647fea546"
+        "fea446fea245fea145fea044fd9f44fd9e43fd9d43fd9c42fd9a42fd9941fd9841fd9740fd9640fd953ffd933ffd923efd913efd903d"
+        "fd8f3dfd8e3cfd8c3cfd8a3bfd883bfd863afd8439fd8239fd8038fd7e38fd7c37fd7a37fd7836fd7636fd7435fd7234fd7034fd6e33"
+        "fc6c33fc6a32fc6832fc6631fc6430fc6330fc612ffc5f2ffc5d2efc5b2efc592dfc572cfc552cfc532bfc512bfc4f2afc4d2afb4b29"
+        "fa4a29f94828f84628f84528f74327f64227f54026f43e26f43d25f33b25f23924f13824f13624f03523ef3323ee3122ed3022ed2e21"
+        "ec2c21eb2b21ea2920e92720e9261fe8241fe7231ee6211ee61f1de51e1de41c1de31a1ce2191ce1191de0181ddf171ddd161ddc151e"
+        "db141eda141ed9131fd7121fd6111fd51020d41020d30f20d10e21d00d21cf0c21ce0c22cd0b22cb0a22ca0923c90823c80723c70723"
+        "c50624c40524c30424c20325c10325c00225be0126bd0026bb0026b90026b70026b60026b40026b20026b00026ae0026ac0026aa0026"
+        "a80026a60026a40026a20026a100269f00269d00269b00269900269700269500269300269100268f00268d00268b00268a0026880026"
+        "860026840026820026800026"
+    ),
+    "YlGnBu": (
+        "ffffd9feffd8feffd6fdfed5fdfed4fcfed3fcfed1fbfdd0fafdcffafdcef9fdccf9fdcbf8fccaf8fcc9f7fcc7f7fcc6f6fbc5f5fbc4"
+        "f5fbc2f4fbc1f4fbc0f3fabff3fabdf2fabcf1fabbf1fabaf0f9b8f0f9b7eff9b6eff9b5eef8b3edf8b2edf8b1ecf7b1eaf7b1e9f7b1"
+        "e8f6b1e7f6b1e6f5b2e5f5b2e3f4b2e2f4b2e1f3b2e0f3b2dff2b2ddf2b2dcf1b2dbf1b2daf0b3d9f0b3d7efb3d6efb3d5efb3d4eeb3"
+        "d3eeb3d1edb3d0edb3cfecb3ceecb3cdebb4cbebb4caeab4c9eab4c8e9b4c6e9b4c4e8b4c2e7b4c0e6b5bde5b5bbe4b5b9e4b5b7e3b6"
+        "b4e2b6b2e1b6b0e0b6aedfb6abdeb7a9ddb7a7dcb7a5dcb7a2dbb8a0dab89ed9b89cd8b899d7b897d6b995d5b992d5b990d4b98ed3ba"
+        "8cd2ba89d1ba87d0ba85cfba83cebb80cebb7ecdbb7cccbb7acbbc78cbbc76cabc75c9bd73c8bd71c8bd6fc7bd6dc6be6bc6be69c5be"
+        "67c4be65c3bf63c3bf61c2bf5fc1c05dc0c05bc0c059bfc057bec155bec153bdc152bcc250bbc24ebbc24cbac24ab9c348b9c346b8c3"
+        "44b7c442b6c440b5c43fb4c43eb3c43db2c43cb1c33bb0c33aaec339adc337acc336abc335aac334a9c333a7c232a6c231a5c22fa4c2"
+        "2ea3c22da2c22ca1c22b9fc22a9ec1299dc1289cc1269bc1259ac12498c12397c12296c12195c02094c01f93c01d91c01d90c01d8ebf"
+        "1d8dbe1e8bbd1e8abd1e88bc1e86bb1e85ba1e83ba1f82b91f80b81f7eb71f7db61f7bb61f7ab51f78b42076b32075b32073b22072b1"
+        "2070b0206eb0216daf216bae216aad2168ad2166ac2165ab2163aa2262aa2260a9225ea8225da8225ca7225aa62259a62258a52356a4"
+        "2355a42354a32352a32351a22350a1234fa1234da0234c9f234b9f23499e24489d24479d24459c24449c24439b24419a24409a243f99"
+        "243d98243c98253b9725399725389625379525359525349424339223339022328f21318d21308b2030891f2f871e2e851d2e831c2d81"
+        "1b2c801a2b7e192b7c182a7a17297817297616287415277214267013266f12256d11246b1023690f23670e22650d21630d21610c2060"
+        "0b1f5e0a1e5c091e5a081d58"
+    ),
+    "coolwarm": (
+        "3b4cc03c4ec23d50c33e51c53f53c64055c84257c94358cb445acc455cce465ecf485fd14961d24a63d34b64d54c66d64e68d84f69d9"
+        "506bda516ddb536edd5470de5572df5673e05875e15977e35a78e45b7ae55d7ce65e7de75f7fe86180e96282ea6384eb6485ec6687ed"
+        "6788ee688aef6a8bef6b8df06c8ff16e90f26f92f37093f37295f47396f57597f67699f6779af7799cf87a9df87b9ff97da0f97ea1fa"
+        "80a3fa81a4fb82a6fb84a7fc85a8fc86a9fc88abfd89acfd8badfd8caffe8db0fe8fb1fe90b2fe92b4fe93b5fe94b6ff96b7ff97b8ff"
+        "98b9ff9abbff9bbcff9dbdff9ebeff9fbfffa1c0ffa2c1ffa3c2fea5c3fea6c4fea7c5fea9c6fdaac7fdabc8fdadc9fdaec9fcafcafc"
+        "b1cbfcb2ccfbb3cdfbb5cdfab6cefab7cff9b9d0f9bad0f8bbd1f8bcd2f7bed2f6bfd3f6c0d4f5c1d4f4c3d5f4c4d5f3c5d6f2c6d6f1"
+        "c7d7f0c9d7f0cad8efcbd8eeccd9edcdd9eccedaebcfdaead1dae9d2dbe8d3dbe7d4dbe6d5dbe5d6dce4d7dce3d8dce2d9dce1dadce0"
+        "dbdcdedcdddddddcdcdedcdbdfdbd9e0dbd8e1dad6e2dad5e3d9d3e4d9d2e5d8d1e6d7cfe7d7cee8d6cce9d5cbead5c9ead4c8ebd3c6"
+        "ecd3c5edd2c3edd1c2eed0c0efcfbfefcebdf0cdbbf1cdbaf1ccb8f2cbb7f2cab5f2c9b4f3c8b2f3c7b1f4c6aff4c5adf5c4acf5c2aa"
+        "f5c1a9f5c0a7f6bfa6f6bea4f6bda2f7bca1f7ba9ff7b99ef7b89cf7b79bf7b599f7b497f7b396f7b194f7b093f7af91f7ad90f7ac8e"
+        "f7aa8cf7a98bf7a889f7a688f6a586f6a385f6a283f5a081f59f80f59d7ef59c7df49a7bf4987af39778f39577f39475f29274f29072"
+        "f18f71f18d6ff08b6ef08a6cef886bee8669ee8468ed8366ec8165ec7f63eb7d62ea7b60e97a5fe9785de8765ce7745be67259e57058"
+        "e46e56e36c55e36b54e26952e16751e0654fdf634ede614ddd5f4bdc5d4ada5a49d95847d85646d75445d65244d55042d44e41d24b40"
+        "d1493fd0473dcf453ccd423bcc403acb3e38ca3b37c83836c73635c53334c43032c32e31c12b30c0282fbe242ebd1f2dbb1b2cba162b"
+        "b8122ab70d28b50927b40426"
+    ),
+    "RdBu": (
+        "67001f6a011f6d02207003207304217605217906227c07227f0823810823840924870a248a0b258d0c25900d26930e26960f27991027"
+        "9c11279f1228a21328a51429a81529ab162aae172ab1182bb3192cb41c2db61f2eb72230b82531ba2832bb2a34bd2d35be3036bf3338"
+        "c13639c2383ac43b3cc53e3dc6413ec84440c94741cb4942cc4c44ce4f45cf5246d05548d25849d35a4ad55d4cd6604dd7634fd86551"
+        "da6853db6b55dc6e57dd7059de735cdf765ee17860e27b62e37e64e48066e58368e6866ae8896ce98b6eea8e70eb9172ec9374ee9677"
+        "ef9979f09c7bf19e7df2a17ff3a481f4a683f5a886f5aa89f5ac8bf6af8ef6b191f6b394f7b596f7b799f7b99cf8bb9ef8bda1f8bfa4"
+        "f9c2a7f9c4a9f9c6acfac8affacab1fbccb4fbceb7fbd0b9fcd3bcfcd5bffcd7c2fdd9c4fddbc7fddcc9fdddcbfcdecdfcdfcffce0d0"
+        "fce2d2fbe3d4fbe4d6fbe5d8fbe6dafae7dcfae8defae9dffaeae1f9ebe3f9ede5f9eee7f9efe9f9f0ebf8f1edf8f2eff8f3f0f8f4f2"
+        "f7f5f4f7f6f6f6f7f7f5f6f7f3f5f6f2f5f6f0f4f6eff3f5edf2f5ecf2f5eaf1f5e9f0f4e7f0f4e6eff4e4eef4e3edf3e1edf3e0ecf3"
+        "deebf2ddebf2dbeaf2dae9f2d8e9f1d7e8f1d5e7f1d4e6f1d2e6f0d1e5f0cfe4efcce2efcae1eec7e0edc5dfecc2ddecc0dcebbddbea"
+        "bbdaeab8d8e9b6d7e8b3d6e8b1d5e7aed3e6acd2e5a9d1e5a7d0e4a5cee3a2cde3a0cce29dcbe19bc9e098c8e096c7df93c6de90c4dd"
+        "8dc2dc8ac0db87beda84bcd981bad87eb8d77bb6d678b4d575b2d471b0d36eaed26bacd168abd065a9cf62a7ce5fa5cd5ca3cb59a1ca"
+        "569fc9529dc84f9bc74c99c64997c54695c44393c34291c2408fc13f8ec03e8cbf3c8abe3b88be3a87bd3885bc3783bb3681ba3480b9"
+        "337eb8327cb7307ab62f79b52e77b52c75b42b73b32a71b22870b1276eb0266caf246aae2369ad2267ac2065ab1f63a81e61a51d5fa2"
+        "1c5c9f1b5a9c1a589919569618549317529015508d144e8a134c8712498411478110457e0f437b0e41790d3f760c3d730a3b7009386d"
+        "08366a073467063264053061"
+    ),
+    "bwr": (
+        "0000ff0202ff0404ff0606ff0808ff0a0aff0c0cff0e0eff1010ff1212ff1414ff1616ff1818ff1a1aff1c1cff1e1eff2020ff2222ff"
+        "2424ff2626ff2828ff2a2aff2c2cff2e2eff3030ff3232ff3434ff3636ff3838ff3a3aff3c3cff3e3eff4040ff4242ff4444ff4646ff"
+        "4848ff4a4aff4c4cff4e4eff5050ff5252ff5454ff5656ff5858ff5a5aff5c5cff5e5eff6060ff6262ff6464ff6666ff6868ff6a6aff"
+        "6c6cff6e6eff7070ff7272ff7474ff7676ff7878ff7a7aff7c7cff7e7eff8080ff8282ff8484ff8686ff8888ff8a8aff8c8cff8e8eff"
+        "9090ff9292ff9494ff9696ff9898ff9a9aff9c9cff9e9effa0a0ffa2a2ffa4a4ffa6a6ffa8a8ffaaaaffacacffaeaeffb0b0ffb2b2ff"
+        "b4b4ffb6b6ffb8b8ffbabaffbcbcffbebeffc0c0ffc2c2ffc4c4ffc6c6ffc8c8ffcacaffccccffceceffd0d0ffd2d2ffd4d4ffd6d6ff"
+        "d8d8ffdadaffdcdcffdedeffe0e0ffe2e2ffe4e4ffe6e6ffe8e8ffeaeaffececffeeeefff0f0fff2f2fff4f4fff6f6fff8f8fffafaff"
+        "fcfcfffefefffffefefffcfcfffafafff8f8fff6f6fff4f4fff2f2fff0f0ffeeeeffececffeaeaffe8e8ffe6e6ffe4e4ffe2e2ffe0e0"
+        "ffdedeffdcdcffdadaffd8d8ffd6d6ffd4d4ffd2d2ffd0d0ffceceffccccffcacaffc8c8ffc6c6ffc4c4ffc2c2ffc0c0ffbebeffbcbc"
+        "ffbabaffb8b8ffb6b6ffb4b4ffb2b2ffb0b0ffaeaeffacacffaaaaffa8a8ffa6a6ffa4a4ffa2a2ffa0a0ff9e9eff9c9cff9a9aff9898"
+        "ff9696ff9494ff9292ff9090ff8e8eff8c8cff8a8aff8888ff8686ff8484ff8282ff8080ff7e7eff7c7cff7a7aff7878ff7676ff7474"
+        "ff7272ff7070ff6e6eff6c6cff6a6aff6868ff6666ff6464ff6262ff6060ff5e5eff5c5cff5a5aff5858ff5656ff5454ff5252ff5050"
+        "ff4e4eff4c4cff4a4aff4848ff4646ff4444ff4242ff4040ff3e3eff3c3cff3a3aff3838ff3636ff3434ff3232ff3030ff2e2eff2c2c"
+        "ff2a2aff2828ff2626ff2424ff2222ff2020ff1e1eff1c1cff1a1aff1818ff1616ff1414ff1212ff1010ff0e0eff0c0cff0a0aff0808"
+        "ff0606ff0404ff0202ff0000"
+    ),
+    "seismic": (
+        "00004c00004f00005200005500005800005a00005d00006000006300006600006800006b00006e00007100007400007600007900007c"
+        "00007f00008200008400008700008a00008d00009000009200009500009800009b00009e0000a00000a30000a60000a90000ac0000ae"
+        "0000b10000b40000b70000ba0000bc0000bf0000c20000c50000c80000ca0000cd0000d00000d30000d60000d80000db0000de0000e1"
+        "0000e40000e60000e90000ec0000ef0000f20000f40000f70000fa0000fd0101ff0505ff0909ff0d0dff1111ff1515ff1919ff1d1dff"
+        "2121ff2525ff2929ff2d2dff3131ff3535ff3939ff3d3dff4141ff4545ff4949ff4d4dff5151ff5555ff5959ff5d5dff6161ff6565ff"
+        "6969ff6d6dff7171ff7575ff7979ff7d7dff8181ff8585ff8989ff8d8dff9191ff9595ff9999ff9d9dffa1a1ffa5a5ffa9a9ffadadff"
+        "b1b1ffb5b5ffb9b9ffbdbdffc1c1ffc5c5ffc9c9ffcdcdffd1d1ffd5d5ffd9d9ffddddffe1e1ffe5e5ffe9e9ffededfff1f1fff5f5ff"
+        "f9f9fffdfdfffffdfdfff9f9fff5f5fff1f1ffededffe9e9ffe5e5ffe1e1ffddddffd9d9ffd5d5ffd1d1ffcdcdffc9c9ffc5c5ffc1c1"
+        "ffbdbdffb9b9ffb5b5ffb1b1ffadadffa9a9ffa5a5ffa1a1ff9d9dff9999ff9595ff9191ff8d8dff8989ff8585ff8181ff7d7dff7979"
+        "ff7575ff7171ff6d6dff6969ff6565ff6161ff5d5dff5959ff5555ff5151ff4d4dff4949ff4545ff4141ff3d3dff3939ff3535ff3131"
+        "ff2d2dff2929ff2525ff2121ff1d1dff1919ff1515ff1111ff0d0dff0909ff0505ff0101fe0000fc0000fa0000f80000f60000f40000"
+        "f20000f00000ee0000ec0000ea0000e80000e60000e30000e20000e00000de0000dc0000da0000d80000d60000d30000d20000d00000"
+        "ce0000cc0000ca0000c80000c60000c30000c20000c00000be0000bc0000ba0000b80000b60000b30000b20000b00000ae0000ac0000"
+        "aa0000a80000a60000a30000a20000a000009e00009c00009a00009800009600009300009200009000008e00008c00008a0000880000"
+        "860000840000820000800000"
+    ),
+    "seismic_r": (
+        "8000008200008400008600008800008a00008c00008e00009000009200009300009600009800009a00009c00009e0000a00000a20000"
+        "a30000a60000a80000aa0000ac0000ae0000b00000b20000b30000b60000b80000ba0000bc0000be0000c00000c20000c30000c60000"
+        "c80000ca0000cc0000ce0000d00000d20000d30000d60000d80000da0000dc0000de0000e00000e20000e30000e60000e80000ea0000"
+        "ec0000ee0000f00000f20000f30000f60000f80000fa0000fc0000fe0000ff0101ff0505ff0909ff0d0dff1111ff1515ff1919ff1d1d"
+        "ff2121ff2525ff2929ff2d2dff3131ff3535ff3939ff3d3dff4141ff4545ff4949ff4d4dff5151ff5555ff5959ff5d5dff6161ff6565"
+        "ff6969ff6d6dff7171ff7575ff7979ff7d7dff8181ff8585ff8989ff8d8dff9191ff9595ff9999ff9d9dffa1a1ffa5a5ffa9a9ffadad"
+        "ffb1b1ffb5b5ffb9b9ffbdbdffc1c1ffc5c5ffc9c9ffcdcdffd1d1ffd5d5ffd9d9ffddddffe1e1ffe5e5ffe9e9ffededfff1f1fff5f5"
+        "fff9f9fffdfdfdfdfff9f9fff5f5fff1f1ffededffe9e9ffe5e5ffe1e1ffddddffd9d9ffd5d5ffd1d1ffcdcdffc9c9ffc5c5ffc1c1ff"
+        "bdbdffb9b9ffb5b5ffb1b1ffadadffa9a9ffa5a5ffa1a1ff9d9dff9999ff9595ff9191ff8d8dff8989ff8585ff8181ff7d7dff7979ff"
+        "7575ff7171ff6d6dff6969ff6565ff6161ff5d5dff5959ff5555ff5151ff4d4dff4949ff4545ff4141ff3d3dff3939ff3535ff3131ff"
+        "2d2dff2929ff2525ff2121ff1d1dff1919ff1515ff1111ff0d0dff0909ff0505ff0101ff0000fd0000fa0000f70000f40000f20000ef"
+        "0000ec0000e90000e60000e40000e10000de0000db0000d80000d60000d30000d00000cd0000cb0000c80000c50000c20000bf0000bc"
+        "0000ba0000b70000b40000b10000ae0000ac0000a90000a60000a30000a000009e00009b00009800009500009300009000008d00008a"
+        "00008700008400008200007f00007c00007900007700007400007100006e00006b00006800006600006300006000005d00005b000058"
+        "00005500005200004f00004c"
+    ),
+    "Spectral": (
+        "9e0142a00343a20643a40844a70b44a90d45ab0f45ad1246af1446b11747b41947b61b48b81e48ba2049bc2249be254ac1274ac32a4b"
+        "c52c4bc72e4cc9314ccb334dcd364dd0384ed23a4ed43d4fd63f4fd7414ed8434ed9444dda464ddc484cdd4a4cde4c4bdf4e4be1504b"
+        "e2514ae3534ae45549e55749e75948e85b48e95c47ea5e47eb6046ed6246ee6445ef6645f06744f26944f36b43f46d43f47044f57245"
+        "f57547f57748f67a49f67c4af67f4bf7814cf7844ef8864ff88950f88c51f98e52f99153f99355fa9656fa9857fa9b58fb9d59fba05b"
+        "fba35cfca55dfca85efcaa5ffdad60fdaf62fdb163fdb365fdb567fdb768fdb96afdbb6cfdbd6dfdbf6ffdc171fdc372fdc574fdc776"
+        "fec877feca79fecc7bfece7cfed07efed27ffed481fed683fed884feda86fedc88fede89fee08bfee18dfee28ffee491fee593fee695"
+        "fee797fee999feea9bfeeb9dfeec9ffeeda1feefa3fff0a6fff1a8fff2aafff3acfff5aefff6b0fff7b2fff8b4fffab6fffbb8fffcba"
+        "fffdbcfffebeffffbefefebdfdfebbfcfebafbfdb8fafdb7f9fcb5f8fcb4f7fcb2f6fbb0f5fbaff4faadf3faacf2faaaf1f9a9f0f9a7"
+        "eff9a6eef8a4edf8a3ecf7a1ebf7a0eaf79ee9f69de8f69be7f59ae6f598e4f498e1f399dff299ddf19adaf09ad8ef9bd6ee9bd3ed9c"
+        "d1ed9ccfec9dcdeb9dcaea9ec8e99ec6e89fc3e79fc1e6a0bfe5a0bce4a0bae3a1b8e2a1b5e1a2b3e0a2b1dfa3aedea3acdda4aadca4"
+        "a7dba4a4daa4a2d9a49fd8a49cd7a499d6a497d5a494d4a491d3a48fd2a48cd1a489d0a486cfa584cea581cda57ecca57ccaa579c9a5"
+        "76c8a574c7a571c6a56ec5a56bc4a569c3a566c2a564c0a662bda760bba85eb9a95cb7aa5ab4ab58b2ac56b0ad54aead52abae50a9af"
+        "4ea7b04ba4b149a2b247a0b3459eb4439bb54199b63f97b73d95b83b92b93990ba378ebb358bbc3389bd3387bc3585bb3682ba3880b9"
+        "3a7eb83b7cb73d79b63f77b54175b44273b34471b2466eb1486cb0496aaf4b68ae4d65ad4e63ac5061aa525fa9545ca8555aa75758a6"
+        "5956a55b53a45c51a35e4fa2"
+    ),
+    "PiYG": (
+        "8e015290025492035594045797055999065a9b075c9d085e9f095fa10a61a40b63a60c65a80d66aa0e68ac0f6aae106bb1116db3126f"
+        "b51370b71472b91574bb1675bd1777c01879c2197ac41a7cc51d7ec62080c72482c82884c92b86ca2f88cb3289cc368bcd3a8dce3d8f"
+        "cf4191d04493d14895d24c97d34f99d4539bd5579dd65a9fd75ea1d861a2d965a4da69a6db6ca8dc70aadd73acde77aedf79b0df7cb1"
+        "e07eb3e181b5e283b7e286b8e388bae48bbce58dbee590bfe692c1e795c3e897c4e89ac6e99cc8ea9fcaeba1cbeba3cdeca6cfeda8d1"
+        "eeabd2eeadd4efb0d6f0b2d7f1b5d9f1b7daf2b8dbf2badcf3bcddf3bddef4bfdff4c1dff5c2e0f5c4e1f5c6e2f6c7e3f6c9e3f7cbe4"
+        "f7cce5f8cee6f8d0e7f9d1e8f9d3e8fad4e9fad6eafbd8ebfbd9ecfcdbedfcddedfddeeefde0effde1effde2f0fce3f0fce4f0fce5f1"
+        "fce5f1fbe6f1fbe7f2fbe8f2fbe9f2faeaf2faebf3faecf3faedf3f9eef4f9eef4f9eff4f9f0f5f9f1f5f8f2f5f8f3f6f8f4f6f8f5f6"
+        "f7f6f7f7f7f7f7f7f6f6f7f5f5f7f3f5f7f2f4f7f0f3f7eff3f6edf2f6ecf1f6eaf1f6e8f0f6e7eff6e5eff6e4eef6e2edf6e1edf6df"
+        "ecf6deebf6dcebf6dbeaf5d9e9f5d8e9f5d6e8f5d5e7f5d3e7f5d2e6f5d0e4f4cde2f3cae1f3c7dff2c4ddf1c1dbf0bfd9f0bcd8efb9"
+        "d6eeb6d4edb3d2ecb0d0ecadcfebaacdeaa7cbe9a4c9e8a2c7e89fc6e79cc4e699c2e596c0e593bee490bde38dbbe28ab9e187b7e085"
+        "b5df82b2dd7fb0dc7daeda7aacd977a9d874a7d672a5d56fa3d36ca1d26a9ed0679ccf649acd6198cc5f95cb5c93c95991c8578fc654"
+        "8cc5518ac34f88c24c86c04983bf4681bd447fbc417dba407bb93e79b73d77b53c75b43b73b23971b0386faf376dad366bac3469aa33"
+        "67a83266a73164a52f62a32e60a22d5ea02c5c9e2a5a9d29589b285699275498255296245094234e93224c91214b8f21498d20488c20"
+        "468a2045881f43861f42841f40831e3f811e3d7f1e3c7d1d3a7b1d397a1d37781c36761c34741c33721c31711b306f1b2e6d1b2d6b1a"
+        "2b691a2a681a286619276419"
+    ),
+    "jet": (
+        "00008000008400008900008d00009200009600009b00009f0000a40000a80000ad0000b20000b60000bb0000bf0000c40000c80000cd"
+        "0000d10000d60000da0000df0000e30000e80000ed0000f10000f60000fa0000ff0000ff0000ff0000ff0000ff0004ff0008ff000cff"
+        "0010ff0014ff0018ff001cff0020ff0024ff0028ff002cff0030ff0034ff0038ff003cff0040ff0044ff0048ff004cff0050ff0054ff"
+        "0058ff005cff0060ff0064ff0068ff006cff0070ff0074ff0078ff007cff0080ff0084ff0088ff008cff0090ff0094ff0098ff009cff"
+        "00a0ff00a4ff00a8ff00acff00b0ff00b4ff00b8ff00bcff00c0ff00c4ff00c8ff00ccff00d0ff00d4ff00d8ff00dcfe00e0fb00e4f8"
+        "02e8f406ecf109f0ee0cf4eb0ff8e713fce416ffe119ffde1cffdb1fffd723ffd426ffd129ffce2cffca30ffc733ffc436ffc139ffbe"
+        "3cffba40ffb743ffb446ffb149ffad4dffaa50ffa753ffa456ffa05aff9d5dff9a60ff9763ff9466ff906aff8d6dff8a70ff8773ff83"
+        "77ff807aff7d7dff7a80ff7783ff7387ff708aff6d8dff6a90ff6694ff6397ff609aff5d9dff5aa0ff56a4ff53a7ff50aaff4dadff49"
+        "b1ff46b4ff43b7ff40baff3cbeff39c1ff36c4ff33c7ff30caff2cceff29d1ff26d4ff23d7ff1fdbff1cdeff19e1ff16e4ff13e7ff0f"
+        "ebff0ceeff09f1fc06f4f802f8f500fbf100feed00ffea00ffe600ffe200ffde00ffdb00ffd700ffd300ffd000ffcc00ffc800ffc400"
+        "ffc100ffbd00ffb900ffb600ffb200ffae00ffab00ffa700ffa300ff9f00ff9c00ff9800ff9400ff9100ff8d00ff8900ff8600ff8200"
+        "ff7e00ff7a00ff7700ff7300ff6f00ff6c00ff6800ff6400ff6000ff5d00ff5900ff5500ff5200ff4e00ff4a00ff4700ff4300ff3f00"
+        "ff3b00ff3800ff3400ff3000ff2d00ff2900ff2500ff2200ff1e00ff1a00ff1600ff1300fa0f00f60b00f10800ed0400e80000e40000"
+        "df0000da0000d60000d10000cd0000c80000c40000bf0000bb0000b60000b20000ad0000a80000a400009f00009b0000960000920000"
+        "8d0000890000840000800000"
+    ),
+    "jet_r": (
+        "8000008400008900008d00009200009600009b00009f0000a40000a80000ad0000b20000b60000bb0000bf0000c40000c80000cd0000"
+        "d10000d60000da0000df0000e40000e80000ed0400f10800f60b00fa0f00ff1300ff1600ff1a00ff1e00ff2200ff2500ff2900ff2d00"
+        "ff3000ff3400ff3800ff3b00ff3f00ff4300ff4700ff4a00ff4e00ff5200ff5500ff5900ff5d00ff6000ff6400ff6800ff6c00ff6f00"
+        "ff7300ff7700ff7a00ff7e00ff8200ff8600ff8900ff8d00ff9100ff9400ff9800ff9c00ff9f00ffa300ffa700ffab00ffae00ffb200"
+        "ffb600ffb900ffbd00ffc100ffc400ffc800ffcc00ffd000ffd300ffd700ffdb00ffde00ffe200ffe600ffea00feed00fbf100f8f500"
+        "f4f802f1fc06eeff09ebff0ce7ff0fe4ff13e1ff16deff19dbff1cd7ff1fd4ff23d1ff26ceff29caff2cc7ff30c4ff33c1ff36beff39"
+        "baff3cb7ff40b4ff43b1ff46adff49aaff4da7ff50a4ff53a0ff569dff5a9aff5d97ff6094ff6390ff668dff6a8aff6d87ff7083ff73"
+        "80ff777dff7a7aff7d77ff8073ff8370ff876dff8a6aff8d66ff9063ff9460ff975dff9a5aff9d56ffa053ffa450ffa74dffaa49ffad"
+        "46ffb143ffb440ffb73cffba39ffbe36ffc133ffc430ffc72cffca29ffce26ffd123ffd41fffd71cffdb19ffde16ffe113fce40ff8e7"
+        "0cf4eb09f0ee06edf102e8f400e4f800e0fb00dcfe00d8ff00d4ff00d0ff00ccff00c8ff00c4ff00c0ff00bcff00b8ff00b4ff00b0ff"
+        "00adff00a8ff00a4ff00a0ff009cff0098ff0094ff0090ff008cff0088ff0084ff0080ff007dff0078ff0075ff0070ff006dff0068ff"
+        "0065ff0060ff005dff0058ff0055ff0050ff004dff0048ff0045ff0040ff003dff0038ff0035ff0030ff002dff0028ff0025ff0020ff"
+        "001dff0018ff0015ff0010ff000dff0008ff0005ff0000ff0000ff0000ff0000ff0000ff0000fa0000f60000f10000ed0000e80000e4"
+        "0000df0000da0000d60000d10000cd0000c80000c40000bf0000bb0000b60000b20000ad0000a80000a400009f00009b000096000092"
+        "00008d000089000084000080"
+    ),
+    "rainbow": (
+        "8000ff7e03ff7c06ff7a09ff780dff7610ff7413ff7216ff7019ff6e1cff6c1fff6a22fe6826fe6629fe642cfe622ffe6032fe5e35fe"
+        "5c38fd5a3bfd583efd5641fd5444fd5247fc504afc4e4dfc4c50fc4a53fb4856fb4659fb445cfb425ffa4062fa3e65fa3c68f9396bf9"
+        "386df93670f83473f83176f83079f72e7bf72c7ef72981f62884f62686f52489f5218cf4208ef41e91f31c93f31996f31898f2169bf2"
+        "149df111a0f110a2f00ea5ef0ca7ef09a9ee08acee06aeed04b0ed01b3ec00b5eb02b7eb04b9ea07bbea08bee90ac0e80dc2e80fc4e7"
+        "10c6e612c8e614cae517cbe418cde41acfe31dd1e21fd3e120d5e122d6e024d8df27dade28dbde2adddd2ddedc2fe0db30e1da32e3da"
+        "34e4d937e6d838e7d73ae8d63dead53febd540ecd442edd344eed246efd148f1d04af2cf4df3ce4ef3cd50f4cc52f5cb54f6cb56f7ca"
+        "58f8c95af8c85df9c75efac660fac562fbc464fbc366fcc268fcc16afdc06dfdbf6efebe70febc72febb74feba76ffb978ffb87affb7"
+        "7dffb67effb580ffb482ffb384ffb286ffb088ffaf8bfeae8cfead8efeac90feab92fda994fda896fca799fca69bfba59cfba49efaa2"
+        "a0faa1a2f9a0a4f89fa6f89da8f79cabf69bacf59aaef498b0f397b2f396b4f295b6f193b9ef92bbee91bced8fbeec8ec0eb8dc2ea8c"
+        "c4e88ac6e789c8e688cbe486cce385cee184d0e082d2de81d4dd80d6db7ed9da7ddbd87bdcd67aded579e0d377e2d176e4cf74e6cd73"
+        "e8cb72ebca70ecc86feec66df0c46cf2c26bf4c069f6be68f9bb66fbb965fcb763feb562ffb360ffb05fffae5effac5cffa95bffa759"
+        "ffa558ffa256ffa055ff9d53ff9b52ff9850ff964fff934dff914cff8e4aff8c49ff8947ff8646ff8444ff8143ff7e41ff7b40ff793e"
+        "ff763dff733bff703aff6d38ff6b37ff6835ff6533ff6232ff5f30ff5c2fff592dff562cff532aff5029ff4d27ff4a26ff4724ff4422"
+        "ff4121ff3e1fff3b1eff381cff351bff3219ff2f18ff2c16ff2914ff2613ff2211ff1f10ff1c0eff190dff160bff1309ff1008ff0d06"
+        "ff0905ff0603ff0302ff0000"
+    ),
+    "rainbow_r": (
+        "ff0000ff0302ff0603ff0905ff0d06ff1008ff1309ff160bff190dff1c0eff1f10ff2211ff2613ff2914ff2c16ff2f18ff3219ff351b"
+        "ff381cff3b1eff3e1fff4121ff4422ff4724ff4a26ff4d27ff5029ff532aff562cff592dff5c2fff5f30ff6232ff6533ff6835ff6b37"
+        "ff6d38ff703aff733bff763dff793eff7b40ff7e41ff8143ff8444ff8646ff8947ff8c49ff8e4aff914cff934dff964fff9850ff9b52"
+        "ff9d53ffa055ffa256ffa558ffa759ffa95bffac5cffae5effb05fffb360feb562fcb763fbb965f9bb66f7be68f5c069f2c26bf0c46c"
+        "eec66decc86febca70e8cb72e6cd73e4cf74e2d176e0d377ded579dcd67adbd87bd9da7dd7db7ed5dd7fd2de81d0e082cee184cce385"
+        "cbe486c8e688c6e789c4e88ac2ea8cc0eb8dbeec8ebced8fbbee91b9ef92b7f193b5f295b2f396b0f397aef498acf59aabf69ba8f79c"
+        "a6f89da4f89fa2f9a0a0faa19efaa29cfba49bfba599fca697fca795fda892fda990feab8efeac8cfead8bfeae88ffaf86ffb084ffb2"
+        "82ffb380ffb47effb57dffb67bffb779ffb877ffb974feba72febb70febc6efebe6dfdbf6bfdc069fcc166fcc264fbc362fbc460fac5"
+        "5efac65df9c75bf8c859f8c957f7ca54f6cb52f5cb50f4cc4ef3cd4df3ce4bf2cf49f1d046efd144eed242edd340ecd43febd53dead5"
+        "3be8d639e7d737e6d834e4d932e3da30e1da2fe0db2ddedc2bdddd29dbde26dade24d8df22d6e020d5e11fd3e11dd1e21bcfe319cde4"
+        "17cbe414cae512c8e610c6e60fc4e70dc2e80bc0e809bee906bbea04b9ea02b7eb00b5eb01b3ec03b0ed05aeed07acee09a9ee0ca7ef"
+        "0ea5ef10a2f011a0f1139df1159bf21798f21a96f31c93f31e91f3208ef4218cf42389f52586f52784f62981f62c7ef72e7bf73079f7"
+        "3176f83373f83570f8376df93a6bf93c68f93e65fa4062fa425ffa435cfb4559fb4756fb4953fb4c50fc4e4dfc504afc5247fc5344fd"
+        "5541fd573efd5a3bfd5c38fd5e35fe6032fe622ffe632cfe6529fe6726fe6922fe6c1fff6e1cff7019ff7216ff7313ff7510ff770dff"
+        "7a09ff7c06ff7e03ff8000ff"
+    ),
+}
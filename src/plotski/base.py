@@ -6,12 +6,11 @@ import webbrowser
 from collections.abc import Iterable
 
 import numpy as np
-from bokeh.io.export import get_layout_html
 from bokeh.layouts import column, row
 from bokeh.models import Band, BoxAnnotation, ColumnDataSource, Div, Glyph, LabelSet, Span
-from koyo.utilities import get_min_max
 
 from plotski.enums import Position
+from plotski.profiling import profile_phase
 from plotski.utilities import check_source
 
 
@@ -24,6 +23,8 @@ class Plot:
     DATA_KEYS: ty.Tuple[str, ...] = ()
     TOOLS: ty.Tuple[str, ...] = ("pan", "box_zoom", "reset")
     ACTIVE_DRAG: str | None = None
+    # Options which describe the data of particular plot and are therefore not copied by `clone`
+    DATA_OPTIONS: ty.Tuple[str, ...] = ("hover_data", "hover_image", "hover_extent")
 
     # Defaults
     WIDTH = 600
@@ -61,6 +62,9 @@ class Plot:
         kwargs :
             Dictionary containing key:value parameters to prettify Bokeh plots.
         """
+        # constructor arguments are kept so the plot can be used as template for other plots (see `clone`)
+        self._init_kwargs = {"x_axis_label": x_axis_label, "y_axis_label": y_axis_label, "initialize": initialize}
+        self._init_kwargs.update(kwargs)
         self.name = None
         self.output_dir = output_dir
         self.plot_type = plot_type
@@ -79,23 +83,60 @@ class Plot:
         self.metadata = {"x_axis_label": x_axis_label, "y_axis_label": y_axis_label}
 
         self.source = source
-        self.check_data_source()
+        with self._profile("check_data_source"):
+            self.check_data_source()
 
         # initialize options
-        self.initialize_options()
+        with self._profile("initialize_options"):
+            self.initialize_options()
 
         # initialize figure
-        self.figure = self.get_figure()
-        self.plot()
+        with self._profile("get_figure"):
+            self.figure = self.get_figure()
+        with self._profile("plot"):
+            self.plot()
 
         # set plot layout and misc data
         if initialize:
-            self.set_ranges(**kwargs)
-        self.set_hover()
-        self.set_figure_attributes()
-        self.set_options()
-        self.set_figure_dimensions()
-        self.set_layout()
+            with self._profile("set_ranges"):
+                self.set_ranges(**kwargs)
+        with self._profile("set_hover"):
+            self.set_hover()
+        with self._profile("set_options"):
+            self.set_figure_attributes()
+            self.set_options()
+            self.set_figure_dimensions()
+        with self._profile("set_layout"):
+            self.set_layout()
+
+    def clone(self, source: ColumnDataSource, **kwargs) -> "Plot":
+        """Create plot of the same type and with the same options as this plot but showing different data.
+
+        The plot acts as template - the new plot is constructed with the same arguments (e.g. tools, axis labels, size
+        or linked ranges) except for the data source and any options overridden in `kwargs` (e.g. `title`, `x_min`).
+        Options derived from data (e.g. the color mapper of images) are recomputed unless they were provided when
+        the template was created, while hover data of the template (`hover_data`, `hover_image`) is not reused.
+        Cloning is a convenience so the options only have to be specified once - the new plot is constructed from
+        scratch and costs the same as creating it directly.
+
+        Parameters
+        ----------
+        source : ColumnDataSource
+            data source of the new plot, in the format expected by the plot class
+        kwargs :
+            options which should replace those of the template
+
+        Returns
+        -------
+        plot : Plot
+            new plot of the same type as the template
+        """
+        init_kwargs = {key: value for key, value in self._init_kwargs.items() if key not in self.DATA_OPTIONS}
+        return type(self)(self.output_dir, source, **{**init_kwargs, **kwargs})
+
+    def _profile(self, phase: str):
+        """Return context manager which times construction phase when profiling is enabled."""
+        return profile_phase(phase, "plot", self, plot_type=self.plot_type)
 
     def set_figure_dimensions(self):
         """Set figure dimensions."""
@@ -222,6 +263,8 @@ class Plot:
 
     def add_extents(self, x: np.ndarray | None = None, y: np.ndarray | None = None):
         """Add x-axis extents."""
+        from koyo.utilities import get_min_max
+
         if x is not None:
             self._x_extents.append(get_min_max(x))
         if y is not None:
@@ -229,6 +272,8 @@ class Plot:
 
     def get_extents(self, **kwargs):
         """Get x and y-axis extents."""
+        from koyo.utilities import get_min_max
+
         x_min, x_max = get_min_max(self._x_extents)
         x_min, x_max = kwargs.get("x_min", x_min), kwargs.get("x_max", x_max)
         y_min, y_max = get_min_max(self._y_extents)
@@ -246,6 +291,11 @@ class Plot:
         patch = self.figure.patch(*data, **kwargs)
         self.annotations[patch.id] = (data, "Patch")
 
+    def add_multi_polygons(self, source: ColumnDataSource, **kwargs):
+        """Add multiple polygons (each possibly made of several parts with holes) to the plot using single renderer."""
+        polygons = self.figure.multi_polygons(xs="xs", ys="ys", source=source, **kwargs)
+        self.annotations[polygons.id] = (source, "MultiPolygons")
+
     def add_labels(self, source: ColumnDataSource, **kwargs):
         """Add multiple labels to the plot."""
         labels = LabelSet(x="x", y="y", text="text", source=source, **kwargs)
@@ -284,6 +334,8 @@ class Plot:
         if filepath is None:
             filepath = os.path.join(self.output_dir, self.plot_type + ".html")
 
+        from bokeh.io.export import get_layout_html
+
         html_str = get_layout_html(self.layout)
         with open(filepath, "wb") as f_ptr:
             f_ptr.write(html_str.encode("utf-8"))
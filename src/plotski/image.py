@@ -1,11 +1,19 @@
 """Image."""
 
+import typing as ty
+
 import numpy as np
 from bokeh.models import BasicTicker, BoxZoomTool, ColorBar, ColumnDataSource, HoverTool, Range1d
 from bokeh.plotting import figure
 
 from plotski.base import Plot
-from plotski.utilities import calculate_aspect_ratio
+from plotski.utilities import (
+    apply_color_mapper,
+    calculate_aspect_ratio,
+    downsample_image,
+    encode_image,
+    get_sparse_pixels,
+)
 
 
 class PlotImageBase(Plot):
@@ -37,7 +45,7 @@ class PlotImageBase(Plot):
             y_axis_label,
             title=title,
             plot_type=plot_type,
-            initilize=initialize,
+            initialize=initialize,
             **kwargs,
         )
 
@@ -62,20 +70,82 @@ class PlotImageBase(Plot):
         if "cmap" not in self.kwargs:
             self.kwargs["cmap"] = "viridis"
 
-        self.kwargs["palette"], self.kwargs["colormapper"] = convert_colormap_to_mapper(
-            self.source.data["image"][0],
-            self.kwargs["cmap"],
-            z_min=self.kwargs.get("z_min", None),
-            z_max=self.kwargs.get("z_max", None),
-        )
+        # color mapper can be shared between multiple plots, in which case it does not need to be recomputed
+        if "colormapper" not in self.kwargs:
+            self.kwargs["palette"], self.kwargs["colormapper"] = convert_colormap_to_mapper(
+                self.get_intensities(),
+                self.kwargs["cmap"],
+                z_min=self.kwargs.get("z_min", None),
+                z_max=self.kwargs.get("z_max", None),
+                z_percentiles=self.kwargs.get("z_percentiles", None),
+                n_samples=self.kwargs.get("z_samples", 100_000),
+            )
         super().initialize_options()
 
+    @property
+    def image_shape(self) -> ty.Tuple[int, ...]:
+        """Return shape of the image (in pixels)."""
+        return self.source.data["image"][0].shape
+
+    @property
+    def extent(self) -> ty.Tuple[float, float, float, float]:
+        """Return position (x, y) and size (dw, dh) of the image in data coordinates."""
+        src = self.source.data
+        return src["x"][0], src["y"][0], src["dw"][0], src["dh"][0]
+
+    def get_intensities(self) -> np.ndarray:
+        """Return intensity values used to compute the colormap limits."""
+        return self.source.data["image"][0]
+
+    def get_hover_image(self) -> np.ndarray | None:
+        """Return image that should back the hover tool, if it should differ from the displayed image.
+
+        The hover image can be specified directly using the `hover_image` keyword (at any resolution, since it covers
+        the same extent as the displayed image) or derived from the displayed image by averaging `hover_factor` x
+        `hover_factor` blocks and/or casting it to `hover_dtype` (e.g. `np.float32`).
+        """
+        image = self.kwargs.get("hover_image", None)
+        factor = self.kwargs.get("hover_factor", 1)
+        dtype = self.kwargs.get("hover_dtype", None)
+        if image is None and factor == 1 and dtype is None:
+            return None
+        if image is None:
+            image = self.source.data["image"][0]
+        return downsample_image(image, factor, dtype)
+
+    def add_hover_image(self, image: np.ndarray, fields: ty.Dict[str, np.ndarray] | None = None, color_mapper=None):
+        """Add invisible image that is used by the hover tool instead of the displayed image.
+
+        Any additional `fields` must have the same shape as the `image` and can be referenced in the tooltips. The
+        image covers the same extent as the displayed image unless `hover_extent` (x, y, dw, dh) is specified.
+        """
+        x, y, dw, dh = self.kwargs.get("hover_extent", self.extent)
+        data = {"image": [image], "x": [x], "y": [y], "dw": [dw], "dh": [dh]}
+        data.update({key: [value] for key, value in (fields or {}).items()})
+        self.plots["hover"] = self.figure.image(
+            x="x",
+            y="y",
+            dw="dw",
+            dh="dh",
+            image="image",
+            source=ColumnDataSource(data),
+            color_mapper=color_mapper if color_mapper is not None else self.kwargs["colormapper"],
+            global_alpha=0,
+            name="hover",
+        )
+        return self.plots["hover"]
+
     def set_hover(self):
         """Set hover."""
+        renderers = "auto"
+        hover_image = self.get_hover_image()
+        if hover_image is not None:
+            renderers = [self.add_hover_image(hover_image)]
         self.figure.add_tools(
             HoverTool(
                 show_arrow=True,
                 tooltips=[("x, y", "$x{0.00}, $y{0.00}"), (self.kwargs.get("hover_label", "intensity"), "@image")],
+                renderers=renderers,
             )
         )
 
@@ -84,11 +154,11 @@ class PlotImageBase(Plot):
         self.figure.xaxis.axis_label_text_baseline = "bottom"
 
         # update x/y ranges
-        src = self.source.data
+        x, y, dw, dh = self.extent
         if "x_range" not in self.kwargs:
-            self.figure.x_range.update(start=0, end=src["image"][0].shape[1])
+            self.figure.x_range.update(start=x, end=x + dw)
         if "y_range" not in self.kwargs:
-            self.figure.y_range.update(start=0, end=src["image"][0].shape[0])
+            self.figure.y_range.update(start=y, end=y + dh)
         # x_range = self.kwargs.get("x_range", None)
         # if x_range is None:
         #     x_range = (0, src["image"][0].shape[1])
@@ -101,7 +171,7 @@ class PlotImageBase(Plot):
     def set_figure_dimensions(self):
         """Set figure dimensions."""
         width = self.kwargs.get("width", 600)
-        height, width = calculate_aspect_ratio(self.source.data["image"][0].shape, width)
+        height, width = calculate_aspect_ratio(self.image_shape, width)
         if height > 600:
             _ratio = 600 / height
             height = 600
@@ -142,10 +212,9 @@ class PlotImage(PlotImageBase):
             dh="dh",
             image="image",
             source=self.source,
-            palette=self.kwargs["palette"],
+            color_mapper=self.kwargs["colormapper"],
             name="image",
         )
-        self.plots["image"].glyph.color_mapper = self.kwargs["colormapper"]
 
     def add_colorbar(self):
         """Add colorbar."""
@@ -164,6 +233,119 @@ class PlotImage(PlotImageBase):
             self.add_colorbar()
 
 
+class PlotImageSparse(PlotImage):
+    """Sparse image class where only the non-empty pixels are embedded in the document and drawn as rectangles."""
+
+    def __init__(self, output_dir: str, source: ColumnDataSource, title="Image", **kwargs):
+        self._shape: ty.Tuple[int, ...] = ()
+        self._extent: ty.Tuple[float, float, float, float] = (0, 0, 0, 0)
+        self._n_empty = 0
+        PlotImageBase.__init__(self, output_dir, source=source, title=title, plot_type="image-sparse", **kwargs)
+
+    @property
+    def image_shape(self) -> ty.Tuple[int, ...]:
+        """Return shape of the image (in pixels)."""
+        return self._shape
+
+    @property
+    def extent(self) -> ty.Tuple[float, float, float, float]:
+        """Return position (x, y) and size (dw, dh) of the image in data coordinates."""
+        return self._extent
+
+    def get_intensities(self) -> np.ndarray:
+        """Return intensity values used to compute the colormap limits, including the empty pixels."""
+        intensities = self.source.data["intensity"]
+        if self._n_empty:
+            intensities = np.append(intensities, 0)
+        return intensities
+
+    def check_data_source(self):
+        """Ensure that each field in the data source is correct and replace image with list of non-empty pixels."""
+        PlotImageBase.check_data_source(self)
+        image = self.source.data["image"][0]
+        self._shape = image.shape
+        self._extent = tuple(self.source.data[key][0] for key in ("x", "y", "dw", "dh"))
+        self.source.data = get_sparse_pixels(image, *self._extent)
+        self._n_empty = image.size - len(self.source.data["intensity"])
+
+    def plot(self):
+        """Plot non-empty pixels."""
+        _, _, dw, dh = self.extent
+        height, width = self.image_shape
+        colormapper = self.kwargs["colormapper"]
+        self.plots["image"] = self.figure.rect(
+            x="x",
+            y="y",
+            width=dw / width,
+            height=dh / height,
+            source=self.source,
+            fill_color={"field": "intensity", "transform": colormapper},
+            line_color=None,
+            dilate=True,
+            name="image",
+        )
+        # empty pixels are not drawn, so background must have the same color as zero-intensity
+        low, high, palette = colormapper.low, colormapper.high, colormapper.palette
+        index = int((0 - low) / (high - low) * len(palette)) if high > low else 0
+        self.figure.background_fill_color = palette[min(max(index, 0), len(palette) - 1)]
+
+    def set_hover(self):
+        """Set hover."""
+        self.figure.add_tools(
+            HoverTool(
+                show_arrow=True,
+                tooltips=[("x, y", "$x{0.00}, $y{0.00}"), (self.kwargs.get("hover_label", "intensity"), "@intensity")],
+                renderers=[self.plots["image"]],
+            )
+        )
+
+
+class PlotImageEncoded(PlotImage):
+    """Image class where the color-mapped image is losslessly compressed (PNG/WebP) and embedded as data URI.
+
+    Since the browser never sees the raw values, hover is backed by separate invisible image which defaults to float32
+    copy of the image - use the `hover_factor` keyword to reduce its resolution.
+    """
+
+    def __init__(self, output_dir: str, source: ColumnDataSource, title="Image", encode: str = "png", **kwargs):
+        self._image: np.ndarray | None = None
+        self.encode = encode
+        PlotImageBase.__init__(self, output_dir, source=source, title=title, plot_type="image-encoded", **kwargs)
+        self._init_kwargs["encode"] = encode
+
+    @property
+    def image_shape(self) -> ty.Tuple[int, ...]:
+        """Return shape of the image (in pixels)."""
+        return self._image.shape
+
+    def get_intensities(self) -> np.ndarray:
+        """Return intensity values used to compute the colormap limits."""
+        return self._image
+
+    def check_data_source(self):
+        """Ensure that each field in the data source is correct and remove the raw image from the data source."""
+        PlotImageBase.check_data_source(self)
+        self._image = self.source.data["image"][0]
+        self.source.data = {key: self.source.data[key] for key in ("x", "y", "dw", "dh")}
+
+    def plot(self):
+        """Plot encoded image."""
+        rgba = apply_color_mapper(self._image, self.kwargs["colormapper"])
+        self.source.data["url"] = [encode_image(rgba, self.encode)]
+        self.plots["image"] = self.figure.image_url(
+            url="url", x="x", y="y", w="dw", h="dh", anchor="bottom_left", source=self.source, name="image"
+        )
+
+    def get_hover_image(self) -> np.ndarray:
+        """Return image that should back the hover tool."""
+        image = self.kwargs.get("hover_image", None)
+        return downsample_image(
+            self._image if image is None else image,
+            self.kwargs.get("hover_factor", 1),
+            self.kwargs.get("hover_dtype", np.float32),
+        )
+
+
 class PlotImageRGBA(PlotImageBase):
     """RGB Image class."""
 
@@ -176,6 +358,21 @@ class PlotImageRGBA(PlotImageBase):
             x="x", y="y", dw="dw", dh="dh", image="image", source=self.source, name="rgba"
         )
 
+    def initialize_options(self):
+        """Setup few options.
+
+        The composite is not color-mapped, so the color mapper is only computed (from the hover data, using the same
+        `z_percentiles`/`z_samples` options as other images) when the plot has hover image.
+        """
+        if self.kwargs.get("hover_data", None) is None:
+            Plot.initialize_options(self)
+        else:
+            PlotImageBase.initialize_options(self)
+
+    def get_intensities(self) -> np.ndarray:
+        """Return intensity of the hover data used to compute the colormap limits."""
+        return self.kwargs["hover_data"]["intensity"]
+
     def check_data_source(self):
         """Check data sources."""
         PlotImageBase.check_data_source(self)
@@ -183,8 +380,32 @@ class PlotImageRGBA(PlotImageBase):
             raise ValueError("ImageRGBA expects 8-bit values")
 
     def set_hover(self):
-        """Add hover to the image plot."""
+        """Add hover to the image plot.
+
+        Hover data generated by `ImageRGBA.get_hover_data` can be specified using the `hover_data` keyword, in which
+        case it is attached to a separate invisible image (which can have lower resolution than the displayed image).
+        Names of the channels can be specified using the `hover_labels` keyword, either one for each channel in the
+        hover data or one for each channel of the image (including hidden channels that are not in the hover data).
+        """
         tooltips = [("x, y", "$x{0.00}, $y{0.00}")]
+        if self.kwargs.get("hover_data", None) is not None:
+            fields = dict(self.kwargs["hover_data"])
+            image = fields.pop("intensity")
+            renderer = self.add_hover_image(image, fields)
+            tooltips.append(("intensity", "@image"))
+            if "dominant" in fields:
+                tooltips.append(("dominant", "@dominant"))
+            channels = [key for key in fields if key.startswith("channel_")]
+            labels = self.kwargs.get("hover_labels", None) or channels
+            if len(labels) != len(channels):
+                indices = [int(key.removeprefix("channel_")) for key in channels]
+                if len(labels) <= max(indices, default=-1):
+                    raise ValueError("Number of `hover_labels` must match the number of channels in `hover_data`")
+                labels = [labels[index] for index in indices]
+            tooltips.extend((label, f"@{key}") for label, key in zip(labels, channels, strict=True))
+            self.figure.add_tools(HoverTool(show_arrow=True, tooltips=tooltips, renderers=[renderer]))
+            return
+
         if "intensity" in self.source.data:
             tooltips.append(("intensity", "@intensity"))
         else:
@@ -194,3 +415,44 @@ class PlotImageRGBA(PlotImageBase):
             tooltips.append(("(R, G, B A)", "@r, @g, @b, @a"))
 
         self.figure.add_tools(HoverTool(show_arrow=True, tooltips=tooltips))
+
+
+class PlotImageRGBAEncoded(PlotImageRGBA):
+    """RGB Image class where the image is losslessly compressed (PNG/WebP) and embedded as data URI.
+
+    Since the browser never sees the raw values, hover only shows the `hover_data` (see `ImageRGBA.get_hover_data`).
+    """
+
+    def __init__(self, output_dir: str, source: ColumnDataSource, title="Image-RGBA", encode: str = "png", **kwargs):
+        self._image: np.ndarray | None = None
+        self.encode = encode
+        PlotImageBase.__init__(self, output_dir, source=source, title=title, plot_type="rgba-encoded", **kwargs)
+        self._init_kwargs["encode"] = encode
+
+    @property
+    def image_shape(self) -> ty.Tuple[int, ...]:
+        """Return shape of the image (in pixels)."""
+        return self._image.shape
+
+    def check_data_source(self):
+        """Check data sources and replace the raw image with the encoded one."""
+        PlotImageRGBA.check_data_source(self)
+        self._image = self.source.data["image"][0]
+        data = {key: self.source.data[key] for key in ("x", "y", "dw", "dh")}
+        data["url"] = [encode_image(self._image, self.encode)]
+        self.source.data = data
+
+    def plot(self):
+        """Main plotting method."""
+        self.plots["rgba"] = self.figure.image_url(
+            url="url", x="x", y="y", w="dw", h="dh", anchor="bottom_left", source=self.source, name="rgba"
+        )
+
+    def set_hover(self):
+        """Add hover to the image plot."""
+        if self.kwargs.get("hover_data", None) is not None:
+            PlotImageRGBA.set_hover(self)
+        else:
+            self.figure.add_tools(
+                HoverTool(show_arrow=True, tooltips=[("x, y", "$x{0.00}, $y{0.00}")], renderers=[self.plots["rgba"]])
+            )
@@ -0,0 +1,141 @@
+"""Opt-in timing instrumentation of plot construction, layout and save.
+
+Profiling is enabled by `PlotStore.profile()` which activates a `Profiler` for the duration of the `with` block. When no
+profiler is active, every instrumented phase is wrapped in the same shared `nullcontext`, so the overhead is single
+global lookup per phase.
+"""
+
+import json
+import os
+import threading
+import time
+import typing as ty
+from contextlib import contextmanager, nullcontext
+
+_NULL_PHASE = nullcontext()
+_ACTIVE_PROFILER: ty.Optional["Profiler"] = None
+
+
+def get_active_profiler() -> ty.Optional["Profiler"]:
+    """Return currently active profiler (or `None` if profiling is disabled)."""
+    return _ACTIVE_PROFILER
+
+
+def profile_phase(name: str, category: str = "plot", owner: ty.Any = None, **args):
+    """Return context manager which times the phase if profiling is enabled."""
+    if _ACTIVE_PROFILER is None:
+        return _NULL_PHASE
+    return _ACTIVE_PROFILER.phase(name, category, owner, **args)
+
+
+class Profiler:
+    """Collects wall and CPU time of each instrumented phase.
+
+    Each event is dictionary with the phase `name`, `category` (`plot`, `layout` or `save`), `start` (seconds since
+    the profiler was created), `wall` and `cpu` time (seconds) and any extra arguments such as `plot_type`, `plot`,
+    `tab` and `layout` names. Plots are assigned their `plot`, `tab` and `layout` names once they are added to the store.
+    """
+
+    def __init__(self, callback: ty.Callable[[ty.Dict], None] | None = None):
+        self.callback = callback
+        self.events: ty.List[ty.Dict[str, ty.Any]] = []
+        self._owners: ty.Dict[int, ty.List[ty.Dict[str, ty.Any]]] = {}
+        self._t0 = time.perf_counter()
+
+    def __repr__(self) -> str:
+        """Print."""
+        return f"Profiler <events={len(self.events)}>"
+
+    @contextmanager
+    def phase(self, name: str, category: str = "plot", owner: ty.Any = None, **args):
+        """Time phase and record it as an event."""
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "category": category,
+                "start": wall - self._t0,
+                "wall": time.perf_counter() - wall,
+                "cpu": time.process_time() - cpu,
+                "thread": threading.get_ident(),
+                **args,
+            }
+            self.events.append(event)
+            if owner is not None:
+                self._owners.setdefault(id(owner), []).append(event)
+            if self.callback is not None:
+                self.callback(event)
+
+    def assign(self, owner: ty.Any, **args):
+        """Attach extra arguments (e.g. tab and layout name) to all events of the owner."""
+        for event in self._owners.pop(id(owner), []):
+            event.update(args)
+
+    def summary(self) -> ty.Dict[str, ty.Dict[str, ty.Dict[str, float]]]:
+        """Return total wall/CPU time and number of calls per phase, plot and tab."""
+        summary: ty.Dict[str, ty.Dict[str, ty.Dict[str, float]]] = {"phases": {}, "plots": {}, "tabs": {}}
+        for event in self.events:
+            keys = {
+                "phases": f"{event['category']}:{event['name']}",
+                "plots": event.get("plot", None),
+                "tabs": event.get("tab", None),
+            }
+            for group, key in keys.items():
+                if key is None:
+                    continue
+                total = summary[group].setdefault(key, {"wall": 0.0, "cpu": 0.0, "count": 0})
+                total["wall"] += event["wall"]
+                total["cpu"] += event["cpu"]
+                total["count"] += 1
+        return summary
+
+    def to_dict(self) -> ty.Dict[str, ty.Any]:
+        """Return structured report containing all events and their summary."""
+        return {"events": [dict(event) for event in self.events], "summary": self.summary()}
+
+    def to_json(self, path: str | None = None, **kwargs) -> str:
+        """Export report as JSON and optionally save it to the `path`."""
+        data = json.dumps(self.to_dict(), default=str, **kwargs)
+        if path is not None:
+            with open(path, "w") as f_ptr:
+                f_ptr.write(data)
+        return data
+
+    def to_chrome_trace(self, path: str | None = None) -> ty.Dict[str, ty.Any]:
+        """Export events in the Chrome trace format (can be opened in `chrome://tracing` or Perfetto)."""
+        pid = os.getpid()
+        skip = ("name", "category", "start", "wall", "thread")
+        trace = {
+            "traceEvents": [
+                {
+                    "name": event["name"],
+                    "cat": event["category"],
+                    "ph": "X",
+                    "ts": event["start"] * 1e6,
+                    "dur": event["wall"] * 1e6,
+                    "pid": pid,
+                    "tid": event["thread"],
+                    "args": {key: value for key, value in event.items() if key not in skip},
+                }
+                for event in self.events
+            ],
+            "displayTimeUnit": "ms",
+        }
+        if path is not None:
+            with open(path, "w") as f_ptr:
+                json.dump(trace, f_ptr, default=str)
+        return trace
+
+
+@contextmanager
+def activate_profiler(profiler: Profiler):
+    """Activate profiler for the duration of the `with` block."""
+    global _ACTIVE_PROFILER
+
+    previous, _ACTIVE_PROFILER = _ACTIVE_PROFILER, profiler
+    try:
+        yield profiler
+    finally:
+        _ACTIVE_PROFILER = previous
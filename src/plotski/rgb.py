@@ -1,18 +1,20 @@
 """Module containing functions that generate RGB plots."""
 
+import os
 import typing as ty
-from itertools import cycle
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle, pairwise
 
 import numpy as np
-from koyo.utilities import rescale
-from matplotlib.colors import ListedColormap
-from skimage import exposure
-from skimage.color import gray2rgb, gray2rgba
 
-from plotski.utilities import convert_hex_to_rgb_1
+from plotski.utilities import convert_hex_to_rgb_1, downsample_image, get_histogram_quantiles, get_quantiles
 
 np.seterr(divide="ignore", invalid="ignore")
 
+# contributions of each channel are accumulated as fixed-point integers (1/256 precision) so that they can be removed
+# from the running sum without any floating-point drift
+FIXED_POINT_SCALE = 256
+
 COLORS = cycle(
     [
         "#800000",
@@ -32,6 +34,229 @@ COLORS = cycle(
 )
 
 
+def _get_rescale_lut(low: float, high: float) -> np.ndarray:
+    """Get lookup table that linearly stretches values between `low` and `high` to the full 0-255 range."""
+    values = np.arange(256, dtype=np.float64)
+    if high <= low:
+        return np.where(values >= high, 255, 0).astype(np.uint8)
+    return np.round(np.clip((values - low) / (high - low), 0, 1) * 255).astype(np.uint8)
+
+
+def _get_equalize_lut(counts: np.ndarray) -> np.ndarray:
+    """Get histogram equalization lookup table."""
+    cdf = np.cumsum(counts, dtype=np.float64)
+    return np.round(cdf / cdf[-1] * 255).astype(np.uint8)
+
+
+def _get_quantile_rescale_lut(counts: np.ndarray, q_low: float = 0.02, q_high: float = 0.98) -> np.ndarray:
+    """Get lookup table that stretches values between the `q_low` and `q_high` quantiles."""
+    if not 0 <= q_low <= 1:
+        raise ValueError(f"`q_low` should be between 0 and 1 (not {q_low})")
+    if not 0 <= q_high <= 1:
+        raise ValueError(f"`q_high` should be between 0 and 1 (not {q_high})")
+    return _get_rescale_lut(*get_histogram_quantiles(counts, [q_low, q_high]))
+
+
+def _get_contrast_stretching_lut(counts: np.ndarray, in_range="image") -> np.ndarray:
+    """Get lookup table that stretches values in the `in_range` (`image`, `dtype` or tuple of quantiles)."""
+    if isinstance(in_range, tuple):
+        return _get_rescale_lut(*get_histogram_quantiles(counts, in_range))
+    if in_range == "image":
+        nonzero = np.flatnonzero(counts)
+        return _get_rescale_lut(nonzero[0], nonzero[-1])
+    return np.arange(256, dtype=np.uint8)
+
+
+LUT_STEPS: ty.Dict[str, ty.Callable[..., np.ndarray]] = {
+    "equalize_histogram": _get_equalize_lut,
+    "quantile_rescale": _get_quantile_rescale_lut,
+    "contrast_stretching": _get_contrast_stretching_lut,
+}
+
+
+def _map(func: ty.Callable, starts: ty.Iterable[int], ends: ty.Iterable[int], executor=None) -> ty.List:
+    """Apply function to blocks, optionally using thread pool."""
+    if executor is None:
+        return list(map(func, starts, ends))
+    return list(executor.map(func, starts, ends))
+
+
+def _get_blocks(size: int, n_blocks: int) -> ty.Tuple[np.ndarray, np.ndarray]:
+    """Split range into (at most) `n_blocks` contiguous blocks."""
+    bounds = np.unique(np.linspace(0, size, min(n_blocks, size) + 1, dtype=int))
+    return bounds[:-1], bounds[1:]
+
+
+# number of grey levels used internally by `skimage.exposure.equalize_adapthist`
+CLAHE_GREY_LEVELS = 2**14
+
+
+def _clip_histogram(histogram: np.ndarray, clip_limit: int) -> np.ndarray:
+    """Clip histograms (one per row) and redistribute the clipped counts the same way as scikit-image.
+
+    Excess counts are first spread evenly over the bins below the limit, and the remainder is then added one count
+    at a time to every `step`-th bin that is still below the limit. All histograms are processed together.
+    """
+    n_regions, n_bins = histogram.shape
+    rows = np.arange(n_regions)[:, None]
+    excess = np.maximum(histogram - clip_limit, 0).sum(axis=1)
+    histogram = np.minimum(histogram, clip_limit)
+
+    increment = (excess // n_bins)[:, None]
+    upper = clip_limit - increment
+    low = histogram < upper
+    excess -= low.sum(axis=1) * increment[:, 0]
+    histogram += low * increment
+    middle = (histogram >= upper) & (histogram < clip_limit)
+    excess -= np.where(middle, clip_limit - histogram, 0).sum(axis=1)
+    histogram[middle] = clip_limit
+
+    bins = np.arange(n_bins)[None, :]
+    while np.any(excess > 0):
+        previous = excess.copy()
+        for index in range(n_bins):
+            active = np.flatnonzero(excess > 0)
+            if active.size == 0:
+                break
+            under = histogram[active] < clip_limit
+            step = np.maximum(1, under.sum(axis=1) // excess[active])[:, None]
+            selected = under & (bins >= index) & ((bins - index) % step == 0)
+            histogram[rows[active], bins] += selected
+            excess[active] -= selected.sum(axis=1)
+        if np.array_equal(previous, excess):
+            break
+    return histogram
+
+
+def _equalize_adapthist(
+    channel: np.ndarray,
+    kernel_size: ty.Tuple[int, int],
+    clip_limit: float,
+    n_bins: int,
+    executor: ThreadPoolExecutor | None = None,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """Contrast Limited Adaptive Histogram Equalization of single uint8 channel.
+
+    Follows `skimage.exposure.equalize_adapthist`: the channel is stretched to 14-bit grey levels, the mapping of each
+    contextual region (tile of `kernel_size` starting at the image origin, edge tiles are completed by reflection) is
+    computed from its clipped histogram and each pixel is bilinearly interpolated between the mappings of the four
+    regions whose centres surround it. The result is stretched back to the full uint8 range. Both steps are split
+    into independent blocks of rows which can be processed by the `executor` - the mappings are computed for the
+    whole image before interpolation so the result does not depend on the blocks. Unlike scikit-image, constant
+    channels (e.g. empty color channels) are returned unchanged.
+    """
+    height, width = channel.shape
+    counts = np.bincount(channel.ravel(), minlength=256)
+    nonzero = np.flatnonzero(counts)
+    v_min, v_max = nonzero[0], nonzero[-1]
+    if v_min == v_max:
+        return channel.copy()
+
+    # lookup table from uint8 value to histogram bin (of the stretched 14-bit grey levels)
+    levels = np.round((np.arange(256) - v_min).clip(0, v_max - v_min) * ((CLAHE_GREY_LEVELS - 1) / (v_max - v_min)))
+    bin_lut = (levels.astype(np.int64) // (1 + CLAHE_GREY_LEVELS // n_bins)).astype(np.uint8)
+    values = bin_lut[channel]
+
+    k_height, k_width = kernel_size
+    n_rows, n_cols = -(-height // k_height), -(-width // k_width)
+    padded = np.pad(values, ((0, n_rows * k_height - height), (0, n_cols * k_width - width)), mode="reflect")
+    n_elements = k_height * k_width
+    clip_limit = max(int(clip_limit * n_elements), 1) if clip_limit > 0 else n_elements
+
+    def _get_mappings(start: int, end: int) -> np.ndarray:
+        regions = padded[start * k_height : end * k_height].reshape(end - start, k_height, n_cols, k_width)
+        regions = regions.transpose(0, 2, 1, 3).reshape(-1, n_elements)
+        indices = regions + (np.arange(regions.shape[0]) * n_bins)[:, None]
+        histogram = np.bincount(indices.ravel(), minlength=regions.shape[0] * n_bins).reshape(-1, n_bins)
+        histogram = _clip_histogram(histogram, clip_limit)
+        scale = (CLAHE_GREY_LEVELS - 1) / n_elements
+        mappings = np.minimum(np.cumsum(histogram, axis=1) * scale, CLAHE_GREY_LEVELS - 1).astype(np.int64)
+        return mappings.astype(np.float32).reshape(end - start, n_cols, n_bins)
+
+    mappings = np.concatenate(_map(_get_mappings, *_get_blocks(n_rows, n_jobs), executor))
+
+    def _get_neighbours(size: int, k: int, n: int) -> ty.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # position relative to the centers of neighbouring regions
+        position = np.arange(size) + k // 2
+        index = position // k
+        return np.clip(index - 1, 0, n - 1), np.clip(index, 0, n - 1), (position % k / k).astype(np.float32)
+
+    col_low, col_high, col_weight = _get_neighbours(width, k_width, n_cols)
+    row_low, row_high, row_weight = _get_neighbours(height, k_height, n_rows)
+    result = np.empty_like(channel, dtype=np.uint16)
+
+    def _interpolate(start: int, end: int) -> None:
+        block = values[start:end]
+        top, bottom = row_low[start:end, None], row_high[start:end, None]
+        weight = row_weight[start:end, None]
+        top = (1 - col_weight) * mappings[top, col_low, block] + col_weight * mappings[top, col_high, block]
+        bottom = (1 - col_weight) * mappings[bottom, col_low, block] + col_weight * mappings[bottom, col_high, block]
+        # values are truncated to integer grey levels, same as in scikit-image
+        result[start:end] = (1 - weight) * top + weight * bottom
+
+    _map(_interpolate, *_get_blocks(height, n_jobs * 4 if executor else 1), executor)
+
+    # stretch the result to the full range
+    counts = np.bincount(result.ravel(), minlength=CLAHE_GREY_LEVELS)
+    nonzero = np.flatnonzero(counts)
+    low, high = nonzero[0], max(nonzero[-1], nonzero[0] + 1)
+    lut = np.round((np.arange(CLAHE_GREY_LEVELS) - low).clip(0, high - low) * (255 / (high - low)))
+    return lut.astype(np.uint8)[result]
+
+
+class SparseImage:
+    """Flat image where only the non-zero pixels are stored.
+
+    Parameters
+    ----------
+    indices : np.ndarray
+        sorted and unique flat (row-major) indices of the non-zero pixels
+    values : np.ndarray
+        values of the non-zero pixels
+    shape : Tuple[int, int]
+        shape of the image
+    """
+
+    ndim = 2
+
+    def __init__(self, indices: np.ndarray, values: np.ndarray, shape: ty.Tuple[int, int]):
+        self.indices = indices
+        self.values = values
+        self.shape = tuple(shape)
+
+    def __repr__(self):
+        return f"SparseImage <shape={self.shape}; nnz={self.values.size}>"
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Return data type of the values."""
+        return self.values.dtype
+
+    @property
+    def nbytes(self) -> int:
+        """Return number of bytes used by the indices and values."""
+        return self.indices.nbytes + self.values.nbytes
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        dense = np.zeros(self.shape, dtype=dtype or self.values.dtype)
+        dense.reshape(-1)[self.indices] = self.values
+        return dense
+
+    def __getitem__(self, rows: slice) -> "SparseImage":
+        """Return block of rows."""
+        if not isinstance(rows, slice) or rows.step not in (None, 1):
+            raise ValueError("Sparse image can only be indexed by contiguous block of rows")
+        start, end, _ = rows.indices(self.shape[0])
+        width = self.shape[1]
+        low, high = np.searchsorted(self.indices, [start * width, end * width])
+        return SparseImage(self.indices[low:high] - start * width, self.values[low:high], (end - start, width))
+
+    def with_values(self, values: np.ndarray) -> "SparseImage":
+        """Return sparse image with the same non-zero pixels but different values."""
+        return SparseImage(self.indices, values, self.shape)
+
+
 class ImageRGBA:
     """Class that simplifies generation of composite images.
 
@@ -44,17 +269,66 @@ class ImageRGBA:
         list of flat images
     colors : Optional[List]
         list of colors - if None have been specified, a set of defaults will be used instead
+    dtype : np.dtype
+        data type used to store the normalized intensities of each channel. Colored (RGBA) version of each channel is
+        only computed when needed, so using `np.uint8` (default) or `np.float32` keeps the memory footprint small
+    n_jobs : Optional[int]
+        number of threads used to normalize channels and combine them - if None or 1, everything is done serially and
+        if negative, the number of threads is relative to the number of CPUs (e.g. -1 uses all CPUs). The result is
+        identical regardless of the number of threads
+    mode : str
+        composite mode - `additive` sums colored contributions of all images, which becomes saturated when many images
+        overlap, whereas `dominant` gives each pixel the color of the image with the highest normalized intensity,
+        scaled by that intensity
+    cache_nbytes : Optional[int]
+        memory budget (in bytes) of the cache of derived products (summed intensities, rescaled channels, colormaps,
+        histogram) - least recently used products are evicted when it is exceeded, 0 disables caching and None lifts
+        the limit. Cached arrays are shared between calls, so they are returned read-only
     """
 
-    def __init__(self, images: ty.List[np.ndarray], colors: ty.List | None = None):
+    def __init__(
+        self,
+        images: ty.List[np.ndarray],
+        colors: ty.List | None = None,
+        dtype=np.uint8,
+        n_jobs: int | None = None,
+        mode: str = "additive",
+        cache_nbytes: int | None = 256 * 1024**2,
+    ):
         """Class to quickly generate composite RGBA images based on ion (or other) images."""
         self.validate(images, colors)
 
-        self._original, self._images, self._colors = self.setup(images, colors)
+        self.dtype = np.dtype(dtype)
+        self.n_jobs = self._get_n_jobs(n_jobs)
+        self._mode = self._validate_mode(mode)
+        self._original, self._intensities, self._colors = self.setup(images, colors)
+        self._color_vectors = [self._get_color_vector(color) for color in self._colors]
+        self._visible = [True] * len(self._intensities)
+        self._accumulator: np.ndarray | None = None
         self._rgba: np.ndarray | None = None
+        self._cache: ty.Dict[ty.Tuple, ty.Any] = {}
+        self._cache_nbytes = cache_nbytes
+        self._cache_stats = {"hits": 0, "misses": 0}
 
     def __repr__(self):
-        return f"ImageRGBA <images={len(self._images)}>"
+        return f"ImageRGBA <images={len(self._intensities)}>"
+
+    @property
+    def mode(self) -> str:
+        """Return composite mode."""
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: str):
+        self._mode = self._validate_mode(mode)
+        self.reset()
+
+    @staticmethod
+    def _validate_mode(mode: str) -> str:
+        """Validate composite mode."""
+        if mode not in ("additive", "dominant"):
+            raise ValueError(f"Mode should be either `additive` or `dominant` (not {mode})")
+        return mode
 
     @staticmethod
     def _convert_color(color):
@@ -66,10 +340,38 @@ class ImageRGBA:
                 color = np.asarray(color) / 255
             return color
 
+    @staticmethod
+    def _get_n_jobs(n_jobs: int | None) -> int:
+        """Get number of threads."""
+        if n_jobs is None:
+            return 1
+        if n_jobs < 0:
+            n_jobs = (os.cpu_count() or 1) + 1 + n_jobs
+        return max(1, n_jobs)
+
+    @classmethod
+    def _get_color_vector(cls, color) -> np.ndarray:
+        """Convert hex/rgb(a) color to RGBA vector in range 0-1."""
+        vector = np.ones(4, dtype=np.float32)
+        color = cls._convert_color(color)
+        vector[: len(color)] = color
+        return vector
+
     @property
     def intensities(self) -> np.ndarray:
-        """Return summed intensities from the original data."""
-        return np.sum(self._original, axis=0)
+        """Return summed intensities from the original data (read-only array shared between calls)."""
+        return self._get_cached(("intensities",), self._get_intensities)
+
+    def _get_intensities(self) -> np.ndarray:
+        """Sum original images in single buffer without densifying sparse images."""
+        shape = np.shape(self._original[0])
+        intensities = np.zeros(int(np.prod(shape)))
+        for image in self._original:
+            if isinstance(image, SparseImage):
+                intensities[image.indices] += image.values
+            else:
+                intensities += np.ravel(image)
+        return intensities.reshape(shape)
 
     @property
     def rgb(self) -> np.ndarray:
@@ -80,7 +382,7 @@ class ImageRGBA:
     def rgba(self) -> np.ndarray:
         """Return combined image array with the alpha channel."""
         if self._rgba is None:
-            self._rgba = self.combine().astype(np.uint8)
+            self._rgba = self.combine()
             self._rgba[:, :, 3] = 255
         return self._rgba
 
@@ -89,6 +391,7 @@ class ImageRGBA:
         if array is not None and array.shape[2] != 4:
             raise ValueError("Cannot set RGBA array without the alpha channel")
         self._rgba = array
+        self._invalidate("histogram")
 
     @staticmethod
     def validate(images: ty.List[np.ndarray], colors: ty.List[str] | None) -> None:
@@ -109,10 +412,9 @@ class ImageRGBA:
         if not isinstance(images, list):
             raise ValueError("Expected list of images")
 
-        images = [np.asarray(image) for image in images]
         shapes = set()
         for image in images:
-            shapes.add(image.shape)
+            shapes.add(np.shape(image))
 
         if len(shapes) > 1:
             raise ValueError("Images must be of the same size")
@@ -125,22 +427,40 @@ class ImageRGBA:
                     f" and colors: {len(colors)}"
                 )
             for color in colors:
-                if isinstance(color, str):
-                    if not color.startswith("#"):
-                        raise ValueError("Hex color must start with a hash e.g. `#FF00FF`")
-                elif isinstance(color, (list, tuple, np.ndarray)):
-                    color_len = len(color)
-                    if color_len not in [3, 4]:
-                        raise ValueError("RGB(A) color must have between 3-4 values (R, G, B and A)")
-                else:
-                    raise ValueError("Color must be a string (hex) or list (RGBA in range 0-1)")
+                ImageRGBA.validate_color(color)
+
+    @staticmethod
+    def validate_color(color: ty.Union[str, ty.List]) -> None:
+        """Validate color.
+
+        Parameters
+        ----------
+        color : Union[str, List]
+            hex color or RGB(A) color in range 0-1 (or 0-255, which is rescaled)
+
+        Raises
+        ------
+        ValueError
+            raised if color is not correctly formatted
+        """
+        if isinstance(color, str):
+            if not color.startswith("#"):
+                raise ValueError("Hex color must start with a hash e.g. `#FF00FF`")
+        elif isinstance(color, (list, tuple, np.ndarray)):
+            color_len = len(color)
+            if color_len not in [3, 4]:
+                raise ValueError("RGB(A) color must have between 3-4 values (R, G, B and A)")
+            if np.min(color) < 0 or np.max(color) > 255:
+                raise ValueError("RGB(A) color values must be in range 0-1 or 0-255")
+        else:
+            raise ValueError("Color must be a string (hex) or list (RGBA in range 0-1)")
 
     def reset(self):
         """Reset the store RGBA array to ignore previously made changes (e.g. channel normalizations)."""
         self.rgba = None
 
     def setup(self, images: ty.List[np.ndarray], colors: ty.List[str] | None) -> ty.Tuple[ty.List, ty.List, ty.List]:
-        """Clean-up and remap images to appropriate color.
+        """Clean-up and normalize images.
 
         Parameters
         ----------
@@ -152,66 +472,142 @@ class ImageRGBA:
         Returns
         -------
         images : List
-            list of remapped images
-        _images : List
             list of original images
-        colors : Iterable
-            color iterable
+        intensities : List
+            list of normalized images (in range 0-255) or already colored 3D images
+        colors : List
+            list of colors
         """
         if colors is None:
             colors = [next(COLORS) for _ in images]
 
-        _images = []
-        for image, color in zip(images, colors, strict=False):
+        def _prepare(image: np.ndarray) -> np.ndarray:
+            if isinstance(image, SparseImage):
+                # channels without any entries are empty
+                if image.values.size == 0:
+                    return image.with_values(image.values.astype(self.dtype))
+                # implicit zeros stay at zero as long as the values are non-negative
+                return image.with_values(self._normalize(image.values, self.dtype, min_val=0))
             if len(image.shape) == 2:
-                image = self._to_rgb(image, self._convert_color(color))
-            _images.append(image)
+                image = self._normalize(image, self.dtype)
+            return image
 
-        return images, _images, colors
+        if self.n_jobs > 1 and len(images) > 1:
+            # NumPy releases the GIL for the bulk of the work so threads scale well
+            with ThreadPoolExecutor(min(self.n_jobs, len(images))) as executor:
+                intensities = list(executor.map(_prepare, images))
+        else:
+            intensities = [_prepare(image) for image in images]
+
+        return list(images), intensities, list(colors)
 
     def rescale(self, channel_id: int, max_value: ty.Union[int, float] = 255):
-        """Rescale array to standardized range."""
-        return rescale(np.nan_to_num(self._original[channel_id]), 0, max_value)
+        """Rescale array to standardized range. The result is read-only since it is shared between calls."""
+        from koyo.utilities import rescale
+
+        return self._get_cached(
+            ("rescale", channel_id, max_value), lambda: rescale(np.nan_to_num(self._original[channel_id]), 0, max_value)
+        )
+
+    def _get_cached(self, key: ty.Tuple, func: ty.Callable[[], ty.Any]) -> ty.Any:
+        """Return cached value or compute and cache it. Cached arrays are made read-only to keep the cache valid."""
+        if key in self._cache:
+            self._cache_stats["hits"] += 1
+            # move to the end so the least recently used values are evicted first
+            value = self._cache[key] = self._cache.pop(key)
+            return value
+        self._cache_stats["misses"] += 1
+        value = func()
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)
+        if self._cache_nbytes == 0:
+            return value
+        self._cache[key] = value
+        if self._cache_nbytes is not None:
+            nbytes = self.cache_info()["nbytes"]
+            while nbytes > self._cache_nbytes:
+                evicted = self._cache.pop(next(iter(self._cache)))
+                nbytes -= evicted.nbytes if isinstance(evicted, np.ndarray) else 0
+        return value
+
+    def _invalidate(self, kind: str | None = None, image_id: int | None = None) -> None:
+        """Remove cached values of particular kind (and image) or everything if `kind` is None."""
+        for key in list(self._cache):
+            if (kind is None or key[0] == kind) and (image_id is None or key[1] == image_id):
+                del self._cache[key]
+
+    def cache_info(self) -> ty.Dict[str, int]:
+        """Return statistics of the cache of derived products (intensities, rescaled channels, colormaps, histogram).
+
+        Returns
+        -------
+        info : Dict[str, int]
+            number of cache `hits` and `misses`, number of cached items (`size`) and their memory footprint (`nbytes`)
+        """
+        nbytes = sum(value.nbytes for value in self._cache.values() if isinstance(value, np.ndarray))
+        return {**self._cache_stats, "size": len(self._cache), "nbytes": nbytes}
+
+    def clear_cache(self) -> None:
+        """Clear cache of derived products and reset its statistics."""
+        self._cache.clear()
+        self._cache_stats = {"hits": 0, "misses": 0}
 
     @staticmethod
-    def _to_rgb(
+    def _normalize(
         image: np.ndarray,
-        color: ty.Union[ty.List, ty.Tuple],
-        add_alpha: bool = True,
+        dtype=np.uint8,
         max_value: ty.Union[int, float] = 255,
+        min_val: float | None = None,
+        max_val: float | None = None,
     ) -> np.ndarray:
-        """Convert flat array to multi-channel RGB image based on the specified color.
+        """Rescale flat array to the range 0-`max_value` and convert it to the specified data type.
 
         Parameters
         ----------
         image : np.ndarray
             flat image array
-        color : Union[Tuple, List]
-            chosen RGB color in the scale 0-255
-        add_alpha : bool
-            if `True`, 4-th alpha channel will be added to the image array
+        dtype : np.dtype
+            data type of the normalized image
         max_value : Union[int, float]
             maximum value the image should be rescaled to
+        min_val : float, optional
+            minimum value of the original range - used when `image` is only a tile of larger image
+        max_val : float, optional
+            maximum value of the original range - used when `image` is only a tile of larger image
 
         Returns
         -------
-        rgb : np.ndarray
-            3/4-dimensional image array remapped to the `color`
-
+        image : np.ndarray
+            normalized image
         """
-        if add_alpha:
-            image = gray2rgba(rescale(np.nan_to_num(image), 0, max_value))
-        else:
-            image = gray2rgb(rescale(np.nan_to_num(image), 0, max_value))
+        from koyo.utilities import rescale
 
-        if add_alpha and len(color) == 3:
-            if isinstance(color, np.ndarray):
-                np.append(color, [1.0])
-            else:
-                color = list(color)
-                color.append(1.0)
+        image = np.nan_to_num(rescale(np.nan_to_num(image), 0, max_value, min_val=min_val, max_val=max_val), copy=False)
+        if np.issubdtype(dtype, np.integer):
+            image = np.round(image)
+        return image.astype(dtype, copy=False)
+
+    @staticmethod
+    def _get_contribution(intensity: np.ndarray, color: np.ndarray, dtype=np.float32) -> np.ndarray:
+        """Convert normalized flat array to RGBA image based on the specified color vector.
 
-        return image * color
+        Parameters
+        ----------
+        intensity : np.ndarray
+            normalized flat image array (or already colored 3D image, which is returned unchanged)
+        color : np.ndarray
+            RGBA color vector in range 0-1
+        dtype : np.dtype
+            data type of the returned image
+
+        Returns
+        -------
+        rgba : np.ndarray
+            3D image array remapped to the `color`
+        """
+        if intensity.ndim == 3:
+            return intensity.astype(dtype)
+        return np.multiply(np.asarray(intensity)[:, :, None], color, dtype=dtype)
 
     def recolor(self, image_id: int, color: ty.Union[str, ty.List]):
         """Change color of particular image.
@@ -223,13 +619,88 @@ class ImageRGBA:
         color : Union[str, List]
             new color of the image
         """
-        if image_id > len(self._images) - 1:
+        if image_id > len(self._intensities) - 1:
             raise ValueError("Cannot update color of image that is not present")
+        self.validate_color(color)
 
+        self._update_accumulator(image_id, -1)
         self._colors[image_id] = color
-        self._images[image_id] = self._to_rgb(self._original[image_id], self._convert_color(color))
+        self._color_vectors[image_id] = self._get_color_vector(color)
+        self._update_accumulator(image_id, 1)
+        self._invalidate("colormap", image_id)
+        self.reset()
+
+    def set_visible(self, image_id: int, visible: bool = True):
+        """Show or hide particular image in the composite.
+
+        Parameters
+        ----------
+        image_id : int
+            index of the image
+        visible : bool
+            if `False`, the image will not contribute to the combined image
+        """
+        if image_id > len(self._intensities) - 1:
+            raise ValueError("Cannot update visibility of image that is not present")
+        if self._visible[image_id] == visible:
+            return
+
+        self._update_accumulator(image_id, -1)
+        self._visible[image_id] = visible
+        self._update_accumulator(image_id, 1)
+        self.reset()
+
+    def add_channel(self, image: np.ndarray, color: ty.Union[str, ty.List] | None = None):
+        """Add new image to the composite.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            flat image with the same shape as the other images
+        color : Union[str, List], optional
+            color of the image - if None has been specified, the next default color will be used instead
+        """
+        if image.shape[:2] != self._intensities[0].shape[:2]:
+            raise ValueError("Image must have the same shape as the other images")
+        if color is None:
+            color = next(COLORS)
+        self.validate_color(color)
+
+        self._original.append(image)
+        self._intensities.append(self._normalize(image, self.dtype) if image.ndim == 2 else image)
+        self._colors.append(color)
+        self._color_vectors.append(self._get_color_vector(color))
+        self._visible.append(True)
+        self._update_accumulator(len(self._intensities) - 1, 1)
+        self._invalidate("intensities")
+        self.reset()
+
+    def remove_channel(self, image_id: int):
+        """Remove image from the composite.
+
+        Parameters
+        ----------
+        image_id : int
+            index of the image
+        """
+        if image_id > len(self._intensities) - 1:
+            raise ValueError("Cannot remove image that is not present")
+        if len(self._intensities) == 1:
+            raise ValueError("Cannot remove the last image")
+
+        self._update_accumulator(image_id, -1)
+        for values in (self._original, self._intensities, self._colors, self._color_vectors, self._visible):
+            values.pop(image_id)
+        # indices of the following images have shifted
+        self._invalidate()
         self.reset()
 
+    def _update_accumulator(self, image_id: int, sign: int):
+        """Add (sign=1) or subtract (sign=-1) contribution of particular image to the running accumulator."""
+        if self._accumulator is None or not self._visible[image_id]:
+            return
+        self._add_contribution(self._accumulator, self._intensities[image_id], self._color_vectors[image_id], sign)
+
     def get_one(self, image_id: int, keep_alpha: bool = False, dtype=np.uint8, fill_alpha: int | None = None):
         """Retrieve single 3/4D image.
 
@@ -249,25 +720,31 @@ class ImageRGBA:
         array : np.ndarray
             3/4D image array mapped to specific color
         """
-        if image_id > len(self._images) - 1:
+        if image_id > len(self._intensities) - 1:
             raise ValueError("Tried to retrieve image that is not present")
 
+        intensity, color = self._intensities[image_id], self._color_vectors[image_id]
+        image = self._get_contribution(intensity, color, np.float32)
         if keep_alpha:
-            image = self._images[image_id].astype(dtype)
+            # alpha channel of flat image is that of its color rather than scaled by the intensity
+            if intensity.ndim == 2:
+                image[:, :, 3] = color[3]
+            image = image.astype(dtype)
             if fill_alpha is not None and isinstance(fill_alpha, int):
                 image[:, :, 3] = fill_alpha
             return image
-        return self._images[image_id][:, :, :3].astype(dtype)
+        return image[:, :, :3].astype(dtype)
 
     def get_rgba(self, fill_alpha: int | None = None):
         """Retrieve RGBA image."""
         image = self.rgba
         if fill_alpha is not None and isinstance(fill_alpha, int):
             image[:, :, 3] = fill_alpha
+            self._invalidate("histogram")
 
         return image
 
-    def combine(self, max_value: ty.Union[int, float] = 255, dtype=np.uint8) -> np.ndarray:
+    def combine(self, max_value: ty.Union[int, float] = 255, dtype=np.uint8, mode: str | None = None) -> np.ndarray:
         """Combine multiple images into one.
 
         Parameters
@@ -276,35 +753,312 @@ class ImageRGBA:
             maximum value the image should be rescaled to
         dtype : np.dtype
             numpy data type
+        mode : str, optional
+            composite mode (`additive` or `dominant`) - if None, the mode specified when creating the object is used
 
         Returns
         -------
         combined_rgb : nd.array
             3/4-dimensional image from multiple images
         """
-        return self._combine(self._images, max_value, dtype)
+        mode = self._mode if mode is None else self._validate_mode(mode)
+        if mode == "dominant":
+            return self._combine_dominant(max_value, dtype)
+        if self._accumulator is None:
+            self._accumulator = self._accumulate(
+                [intensity for intensity, visible in zip(self._intensities, self._visible, strict=True) if visible],
+                [color for color, visible in zip(self._color_vectors, self._visible, strict=True) if visible],
+                self._intensities[0].shape[:2],
+                self.n_jobs,
+            )
+        combined_rgb = np.multiply(self._accumulator, 1 / FIXED_POINT_SCALE, dtype=np.float32)
+        np.clip(combined_rgb, 0, max_value, out=combined_rgb)
+        return combined_rgb.astype(dtype)
+
+    def _combine_dominant(self, max_value: float, dtype) -> np.ndarray:
+        """Combine multiple images by giving each pixel the color of the image with the highest intensity.
+
+        Running maximum is used instead of stacking all images and calling `np.argmax` so only the (H, W) maximum and
+        index arrays are kept in memory. Ties are resolved in favour of the first image, same as `np.argmax`.
+        """
+        indices = [i for i, visible in enumerate(self._visible) if visible]
+        if any(self._intensities[i].ndim != 2 for i in indices):
+            raise ValueError("Dominant mode only supports flat (2D) images")
+        height, width = self._intensities[0].shape[:2]
+        if not indices:
+            # same as additive mode when nothing is visible
+            return np.zeros((height, width, 4), dtype=dtype)
+        palette = np.asarray([self._color_vectors[index] for index in indices], dtype=np.float32)
+        index_dtype = np.min_scalar_type(len(indices))
+        combined_rgb = np.empty((height, width, 4), dtype=dtype)
+
+        def _combine_rows(start: int, end: int) -> None:
+            maximum = np.zeros((end - start, width), dtype=self.dtype)
+            dominant = np.zeros((end - start, width), dtype=index_dtype)
+            mask = np.empty((end - start, width), dtype=bool)
+            for i, index in enumerate(indices):
+                intensity = np.asarray(self._intensities[index][start:end])
+                np.greater(intensity, maximum, out=mask)
+                np.copyto(maximum, intensity, where=mask)
+                dominant[mask] = i
+            rgba = palette[dominant] * maximum[:, :, None]
+            np.clip(rgba, 0, max_value, out=rgba)
+            combined_rgb[start:end] = rgba
+
+        if self.n_jobs > 1:
+            with ThreadPoolExecutor(self.n_jobs) as executor:
+                _map(_combine_rows, *_get_blocks(height, self.n_jobs), executor)
+        else:
+            _combine_rows(0, height)
+        return combined_rgb
+
+    @classmethod
+    def _accumulate(
+        cls,
+        intensities: ty.List[np.ndarray],
+        colors: ty.List[np.ndarray],
+        shape: ty.Tuple[int, int],
+        n_jobs: int = 1,
+    ) -> np.ndarray:
+        """Sum contributions of multiple images.
+
+        Parameters
+        ----------
+        intensities : List[np.ndarray]
+            list of normalized flat images (or already colored 3D images)
+        colors : List[np.ndarray]
+            list of RGBA color vectors, one for each image
+        shape : Tuple[int, int]
+            shape of the images
+        n_jobs : int
+            number of threads - each thread processes separate block of rows
+
+        Returns
+        -------
+        accumulator : np.ndarray
+            fixed-point (scaled by `FIXED_POINT_SCALE`) sum of all contributions
+        """
+        # accumulate in-place to avoid stacking all images into single (N, H, W, 4) array
+        accumulator = np.zeros((*shape, 4), dtype=np.int32)
+
+        def _accumulate_rows(start: int, end: int) -> None:
+            buffer = np.empty((end - start, shape[1]), dtype=np.float32)
+            for intensity, color in zip(intensities, colors, strict=True):
+                cls._add_contribution(accumulator[start:end], intensity[start:end], color, 1, buffer)
+
+        n_jobs = min(n_jobs, shape[0])
+        if n_jobs > 1:
+            # blocks don't overlap and integer sums are exact, so the result does not depend on the number of threads
+            bounds = np.linspace(0, shape[0], n_jobs + 1, dtype=int)
+            with ThreadPoolExecutor(n_jobs) as executor:
+                list(executor.map(_accumulate_rows, bounds[:-1], bounds[1:]))
+        else:
+            _accumulate_rows(0, shape[0])
+        return accumulator
 
     @staticmethod
-    def _combine(images: ty.List[np.ndarray], max_value: ty.Union[int, float], dtype) -> np.ndarray:
-        """Combine multiple images into one.
+    def _add_contribution(
+        accumulator: np.ndarray, intensity: np.ndarray, color: np.ndarray, sign: int = 1, buffer=None
+    ) -> None:
+        """Add or subtract fixed-point contribution of single image to the accumulator, in-place.
+
+        The colored version of the image is never created, instead each color component is processed separately. The
+        contribution is rounded to integer so subtracting it later gives exactly the same result as a full recombine.
+        """
+        func = np.add if sign > 0 else np.subtract
+        if isinstance(intensity, SparseImage):
+            accumulator = accumulator.reshape(-1, 4)
+            for i, value in enumerate(color):
+                if value != 0:
+                    contribution = np.rint(np.multiply(intensity.values, value * FIXED_POINT_SCALE, dtype=np.float32))
+                    accumulator[intensity.indices, i] = func(
+                        accumulator[intensity.indices, i], contribution, casting="unsafe", dtype=np.int32
+                    )
+            return
+        if intensity.ndim == 3:
+            n_channels = intensity.shape[2]
+            contribution = np.rint(np.multiply(intensity, FIXED_POINT_SCALE, dtype=np.float32))
+            func(accumulator[:, :, :n_channels], contribution, out=accumulator[:, :, :n_channels], casting="unsafe")
+            return
+        if buffer is None:
+            buffer = np.empty(intensity.shape, dtype=np.float32)
+        for i, value in enumerate(color):
+            if value != 0:
+                np.multiply(intensity, value * FIXED_POINT_SCALE, out=buffer, casting="unsafe")
+                np.rint(buffer, out=buffer)
+                func(accumulator[:, :, i], buffer, out=accumulator[:, :, i], casting="unsafe")
+
+    @classmethod
+    def from_sparse(
+        cls,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        channels: np.ndarray,
+        values: np.ndarray,
+        shape: ty.Tuple[int, int],
+        colors: ty.List | None = None,
+        n_channels: int | None = None,
+        **kwargs: ty.Any,
+    ) -> "ImageRGBA":
+        """Create RGBA image from sparse (COO) pixel x channel data.
+
+        Only the non-zero entries of each channel are normalized and colored - the dense array is only created for the
+        final composite. Data stored as a sparse (pixels x channels) matrix `matrix` can be used like this::
+
+            coo = matrix.tocoo()
+            ImageRGBA.from_sparse(*np.unravel_index(coo.row, shape), coo.col, coo.data, shape)
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            row index of each entry
+        cols : np.ndarray
+            column index of each entry
+        channels : np.ndarray
+            channel index of each entry
+        values : np.ndarray
+            non-negative value of each entry - values of duplicate entries are summed
+        shape : Tuple[int, int]
+            shape of the image
+        colors : Optional[List]
+            list of colors - if None have been specified, a set of defaults will be used instead
+        n_channels : int, optional
+            number of channels - if None, it is determined from `colors` or the highest channel index
+        kwargs :
+            other keyword arguments passed to `ImageRGBA`
+
+        Returns
+        -------
+        image_rgba : ImageRGBA
+            RGBA image
+        """
+        rows, cols, channels = np.asarray(rows), np.asarray(cols), np.asarray(channels)
+        values = np.nan_to_num(np.asarray(values))
+        if not rows.shape == cols.shape == channels.shape == values.shape:
+            raise ValueError("Rows, columns, channels and values must have the same shape")
+        if len(shape) != 2:
+            raise ValueError("Shape must have two values (height, width)")
+        if rows.size and (rows.min() < 0 or rows.max() >= shape[0] or cols.min() < 0 or cols.max() >= shape[1]):
+            raise ValueError("Row and column indices must be within the image shape")
+        if values.size and values.min() < 0:
+            raise ValueError("Sparse values must be non-negative")
+        if n_channels is None:
+            n_channels = len(colors) if colors is not None else int(channels.max()) + 1 if channels.size else 1
+        if channels.size and (channels.min() < 0 or channels.max() >= n_channels):
+            raise ValueError(f"Channel indices must be between 0 and {n_channels - 1}")
+
+        # sort entries by channel and pixel and sum duplicates
+        indices = np.ravel_multi_index((rows, cols), shape)
+        order = np.lexsort((indices, channels))
+        indices, channels, values = indices[order], channels[order], values[order]
+        keys = channels.astype(np.int64) * (shape[0] * shape[1]) + indices
+        if keys.size:
+            unique = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            indices, channels, values = indices[unique], channels[unique], np.add.reduceat(values, unique)
+
+        bounds = np.searchsorted(channels, np.arange(n_channels + 1))
+        images = [SparseImage(indices[start:end], values[start:end], shape) for start, end in pairwise(bounds)]
+        return cls(images, colors, **kwargs)
+
+    @staticmethod
+    def _iter_tiles(shape: ty.Tuple[int, int], tile_size: int) -> ty.Iterator[ty.Tuple[slice, slice]]:
+        """Iterate over row/column slices of tiles covering image of specified shape."""
+        for start_row in range(0, shape[0], tile_size):
+            for start_col in range(0, shape[1], tile_size):
+                yield slice(start_row, start_row + tile_size), slice(start_col, start_col + tile_size)
+
+    @classmethod
+    def get_channel_limits(cls, images: ty.List[np.ndarray], tile_size: int = 1024) -> ty.List[ty.Tuple[float, float]]:
+        """Compute minimum and maximum value of each image in a single streaming pass.
 
         Parameters
         ----------
         images : List[np.ndarray]
-            list of RGBA images
-        max_value : Union[int, float]
-            maximum value the image should be rescaled to
-        dtype : np.dtype
-            numpy data type
+            list of flat images - these can be memory-mapped (or other lazy) arrays as only one tile is read at a time
+        tile_size : int
+            size of the tile
 
         Returns
         -------
-        combined_rgb : nd.array
-            3/4-dimensional image from multiple images
+        limits : List[Tuple[float, float]]
+            minimum and maximum value of each image, after NaNs were replaced with 0
         """
-        combined_rgb = np.sum(images, axis=0)
-        combined_rgb = np.clip(combined_rgb, 0, max_value)
-        return combined_rgb.astype(dtype)
+        limits = []
+        for image in images:
+            min_val, max_val = np.inf, -np.inf
+            for rows, cols in cls._iter_tiles(image.shape, tile_size):
+                tile = np.nan_to_num(np.asarray(image[rows, cols]))
+                min_val, max_val = min(min_val, tile.min()), max(max_val, tile.max())
+            limits.append((min_val, max_val))
+        return limits
+
+    @classmethod
+    def combine_tiled(
+        cls,
+        images: ty.List[np.ndarray],
+        colors: ty.List | None = None,
+        path: ty.Union[str, os.PathLike] | None = None,
+        tile_size: int = 1024,
+    ) -> np.ndarray:
+        """Combine multiple images into one RGBA image, one tile at a time.
+
+        This is the out-of-core counterpart of `ImageRGBA(images, colors).rgba` and gives identical result. Images are
+        never fully loaded into memory - global normalization limits of each channel are computed in the first
+        streaming pass and each tile is then rescaled, colored, combined and clipped separately.
+
+        Parameters
+        ----------
+        images : List[np.ndarray]
+            list of flat images - these can be memory-mapped (or other lazy) arrays that support slicing
+        colors : Optional[List]
+            list of colors - if None have been specified, a set of defaults will be used instead
+        path : Union[str, os.PathLike], optional
+            path to the `.npy` file where the RGBA image should be written to - if None, the image is kept in memory
+        tile_size : int
+            size of the tile
+
+        Returns
+        -------
+        rgba : np.ndarray
+            uint8 RGBA image - memory-mapped if `path` was specified
+        """
+        if not isinstance(images, list):
+            raise ValueError("Expected list of images")
+        if len({image.shape for image in images}) > 1:
+            raise ValueError("Images must be of the same size")
+        if any(len(image.shape) != 2 for image in images):
+            raise ValueError("Tiled mode only supports flat (2D) images")
+        if colors is None:
+            colors = [next(COLORS) for _ in images]
+        if len(colors) != len(images):
+            raise ValueError(f"Please provide the same number of colors as images. Number of images: {len(images)}")
+        for color in colors:
+            cls.validate_color(color)
+        if tile_size < 1:
+            raise ValueError("Tile size must be positive")
+
+        shape = images[0].shape
+        if path is None:
+            rgba = np.empty((*shape, 4), dtype=np.uint8)
+        else:
+            rgba = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint8, shape=(*shape, 4))
+
+        limits = cls.get_channel_limits(images, tile_size)
+        color_vectors = [cls._get_color_vector(color) for color in colors]
+        for rows, cols in cls._iter_tiles(shape, tile_size):
+            tile_shape = rgba[rows, cols].shape[:2]
+            accumulator = np.zeros((*tile_shape, 4), dtype=np.int32)
+            buffer = np.empty(tile_shape, dtype=np.float32)
+            for image, color, (min_val, max_val) in zip(images, color_vectors, limits, strict=True):
+                intensity = cls._normalize(np.asarray(image[rows, cols]), np.uint8, min_val=min_val, max_val=max_val)
+                cls._add_contribution(accumulator, intensity, color, 1, buffer)
+            tile = np.multiply(accumulator, 1 / FIXED_POINT_SCALE, dtype=np.float32)
+            np.clip(tile, 0, 255, out=tile)
+            rgba[rows, cols] = tile
+            rgba[rows, cols, 3] = 255
+        if isinstance(rgba, np.memmap):
+            rgba.flush()
+        return rgba
 
     def clip_channel(
         self,
@@ -394,7 +1148,44 @@ class ImageRGBA:
         return image
 
     # noinspection PyTypeChecker
-    def quantile_rescale(self, q_low: float = 0.02, q_high: float = 0.98, image: np.ndarray | None = None):
+    @staticmethod
+    def get_quantiles(
+        image: np.ndarray,
+        quantiles: ty.Iterable[float],
+        exclude_alpha: bool = True,
+        n_samples: int | None = 1_000_000,
+    ) -> ty.List[float]:
+        """Compute quantiles of an image.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            image array
+        quantiles : Iterable[float]
+            quantiles in the range 0-1
+        exclude_alpha : bool
+            if `True` and the image has 4 channels, the alpha channel is not used to compute the quantiles
+        n_samples : int, optional
+            maximum number of values used to estimate quantiles of float images - integer images always use exact
+            histogram-based quantiles
+
+        Returns
+        -------
+        values : List[float]
+            value of each quantile
+        """
+        if exclude_alpha and image.ndim == 3 and image.shape[2] == 4:
+            image = image[:, :, :3]
+        return get_quantiles(image, quantiles, n_samples)
+
+    def quantile_rescale(
+        self,
+        q_low: float = 0.02,
+        q_high: float = 0.98,
+        image: np.ndarray | None = None,
+        exclude_alpha: bool = True,
+        n_samples: int | None = 1_000_000,
+    ):
         """Contrast enhancement using stretching or shrinking of intensity levels.
 
         Returns
@@ -405,20 +1196,27 @@ class ImageRGBA:
             high boundary quantile
         image : Optional[np.ndarray]
             image array, if one is not provided, the `rgba` attribute will be used instead
+        exclude_alpha : bool
+            if `True`, the alpha channel of RGBA image is not used to compute the quantiles
+        n_samples : int, optional
+            maximum number of values used to estimate quantiles of float images - integer images always use exact
+            histogram-based quantiles
 
         Returns
         -------
         rgb_image : np.ndarray
             image after rescaling
         """
-        if 0 < q_low > 1:
+        if not 0 <= q_low <= 1:
             raise ValueError(f"`q_low` should be between 0 and 1 (not {q_low})")
-        if 0 < q_high > 1:
+        if not 0 <= q_high <= 1:
             raise ValueError(f"`q_high` should be between 0 and 1 (not {q_high})")
         if image is None:
             image = self.rgba
-        p_low, p_high = np.quantile(image, [q_low, q_high])
-        return exposure.rescale_intensity(image, in_range=(p_low, p_high))
+        from skimage.exposure import rescale_intensity
+
+        p_low, p_high = self.get_quantiles(image, [q_low, q_high], exclude_alpha, n_samples)
+        return rescale_intensity(image, in_range=(p_low, p_high))
 
     # noinspection PyTypeChecker
     def equalize_histogram(self, n_bins: int = 256, image: np.ndarray | None = None, as_int: bool = False):
@@ -438,9 +1236,11 @@ class ImageRGBA:
         rgb_image : np.ndarray
             equalized image
         """
+        from skimage.exposure import equalize_hist
+
         if image is None:
             image = self.rgba
-        array = exposure.equalize_hist(image, n_bins)
+        array = equalize_hist(image, n_bins)
         if as_int:
             return (array * 255).astype(np.uint8)
         return array
@@ -469,14 +1269,96 @@ class ImageRGBA:
         rgb_image : np.ndarray
             equalized image
         """
+        from skimage.exposure import equalize_adapthist
+
         if image is None:
             image = self.rgba
-        array = exposure.equalize_adapthist(image, nbins=n_bins, clip_limit=clip_limit)
+        array = equalize_adapthist(image, nbins=n_bins, clip_limit=clip_limit)
         if as_int:
             return (array * 255).astype(np.uint8)
         return array
 
-    def contrast_stretching(self, in_range="image", image: np.ndarray | None = None, as_int: bool = False):
+    def adaptive_histogram_tiled(
+        self,
+        clip_limit: float = 0.01,
+        n_bins: int = 256,
+        image: np.ndarray | None = None,
+        kernel_size: ty.Union[int, ty.Tuple[int, int]] | None = None,
+        mode: str = "channels",
+        n_jobs: int | None = None,
+    ) -> np.ndarray:
+        """Contrast Limited Adaptive Histogram Equalization of uint8 image, processed in parallel blocks of tiles.
+
+        Unlike `adaptive_histogram`, the alpha channel is never modified and the image stays in uint8.
+
+        Parameters
+        ----------
+        clip_limit : float, optional
+            image clipping limit, normalized between 0 and 1 (higher values give more contrast)
+        n_bins : int, optional
+            number of gray bins for histogram (at most 256)
+        image : Optional[np.ndarray]
+            uint8 image array, if one is not provided, the `rgba` attribute will be used instead
+        kernel_size : Union[int, Tuple[int, int]], optional
+            shape of the contextual regions - if None, 1/8 of image height and width is used
+        mode : str
+            if `channels`, each color channel is equalized independently, if `luminance`, the luminance of the image
+            is equalized and color channels are scaled accordingly, which preserves the hue
+        n_jobs : int, optional
+            number of threads - if None, the value specified when creating the object is used instead
+
+        Returns
+        -------
+        rgb_image : np.ndarray
+            uint8 equalized image
+        """
+        if image is None:
+            image = self.rgba
+        if image.dtype != np.uint8:
+            raise ValueError("Tiled adaptive histogram equalization only supports uint8 images")
+        if mode not in ("channels", "luminance"):
+            raise ValueError(f"Mode should be either `channels` or `luminance` (not {mode})")
+        if not 1 < n_bins <= 256:
+            raise ValueError(f"Number of bins should be between 2 and 256 (not {n_bins})")
+        if kernel_size is None:
+            kernel_size = (max(image.shape[0] // 8, 1), max(image.shape[1] // 8, 1))
+        elif isinstance(kernel_size, int):
+            kernel_size = (kernel_size, kernel_size)
+        n_jobs = self.n_jobs if n_jobs is None else self._get_n_jobs(n_jobs)
+
+        def _equalize(channel: np.ndarray) -> np.ndarray:
+            return _equalize_adapthist(channel, kernel_size, clip_limit, n_bins, executor, n_jobs)
+
+        executor = ThreadPoolExecutor(n_jobs) if n_jobs > 1 else None
+        try:
+            if image.ndim == 2:
+                return _equalize(image)
+            result = image.copy()
+            n_color = min(image.shape[2], 3)
+            if mode == "channels" or n_color < 3:
+                for i in range(n_color):
+                    result[:, :, i] = _equalize(image[:, :, i])
+            else:
+                rgb = image[:, :, :3].astype(np.float32)
+                luminance = np.round(rgb @ np.asarray([0.299, 0.587, 0.114], dtype=np.float32))
+                equalized = _equalize(luminance.astype(np.uint8)).astype(np.float32)
+                ratio = np.divide(equalized, luminance, out=np.zeros_like(luminance), where=luminance > 0)
+                rgb *= ratio[:, :, None]
+                rgb[luminance == 0] = equalized[luminance == 0, None]
+                result[:, :, :3] = np.clip(np.round(rgb), 0, 255)
+            return result
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def contrast_stretching(
+        self,
+        in_range="image",
+        image: np.ndarray | None = None,
+        as_int: bool = False,
+        exclude_alpha: bool = True,
+        n_samples: int | None = 1_000_000,
+    ):
         """Contrast Limited Adaptive Histogram Equalization.
 
         Locally enhance contrast of a RGBA image. The algorithm computes histograms over different tile regions of
@@ -491,22 +1373,189 @@ class ImageRGBA:
             image array, if one is not provided, the `rgba` attribute will be used instead
         as_int : bool, optional
             if ``True`` the returned array will be multiplied by 255 and converted to uint8
+        exclude_alpha : bool
+            if `True`, the alpha channel of RGBA image is not used to compute the quantiles
+        n_samples : int, optional
+            maximum number of values used to estimate quantiles of float images - integer images always use exact
+            histogram-based quantiles
 
         Returns
         -------
         rgb_image : np.ndarray
             equalized image
         """
+        from skimage.exposure import rescale_intensity
+
         if image is None:
             image = self.rgba
         if isinstance(in_range, tuple):
-            q1, q2 = np.quantile(image, in_range)
+            q1, q2 = self.get_quantiles(image, in_range, exclude_alpha, n_samples)
             in_range = (q1, q2)
-        array = exposure.rescale_intensity(image, in_range)
+        array = rescale_intensity(image, in_range)
         if as_int:
             return (array * 255).astype(np.uint8)
         return array
 
+    def get_hover_data(self, factor: int = 1) -> ty.Dict[str, np.ndarray]:
+        """Generate compact hover data for the composite image.
+
+        Parameters
+        ----------
+        factor : int
+            downsampling factor - each `factor` x `factor` block of pixels is averaged
+
+        Returns
+        -------
+        data : Dict[str, np.ndarray]
+            dictionary with float32 total `intensity` (of all channels), dominant channel id (`dominant`) and uint8
+            normalized intensity of each visible flat channel (`channel_0`, `channel_1`, ...). Hidden channels are
+            skipped so they are never reported as dominant
+        """
+        if factor < 1:
+            raise ValueError("Downsampling factor must be positive")
+        data = {"intensity": downsample_image(self.intensities, factor, np.float32)}
+        maximum, dominant = None, None
+        for i, intensity in enumerate(self._intensities):
+            if intensity.ndim != 2 or not self._visible[i]:
+                continue
+            channel = np.asarray(intensity)
+            if factor > 1 or channel.dtype != np.uint8:
+                channel = np.round(downsample_image(channel, factor)).astype(np.uint8)
+            data[f"channel_{i}"] = channel
+            if maximum is None:
+                maximum = channel.copy()
+                dominant = np.full(channel.shape, i, dtype=np.min_scalar_type(len(self._intensities)))
+            else:
+                mask = channel > maximum
+                np.copyto(maximum, channel, where=mask)
+                dominant[mask] = i
+        if dominant is not None:
+            data["dominant"] = dominant
+        return data
+
+    def get_histogram(self, image: np.ndarray | None = None) -> np.ndarray:
+        """Compute histogram of each channel of uint8 image.
+
+        Parameters
+        ----------
+        image : Optional[np.ndarray]
+            uint8 image array, if one is not provided, the `rgba` attribute will be used instead
+
+        Returns
+        -------
+        histogram : np.ndarray
+            array of shape (n_channels, 256) with the number of occurrences of each value in each channel
+        """
+        if image is None:
+            return self._get_cached(("histogram",), lambda: self._get_histogram(self.rgba))
+        return self._get_histogram(image)
+
+    @staticmethod
+    def _get_histogram(image: np.ndarray) -> np.ndarray:
+        """Compute histogram of each channel of uint8 image."""
+        if image.dtype != np.uint8:
+            raise ValueError("Histogram can only be computed for uint8 images")
+        image = image.reshape(*image.shape[:2], -1)
+        return np.stack([np.bincount(image[:, :, i].ravel(), minlength=256) for i in range(image.shape[2])])
+
+    def get_lut(
+        self,
+        steps: ty.List[ty.Union[str, ty.Tuple[str, ty.Dict]]],
+        image: np.ndarray | None = None,
+        per_channel: bool = False,
+        exclude_alpha: bool = True,
+    ) -> np.ndarray:
+        """Build single lookup table from one or more contrast enhancement steps.
+
+        Each step is computed from the histogram of the result of the previous step, which is derived from the
+        original histogram, so the image itself is only read once.
+
+        Parameters
+        ----------
+        steps : List[Union[str, Tuple[str, Dict]]]
+            list of contrast steps, each specified as name or tuple of name and keyword arguments, e.g.
+            `[("quantile_rescale", {"q_low": 0.05, "q_high": 0.95}), "equalize_histogram"]`. Available steps are
+            `equalize_histogram`, `quantile_rescale` and `contrast_stretching`
+        image : Optional[np.ndarray]
+            uint8 image array, if one is not provided, the `rgba` attribute will be used instead
+        per_channel : bool
+            if `True`, each channel gets its own lookup table, otherwise single lookup table is computed from the
+            histogram of all (color) channels, which preserves the hue of the image
+        exclude_alpha : bool
+            if `True`, the alpha channel of RGBA image is left unchanged
+
+        Returns
+        -------
+        lut : np.ndarray
+            uint8 array of shape (n_channels, 256)
+        """
+        histogram = self.get_histogram(image).copy()
+        n_channels = histogram.shape[0]
+        n_color = 3 if exclude_alpha and n_channels == 4 else n_channels
+        lut = np.tile(np.arange(256, dtype=np.uint8), (n_channels, 1))
+        for step in steps:
+            name, kwargs = (step, {}) if isinstance(step, str) else step
+            if name not in LUT_STEPS:
+                raise ValueError(f"Unknown contrast step `{name}`. Available steps: {', '.join(LUT_STEPS)}")
+            func = LUT_STEPS[name]
+            if per_channel:
+                step_lut = np.stack([func(counts, **kwargs) for counts in histogram[:n_color]])
+            else:
+                step_lut = np.tile(func(histogram[:n_color].sum(axis=0), **kwargs), (n_color, 1))
+            for i in range(n_color):
+                # chain lookup tables and remap histogram to reflect the result of this step
+                lut[i] = step_lut[i][lut[i]]
+                histogram[i] = np.bincount(step_lut[i], weights=histogram[i], minlength=256)
+        return lut
+
+    @staticmethod
+    def apply_lut(image: np.ndarray, lut: np.ndarray) -> np.ndarray:
+        """Apply lookup table to each channel of uint8 image.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            uint8 image array
+        lut : np.ndarray
+            uint8 array of shape (n_channels, 256)
+
+        Returns
+        -------
+        image : np.ndarray
+            uint8 image after applying the lookup table
+        """
+        if image.dtype != np.uint8:
+            raise ValueError("Lookup table can only be applied to uint8 images")
+        if image.ndim == 2:
+            return lut[0][image]
+        if lut.shape != (image.shape[2], 256):
+            raise ValueError("Lookup table must have one row of 256 values for each channel")
+        result = np.empty_like(image)
+        for i in range(image.shape[2]):
+            np.take(lut[i], image[:, :, i], out=result[:, :, i], mode="clip")
+        return result
+
+    def apply_contrast(
+        self,
+        steps: ty.List[ty.Union[str, ty.Tuple[str, ty.Dict]]],
+        image: np.ndarray | None = None,
+        per_channel: bool = False,
+        exclude_alpha: bool = True,
+    ) -> np.ndarray:
+        """Apply one or more contrast enhancement steps to uint8 image using single lookup table.
+
+        This is the uint8 counterpart of `equalize_histogram`, `quantile_rescale` and `contrast_stretching` which
+        never converts the image to float. See `get_lut` for description of the parameters.
+
+        Returns
+        -------
+        rgb_image : np.ndarray
+            uint8 image after contrast enhancement
+        """
+        if image is None:
+            image = self.rgba
+        return self.apply_lut(image, self.get_lut(steps, image, per_channel, exclude_alpha))
+
     def get_colormap(self, image_id: int, n_bins: int = 256, name: str = "colormap"):
         """Create linear colormap.
 
@@ -524,15 +1573,18 @@ class ImageRGBA:
         colormap : ListedColormap
             colormap
         """
-        if image_id > len(self._images) - 1:
+        if image_id > len(self._intensities) - 1:
             raise ValueError("Tried to retrieve image that is not present")
 
-        color = self._convert_color(self._colors[image_id])
-        lin_range = np.linspace(0, 1.0, n_bins)
-        array = np.zeros((n_bins, len(color)))
-        array[:, 0] = lin_range * color[0]
-        array[:, 1] = lin_range * color[1]
-        array[:, 2] = lin_range * color[2]
+        def _get_colormap():
+            from matplotlib.colors import ListedColormap
+
+            color = self._convert_color(self._colors[image_id])
+            lin_range = np.linspace(0, 1.0, n_bins)
+            array = np.zeros((n_bins, len(color)))
+            array[:, 0] = lin_range * color[0]
+            array[:, 1] = lin_range * color[1]
+            array[:, 2] = lin_range * color[2]
+            return ListedColormap(array, name)
 
-        colormap = ListedColormap(array, name)
-        return colormap
+        return self._get_cached(("colormap", image_id, n_bins, name), _get_colormap)
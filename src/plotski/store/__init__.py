@@ -4,12 +4,14 @@ import os
 import typing as ty
 import warnings
 import webbrowser
+from contextlib import contextmanager
 
 import numpy as np
+from bokeh.embed import file_html
 from bokeh.io import save
 from bokeh.layouts import column, gridplot, row
-from bokeh.models import ColumnDataSource
-from koyo.secret import get_unique_str
+from bokeh.models import ColumnDataSource, Range1d
+from bokeh.resources import CDN
 
 try:
     from bokeh.models import TabPanel
@@ -22,15 +24,42 @@ except ImportError:
     from bokeh.models.widgets import Tabs
 
 from plotski.base import Plot
-from plotski.image import PlotImage, PlotImageRGBA
+from plotski.image import PlotImage, PlotImageEncoded, PlotImageRGBA, PlotImageRGBAEncoded, PlotImageSparse
+from plotski.profiling import Profiler, activate_profiler, get_active_profiler, profile_phase
+from plotski.rgb import ImageRGBA
 from plotski.scatter import PlotScatter
 from plotski.spectrum.plot import PlotCentroid, PlotMultiLine, PlotSpectrum
 from plotski.store.containers import Column, Container, Grid, Individual, Row
+from plotski.store.report import get_size_report
+from plotski.utilities import (
+    convert_colormap_to_mapper,
+    crop_to_extent,
+    get_data_nbytes,
+    get_image_extent,
+    get_label_contours,
+    get_nonempty_mask,
+    get_sample,
+    trim_image,
+)
 
 # TODO: add repr that shows the layout of the store e.g. tab 1 \ plot 1 plot 2 plot 3; tab 2 \ plot 1 plot 2 plot 3
 # TODO: add option to annotate spectrum and heatmap with rois and/or peaks
 
 
+def _crop_hover(kwargs: ty.Dict, extent: ty.Sequence[float], new_extent: ty.Sequence[float]):
+    """Crop `hover_image` and/or `hover_data` (which cover the original image) after the image was trimmed."""
+    hover_extent = None
+    if kwargs.get("hover_image", None) is not None:
+        kwargs["hover_image"], hover_extent = crop_to_extent(kwargs["hover_image"], extent, new_extent)
+    if kwargs.get("hover_data", None) is not None:
+        hover_data = {}
+        for key, value in kwargs["hover_data"].items():
+            hover_data[key], hover_extent = crop_to_extent(value, extent, new_extent)
+        kwargs["hover_data"] = hover_data
+    if hover_extent is not None:
+        kwargs["hover_extent"] = hover_extent
+
+
 class PlotStore:
     """Main class that is responsible for managing all plots that should be exported to static HTML document."""
 
@@ -44,6 +73,8 @@ class PlotStore:
 
         # store of figures
         self.tabs: ty.Dict[str, ty.Dict[str, Container[Plot]]] = {}
+        # next index to try for each (tab, basename) pair so unique names are found without probing from 0
+        self._name_counters: ty.Dict[ty.Tuple[str, str], int] = {}
 
     def __repr__(self) -> str:
         """Print."""
@@ -135,20 +166,21 @@ class PlotStore:
             tab_contents = self.tabs[tab_name]
             _tab_contents = []
             # iterate over each object specified in the tab
-            for _item_name, item_contents in tab_contents.items():
-                # items can be specified as an 'item' (single element)
-                figures = unpack_figures()
-                if isinstance(item_contents, Individual):
-                    _tab_contents.extend(figures)
-                # row (multiple elements in a row)
-                elif isinstance(item_contents, Row):
-                    _tab_contents.append(row(figures))
-                # column (multiple elements in a column)
-                elif isinstance(item_contents, Column):
-                    _tab_contents.append(column(figures))
-                # grid (multiple elements in a grid):
-                elif isinstance(item_contents, Grid):
-                    _tab_contents.append(gridplot(figures, ncols=item_contents.n_cols))
+            with profile_phase("tab", "layout", tab=tab_name):
+                for _item_name, item_contents in tab_contents.items():
+                    # items can be specified as an 'item' (single element)
+                    figures = unpack_figures()
+                    if isinstance(item_contents, Individual):
+                        _tab_contents.extend(figures)
+                    # row (multiple elements in a row)
+                    elif isinstance(item_contents, Row):
+                        _tab_contents.append(row(figures))
+                    # column (multiple elements in a column)
+                    elif isinstance(item_contents, Column):
+                        _tab_contents.append(column(figures))
+                    # grid (multiple elements in a grid):
+                    elif isinstance(item_contents, Grid):
+                        _tab_contents.append(gridplot(figures, ncols=item_contents.n_cols))
 
             if not _tab_contents:
                 print("Tab was empty - not adding it into the HTML document")
@@ -162,7 +194,7 @@ class PlotStore:
 
         return Tabs(tabs=panels)
 
-    def save(self, filepath=None, show=True, **kwargs) -> str:
+    def save(self, filepath=None, show=True, report: bool = False, **kwargs) -> ty.Union[str, ty.Tuple[str, ty.Dict]]:
         """Save Bokeh document as HTML file.
 
         Parameters
@@ -171,21 +203,102 @@ class PlotStore:
             path where to save the HTML document
         show : bool
             if 'True', newly generated document will be shown in the browser
+        report : bool
+            if 'True', size report of the saved document (see `size_report`) is returned together with the path
         kwargs :
             parameters to be passed on to the 'get_layout' function
+
+        Returns
+        -------
+        filepath : str
+            path to the HTML document
+        report : dict
+            size report, only returned if `report=True`
         """
         if filepath is None:
             filepath = os.path.join(self.output_dir, self.filename)
 
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore")
-            save(self.get_layout(**kwargs), filepath, title=self.document_title)
+            with profile_phase("get_layout", "save"):
+                layout = self.get_layout(**kwargs)
+            with profile_phase("serialize", "save", filepath=filepath):
+                save(layout, filepath, title=self.document_title)
 
         # open figure in browser
         if show:
             webbrowser.open_new_tab(filepath)
+        report_data = None
+        if report:
+            report_data = get_size_report(self, layout, os.path.getsize(filepath), kwargs.get("tab_names", None))
+        self._release_layout(layout)
+        if report:
+            return filepath, report_data
         return filepath
 
+    def size_report(self, tab_names: ty.List[str] | None = None, top_n: int = 10, **kwargs) -> ty.Dict[str, ty.Any]:
+        """Attribute bytes of the exported HTML document to each tab, layout, plot, data source and column.
+
+        Parameters
+        ----------
+        tab_names : list, optional
+            list of tab names which should be included in the document
+        top_n : int
+            number of the largest columns and the top offenders to report
+        kwargs :
+            parameters to be passed on to the 'get_size_report' function e.g. `min_bytes` and `image_bytes`
+
+        Returns
+        -------
+        report : dict
+            size report with `total_bytes`, `document_bytes` and `resources_bytes` (fixed Bokeh resources and HTML
+            template), nested `tabs` -> `layouts` -> `plots` -> `sources` -> `columns` sizes, the `top_columns` and
+            the `offenders` (float64 columns that could be float32, duplicated arrays and oversized images)
+        """
+        if isinstance(tab_names, str):
+            tab_names = [tab_names]
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            layout = self.get_layout(tab_names)
+            total_bytes = len(file_html(layout, CDN, self.document_title).encode())
+        report = get_size_report(self, layout, total_bytes, tab_names, top_n=top_n, **kwargs)
+        self._release_layout(layout)
+        return report
+
+    @staticmethod
+    def _release_layout(layout) -> None:
+        """Remove exported layout from its document so the plots can be exported again."""
+        if layout.document is not None:
+            layout.document.remove_root(layout)
+
+    @contextmanager
+    def profile(self, callback: ty.Callable[[ty.Dict], None] | None = None):
+        """Record wall and CPU time of each plot construction phase, tab layout and save within the `with` block.
+
+        Parameters
+        ----------
+        callback : Callable, optional
+            function called with each event as soon as it is recorded
+
+        Yields
+        ------
+        profiler : Profiler
+            profiler which can export the timings using `to_dict`, `to_json` or `to_chrome_trace`
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> x = np.arange(10)
+        >>> y = np.arange(10)
+        >>> store = PlotStore("")
+        >>> with store.profile() as profiler:
+        ...     _, _, plot = store.plot_spectrum("plot", dict(x=x, y=y))
+        >>> profiler.summary()["phases"]["plot:get_figure"]["count"]
+        1
+        """
+        with activate_profiler(Profiler(callback)) as profiler:
+            yield profiler
+
     def get_unique_name(self, tab_name: str, basename: str = "item"):
         """Get unique name for an item in specific tab. Names are made unique by adding #NUMBER+1 itself.
 
@@ -201,9 +314,12 @@ class PlotStore:
         unique_name : str
             unique name for the item in the tab
         """
-        i = 0
-        while f"{basename} #{i}" in self.tabs[tab_name]:
+        tab, key = self.tabs[tab_name], (tab_name, basename)
+        i = self._name_counters.get(key, 0)
+        # the name is only reserved once the item is added so the counter points at the returned (free) index
+        while f"{basename} #{i}" in tab:
             i += 1
+        self._name_counters[key] = i
         return f"{basename} #{i}"
 
     def add_tab(self, tab_name: str, override=False) -> str:
@@ -233,6 +349,7 @@ class PlotStore:
                 " override current container."
             )
         self.tabs[tab_name] = {}
+        self._name_counters = {key: value for key, value in self._name_counters.items() if key[0] != tab_name}
         return tab_name
 
     def add_tabs(self, tab_names: ty.List[str], override=False):
@@ -311,8 +428,7 @@ class PlotStore:
         assert tab_name in self.tabs
 
         grid_name = self.get_unique_name(tab_name, "grid")
-        grid = Grid()
-        grid.n_cols = n_cols
+        grid = Grid(n_cols=n_cols)
         self.tabs[tab_name][grid_name] = grid
         return grid_name
 
@@ -332,9 +448,14 @@ class PlotStore:
         if layout_name not in self.tabs[tab_name]:
             self.tabs[tab_name][layout_name] = Individual()
 
+        from koyo.secret import get_unique_str
+
         # set the plot name
         plot.name = get_unique_str()
         self.tabs[tab_name][layout_name].append(plot)
+        profiler = get_active_profiler()
+        if profiler is not None:
+            profiler.assign(plot, plot=plot.name, tab=tab_name, layout=layout_name)
         return plot
 
     def plot_scatter(self, tab_name, data: ty.Dict, layout_name=None, **kwargs):
@@ -538,7 +659,16 @@ class PlotStore:
         self.append_item(tab_name, layout_name, plot)
         return tab_name, layout_name, plot
 
-    def plot_image(self, tab_name, data: ty.Dict, layout_name=None, **kwargs):
+    def plot_image(
+        self,
+        tab_name,
+        data: ty.Dict,
+        layout_name=None,
+        trim: bool = False,
+        sparse_fraction: float | None = None,
+        encode: str | None = None,
+        **kwargs,
+    ):
         """Adds image to the plot store.
 
         Parameters
@@ -554,8 +684,23 @@ class PlotStore:
             will be added as 'item #0', if there is one then it will be added as 'item #1' etc. Sometimes you might want
             to add it to a 'row' or 'column' for which you have name - you can specify its name here and if its present
             the plot object will be added to that container
+        trim : bool
+            if 'True', the image will be cropped to the bounding box of non-zero (and non-NaN) pixels. The `x`, `y`,
+            `dw` and `dh` fields are updated so the image remains in the same position
+        sparse_fraction : float, optional
+            if the fraction of non-empty pixels is at most this value (e.g. 0.1), only the coordinates and intensities
+            of the non-empty pixels are embedded in the document and the image is drawn by the browser as rectangles
+        encode : str, optional
+            if specified ('png' or 'webp'), the image is color-mapped in Python and embedded as losslessly compressed
+            data URI. Hover is backed by separate float32 image - use `hover_factor` to reduce its size. Cannot be
+            combined with `sparse_fraction`
         kwargs :
             dictionary containing plot parameters e.g. x/y axis labels, title, etc...
+            Hover can be backed by a smaller grid than the displayed image by specifying `hover_image` (array covering
+            the same extent, cropped together with the image when using `trim`), `hover_factor` (block size used to
+            downsample the image) and/or `hover_dtype`.
+            Colormap limits can be estimated from percentiles of a subsample of the image by specifying `z_percentiles`
+            (e.g. `(1, 99)`) and `z_samples` (maximum number of sampled values).
 
         Returns
         -------
@@ -564,39 +709,76 @@ class PlotStore:
         item_name : str
             name of the plot
         plot : PlotImage
-            plot object
+            plot object. The number of bytes before and after trimming/sparse encoding is reported in its
+            `metadata["encoding"]` field
         """
+        if encode is not None and sparse_fraction is not None:
+            raise ValueError("Cannot use `encode` together with `sparse_fraction`")
         self.check_tab(tab_name)
         self.check_data(data, ("image",))
         # Bokeh expects nested list to plat an image
         if isinstance(data["image"], np.ndarray):
             data["image"] = [data["image"]]
 
+        original_bytes = get_data_nbytes(data)
+        if trim:
+            extent, data = get_image_extent(data), trim_image(data)
+            _crop_hover(kwargs, extent, get_image_extent(data))
+        mode, klass = "trim" if trim else "dense", PlotImage
+        if sparse_fraction is not None and np.mean(get_nonempty_mask(data["image"][0])) <= sparse_fraction:
+            mode, klass = "sparse", PlotImageSparse
+        if encode is not None:
+            mode, klass = encode, PlotImageEncoded
+            kwargs["encode"] = encode
+
         source = ColumnDataSource(data)
-        plot = PlotImage(self.output_dir, source=source, **kwargs)
+        plot = klass(self.output_dir, source=source, **kwargs)
+        self.set_encoding_report(plot, mode, original_bytes)
 
         # add figure object to tab
         layout_name = layout_name if layout_name is not None else self.get_unique_name(tab_name)
         self.append_item(tab_name, layout_name, plot)
         return tab_name, layout_name, plot
 
-    def plot_rgb_image(self, tab_name, data: ty.Dict, layout_name=None, **kwargs):
+    def plot_rgb_image(
+        self,
+        tab_name,
+        data: ty.Union[ty.Dict, ImageRGBA],
+        layout_name=None,
+        trim: bool = False,
+        hover_factor: int = 1,
+        encode: str | None = None,
+        **kwargs,
+    ):
         """Adds RGBA image to the plot store.
 
         Parameters
         ----------
         tab_name : str
             name of the tab where plot should be added to
-        data : dict
+        data : Union[dict, ImageRGBA]
             dictionary containing appropriate plot fields
             in this case:
                 image = 3D array
-            the 'image' item must be embedded in a list otherwise you will be greeted with nasty exception
+            the 'image' item must be embedded in a list otherwise you will be greeted with nasty exception.
+            If `ImageRGBA` is specified instead, the composite image is placed at (0, 0) and compact hover data (total
+            intensity, dominant channel id and normalized intensity of each channel) is generated automatically. Names
+            of the channels can be specified using the `hover_labels` keyword
         layout_name : str
             by default, plot objects are added to the tab in iterative way (e.g. if there are no plots in the tab, it
             will be added as 'item #0', if there is one then it will be added as 'item #1' etc. Sometimes you might want
             to add it to a 'row' or 'column' for which you have name - you can specify its name here and if its present
             the plot object will be added to that container
+        trim : bool
+            if 'True', the image (and any other per-pixel fields) will be cropped to the bounding box of non-black
+            pixels. The `x`, `y`, `dw` and `dh` fields are updated so the image remains in the same position. Hover
+            data is cropped to the same region
+        hover_factor : int
+            downsampling factor of the hover data generated from `ImageRGBA` - the hover data is attached to separate
+            invisible image so it can have much lower resolution than the displayed image
+        encode : str, optional
+            if specified ('png' or 'webp'), the image is embedded as losslessly compressed data URI instead of raw
+            32-bit pixels
         kwargs :
             dictionary containing plot parameters e.g. x/y axis labels, title, etc...
 
@@ -607,16 +789,165 @@ class PlotStore:
         item_name : str
             name of the plot
         plot : Plot
-            plot object
+            plot object. The number of bytes before and after trimming is reported in its `metadata["encoding"]` field
         """
         self.check_tab(tab_name)
+        if isinstance(data, ImageRGBA):
+            kwargs.setdefault("hover_data", data.get_hover_data(hover_factor))
+            height, width = data.rgba.shape[:2]
+            data = {"image": [data.rgba], "x": [0], "y": [0], "dw": [width], "dh": [height]}
         self.check_data(data, ("image",))
         # Bokeh expects nested list to plat an image
         if isinstance(data["image"], np.ndarray):
             data["image"] = [data["image"]]
 
+        original_bytes = get_data_nbytes(data)
+        if trim:
+            extent, data = get_image_extent(data), trim_image(data)
+            _crop_hover(kwargs, extent, get_image_extent(data))
+
+        mode, klass = "trim" if trim else "dense", PlotImageRGBA
+        if encode is not None:
+            mode, klass = encode, PlotImageRGBAEncoded
+            kwargs["encode"] = encode
+
         source = ColumnDataSource(data)
-        plot = PlotImageRGBA(self.output_dir, source=source, **kwargs)
+        plot = klass(self.output_dir, source=source, **kwargs)
+        self.set_encoding_report(plot, mode, original_bytes)
+
+        # add figure object to tab
+        layout_name = layout_name if layout_name is not None else self.get_unique_name(tab_name)
+        self.append_item(tab_name, layout_name, plot)
+        return tab_name, layout_name, plot
+
+    @staticmethod
+    def set_encoding_report(plot: Plot, mode: str, original_bytes: int):
+        """Record how many bytes of data were saved by trimming/sparse/compressed encoding of an image.
+
+        Bytes of the separate hover image (if any) are reported in the `hover_bytes` field.
+        """
+        encoded_bytes = get_data_nbytes(plot.source.data)
+        hover = plot.plots.get("hover", None)
+        plot.metadata["encoding"] = {
+            "mode": mode,
+            "original_bytes": original_bytes,
+            "encoded_bytes": encoded_bytes,
+            "saved_bytes": original_bytes - encoded_bytes,
+            "hover_bytes": get_data_nbytes(hover.data_source.data) if hover is not None else 0,
+        }
+
+    def plot_images_batch(
+        self,
+        tab_name,
+        images: ty.List[np.ndarray],
+        titles: ty.List[str] | None = None,
+        n_cols: int | None = None,
+        share_colormapper: bool = True,
+        link_axes: bool = True,
+        **kwargs,
+    ):
+        """Adds multiple images to the plot store as a grid.
+
+        Plots in the grid can share single color mapper (and palette) as well as x/y-axis ranges, so the number of
+        models in the exported document scales with the number of images rather than with the per-figure boilerplate.
+        Toolbars of plots in the grid are merged during layout generation.
+
+        Parameters
+        ----------
+        tab_name : str
+            name of the tab where plots should be added to
+        images : List[np.ndarray]
+            list of 2D arrays
+        titles : List[str], optional
+            list of titles, one for each image
+        n_cols : int, optional
+            number of columns the grid should use during rendering
+        share_colormapper : bool
+            if 'True', all images will use the same color mapper with intensity range covering all images unless
+            `z_min` and/or `z_max` are specified. If `z_percentiles` is specified, the range is estimated from
+            percentiles of values sampled from all images
+        link_axes : bool
+            if 'True' and all images have the same shape, all images will share the same x/y-axis ranges
+        kwargs :
+            dictionary containing plot parameters e.g. x/y axis labels, cmap, etc...
+
+        Returns
+        -------
+        tab_name : str
+            name of the tab
+        grid_name : str
+            name of the grid
+        plots : List[PlotImage]
+            list of plot objects
+        """
+        self.check_tab(tab_name)
+        if titles is not None and len(titles) != len(images):
+            raise ValueError(f"Expected {len(images)} titles but got {len(titles)}")
+
+        if share_colormapper and images:
+            kwargs.setdefault("cmap", "viridis")
+            n_samples = kwargs.get("z_samples", 100_000)
+            if kwargs.get("z_percentiles", None) is not None:
+                # the sample budget is split between all images
+                array = np.concatenate([get_sample(image, max(1, n_samples // len(images))) for image in images])
+            else:
+                array = np.asarray([[np.nanmin(image), np.nanmax(image)] for image in images])
+            kwargs["palette"], kwargs["colormapper"] = convert_colormap_to_mapper(
+                array,
+                kwargs["cmap"],
+                z_min=kwargs.get("z_min", None),
+                z_max=kwargs.get("z_max", None),
+                z_percentiles=kwargs.get("z_percentiles", None),
+                n_samples=n_samples,
+            )
+        if link_axes and len({np.shape(image) for image in images}) == 1:
+            height, width = np.shape(images[0])
+            kwargs.setdefault("x_range", Range1d(start=0, end=width))
+            kwargs.setdefault("y_range", Range1d(start=0, end=height))
+
+        grid_name = self.add_grid(tab_name, n_cols)
+        plots = []
+        for i, image in enumerate(images):
+            if titles is not None:
+                kwargs["title"] = titles[i]
+            source = ColumnDataSource({"image": [image]})
+            plots.append(self.append_item(tab_name, grid_name, PlotImage(self.output_dir, source=source, **kwargs)))
+        return tab_name, grid_name, plots
+
+    def plot_from_template(self, tab_name, template: Plot, data: ty.Dict, layout_name=None, **kwargs):
+        """Adds plot of the same type and with the same options as the `template` but showing different data.
+
+        Use it when adding many similar plots, e.g. one spectrum per sample, so the options only have to be specified
+        once. The template does not have to be added to the store itself.
+
+        Parameters
+        ----------
+        tab_name : str
+            name of the tab where plot should be added to
+        template : Plot
+            plot whose type and options should be used
+        data : dict
+            Dictionary containing the plot fields expected by the template plot class. Pre-processing done by the
+            store (e.g. `trim` or `hover_factor` of images) is not repeated.
+        layout_name : str
+            By default, plot objects are added to the tab in iterative way (e.g. if there are no plots in the tab, it
+            will be added as 'item #0', if there is one then it will be added as 'item #1' etc. Sometimes you might want
+            to add it to a 'row' or 'column' for which you have name - you can specify its name here and if its present
+            the plot object will be added to that container.
+        kwargs :
+            dictionary containing plot parameters which should replace those of the template e.g. title, x_min, etc...
+
+        Returns
+        -------
+        tab_name : str
+            name of the tab
+        item_name : str
+            name of the plot
+        plot : Plot
+            plot object
+        """
+        self.check_tab(tab_name)
+        plot = template.clone(ColumnDataSource(data), **kwargs)
 
         # add figure object to tab
         layout_name = layout_name if layout_name is not None else self.get_unique_name(tab_name)
@@ -773,6 +1104,54 @@ class PlotStore:
             raise ValueError("Cannot add box to this plot")
         plot.add_patch(data, **kwargs)
 
+    def add_label_contours(
+        self,
+        plot,
+        labels: np.ndarray,
+        tolerance: float = 0.5,
+        colors: ty.Union[str, ty.Sequence[str]] = "#FFFFFF",
+        **kwargs,
+    ):
+        """Add outlines of all regions in a label image using single multi-polygons renderer.
+
+        Outlines follow pixel edges, regions made of several parts produce several polygons and holes are retained.
+
+        Parameters
+        ----------
+        plot : Plot
+            plot object to add the outlines to. If the plot is an image, outlines will be aligned with its extent
+        labels : np.ndarray
+            2D integer array where 0 denotes background and each other value denotes a region
+        tolerance : float
+            maximum distance (in pixels) between the original and simplified outline
+        colors : Union[str, Sequence[str]]
+            either single color or one color per region (ordered by the region id)
+        kwargs :
+            dictionary containing plot parameters e.g. line width, line color, transparency, etc...
+            must be valid Bokeh fields
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> labels = np.zeros((10, 10), dtype=int)
+        >>> labels[1:4, 1:4], labels[5:9, 5:9] = 1, 2
+        >>> store = PlotStore("")
+        >>> _, _, plot = store.plot_image("plot", dict(image=labels))
+        >>> store.add_label_contours(plot, labels, colors=["red", "blue"])
+        """
+        if not hasattr(plot, "add_multi_polygons"):
+            raise ValueError("Cannot add polygons to this plot")
+        extent = dict(zip(("x", "y", "dw", "dh"), plot.extent, strict=True)) if hasattr(plot, "extent") else {}
+        data = get_label_contours(labels, tolerance, **extent)
+        if isinstance(colors, str):
+            colors = [colors] * len(data["label"])
+        if len(colors) != len(data["label"]):
+            raise ValueError(f"Expected {len(data['label'])} colors but got {len(colors)}")
+        data["color"] = list(colors)
+        kwargs.setdefault("fill_alpha", 0.0)
+        source = ColumnDataSource(data)
+        plot.add_multi_polygons(source, line_color="color", fill_color="color", **kwargs)
+
     def add_labels(self, plot, data: ty.Dict, **kwargs):
         """Add label set to an plot/image.
 
@@ -10,6 +10,9 @@ T = ty.TypeVar("T")
 class Container(ty.MutableSequence):
     """Container for figures contained in the PlotStore using `grid` layout."""
 
+    # containers are created in bulk so they don't need per-instance `__dict__`
+    __slots__ = ("_data",)
+
     def __init__(self, data: ty.Iterable = ()):
         self._data = []
         self._data.extend(data)
@@ -58,19 +61,29 @@ class Container(ty.MutableSequence):
 class Individual(Container):
     """Container for figures contained in the PlotStore without layout."""
 
+    __slots__ = ()
+
 
 class Row(Container):
     """Container for figures contained in the PlotStore using `row` layout."""
 
+    __slots__ = ()
+
 
 class Column(Container):
     """Container for figures contained in the PlotStore using `column` layout."""
 
+    __slots__ = ()
+
 
 class Grid(Container):
     """Container for figures contained in the PlotStore using `grid` layout."""
 
-    _n_cols: int | None = None
+    __slots__ = ("_n_cols",)
+
+    def __init__(self, data: ty.Iterable = (), n_cols: int | None = None):
+        super().__init__(data)
+        self._n_cols = n_cols
 
     @property
     def n_cols(self):
@@ -0,0 +1,162 @@
+"""Attribute size of the exported HTML document to tabs, layouts, plots, data sources and columns."""
+
+import hashlib
+import json
+import typing as ty
+
+import numpy as np
+from bokeh.core.serialization import Serializer
+from bokeh.models import ColumnDataSource, Model
+
+if ty.TYPE_CHECKING:
+    from plotski.base import Plot
+    from plotski.store import PlotStore
+
+
+def get_serialized_nbytes(value: ty.Any) -> int:
+    """Return number of bytes the value (model, array or column) occupies in the document JSON."""
+    serializer = Serializer(deferred=False)
+    content = serializer.serialize(value).content if isinstance(value, Model) else serializer.encode(value)
+    return len(json.dumps(content, separators=(",", ":")))
+
+
+def _iter_arrays(value) -> ty.Iterator[np.ndarray]:
+    """Iterate over arrays in a column (which can be either an array or a list of arrays e.g. images/multi-lines)."""
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        yield value
+    elif isinstance(value, (list, tuple, np.ndarray)):
+        for item in value:
+            if isinstance(item, np.ndarray) and item.dtype != object:
+                yield item
+
+
+def _get_sources(plot: "Plot") -> ty.Dict[str, ColumnDataSource]:
+    """Return data sources referenced by the plot - the main `source` and the others named after their glyph."""
+    sources: ty.Dict[str, ColumnDataSource] = {"source": plot.source}
+    for name, renderer in plot.plots.items():
+        source = getattr(renderer, "data_source", None)
+        if source is not None and source not in sources.values():
+            sources[str(name)] = source
+    for source in plot.layout.select({"type": ColumnDataSource}):
+        if source not in sources.values():
+            sources[f"source #{len(sources)}"] = source
+    return sources
+
+
+def get_size_report(
+    store: "PlotStore",
+    layout,
+    total_bytes: int,
+    tab_names: ty.List[str] | None = None,
+    top_n: int = 10,
+    min_bytes: int = 10_000,
+    image_bytes: int = 1_000_000,
+) -> ty.Dict[str, ty.Any]:
+    """Build size report of the document.
+
+    Parameters
+    ----------
+    store : PlotStore
+        store containing the plots
+    layout : Model
+        layout returned by `PlotStore.get_layout`
+    total_bytes : int
+        size of the exported HTML document
+    tab_names : list, optional
+        names of the tabs present in the layout
+    top_n : int
+        maximum number of the largest columns and offenders to report
+    min_bytes : int
+        columns smaller than this are not checked for float64 values or duplicates
+    image_bytes : int
+        image columns larger than this are flagged as oversized
+
+    Returns
+    -------
+    report : dict
+        report with `total_bytes`, `document_bytes`, `resources_bytes` (fixed Bokeh resources and HTML template),
+        nested `tabs` -> `layouts` -> `plots` -> `sources` -> `columns` sizes, the `top_columns` and the `offenders`.
+        Models shared between plots (e.g. linked ranges) are counted in each plot.
+    """
+    document_bytes = get_serialized_nbytes(layout)
+    report: ty.Dict[str, ty.Any] = {
+        "total_bytes": total_bytes,
+        "document_bytes": document_bytes,
+        "resources_bytes": max(total_bytes - document_bytes, 0),
+        "tabs": {},
+    }
+    columns, offenders, hashes = [], [], {}
+    for tab_name in tab_names if tab_names is not None else store.tab_names:
+        tab = report["tabs"][tab_name] = {"bytes": 0, "layouts": {}}
+        for layout_name, container in store.tabs[tab_name].items():
+            layout_report = tab["layouts"][layout_name] = {"bytes": 0, "plots": {}}
+            for plot in container:
+                plot_report = layout_report["plots"][plot.name] = {
+                    "plot_type": plot.plot_type,
+                    "bytes": get_serialized_nbytes(plot.layout),
+                    "sources": {},
+                }
+                layout_report["bytes"] += plot_report["bytes"]
+                for source_name, source in _get_sources(plot).items():
+                    source_report = plot_report["sources"][source_name] = {"bytes": 0, "columns": {}}
+                    for column, value in source.data.items():
+                        n_bytes = get_serialized_nbytes(value)
+                        source_report["columns"][column] = n_bytes
+                        source_report["bytes"] += n_bytes
+                        path = {
+                            "tab": tab_name,
+                            "layout": layout_name,
+                            "plot": plot.name,
+                            "source": source_name,
+                            "column": column,
+                            "bytes": n_bytes,
+                        }
+                        columns.append(path)
+                        if n_bytes >= min_bytes:
+                            offenders.extend(_check_column(path, value, hashes, image_bytes))
+            tab["bytes"] += layout_report["bytes"]
+    report["top_columns"] = sorted(columns, key=lambda item: item["bytes"], reverse=True)[:top_n]
+    report["offenders"] = sorted(offenders, key=lambda item: item["saved_bytes"], reverse=True)[:top_n]
+    return report
+
+
+def _check_column(path: ty.Dict, value, hashes: ty.Dict[str, ty.Dict], image_bytes: int) -> ty.List[ty.Dict]:
+    """Flag float64 columns, duplicated arrays and oversized images."""
+    offenders = []
+    arrays = list(_iter_arrays(value))
+    if not arrays:
+        return offenders
+    if all(array.dtype == np.float64 for array in arrays):
+        offenders.append(
+            {
+                **path,
+                "kind": "float64",
+                "saved_bytes": path["bytes"] // 2,
+                "message": "float64 values could be stored as float32",
+            }
+        )
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        digest.update(str((array.dtype, array.shape)).encode())
+        digest.update(np.ascontiguousarray(array).data)
+    original = hashes.setdefault(digest.hexdigest(), path)
+    if original is not path:
+        offenders.append(
+            {
+                **path,
+                "kind": "duplicate",
+                "saved_bytes": path["bytes"],
+                "message": f"same values as column '{original['column']}' of plot '{original['plot']}' "
+                f"in tab '{original['tab']}'",
+            }
+        )
+    if path["column"] == "image" and path["bytes"] >= image_bytes:
+        offenders.append(
+            {
+                **path,
+                "kind": "image",
+                "saved_bytes": path["bytes"] - image_bytes,
+                "message": "oversized image - consider using `trim`, `encode` or `hover_factor`",
+            }
+        )
+    return offenders
@@ -1,10 +1,16 @@
 """Various utilities."""
 
+import base64
+import io
 import random
+import typing as ty
+import warnings
+from functools import lru_cache
 
-import matplotlib.colors as colors
 import numpy as np
-from bokeh.models.mappers import LinearColorMapper
+
+if ty.TYPE_CHECKING:
+    from bokeh.models.mappers import LinearColorMapper
 
 
 def get_colormap(cmap: str):
@@ -19,7 +25,171 @@ def get_colormap(cmap: str):
         return cm.get_cmap(cmap)
 
 
-def convert_colormap_to_mapper(array, colormap="viridis", palette=None, z_min=None, z_max=None):
+def get_palette(cmap: str) -> ty.List[str]:
+    """Get palette (list of hex colors) of matplotlib colormap.
+
+    Palettes of common colormaps are precomputed (see `tools/generate_palettes.py`) so matplotlib is only imported
+    for other colormaps.
+    """
+    return list(_get_palette(cmap))
+
+
+@lru_cache(maxsize=32)
+def _get_palette(cmap: str) -> ty.Tuple[str, ...]:
+    """Get palette of the colormap as tuple so it can be cached."""
+    from plotski._palettes import PALETTES
+
+    packed = PALETTES.get(cmap, None)
+    if packed is None and cmap.endswith("_r") and cmap[:-2] in PALETTES:
+        return _get_palette(cmap[:-2])[::-1]
+    if packed is not None:
+        return tuple(f"#{packed[i : i + 6]}" for i in range(0, len(packed), 6))
+
+    from matplotlib.colors import rgb2hex
+
+    colormap = get_colormap(cmap)
+    return tuple(rgb2hex(m) for m in colormap(np.arange(colormap.N)))
+
+
+def get_sample(array: np.ndarray, n_samples: int = 100_000, seed: int = 42) -> np.ndarray:
+    """Return deterministic random subsample of the array values.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        array of any shape
+    n_samples : int
+        maximum number of values in the sample. If the array has fewer values, all of them are returned
+    seed : int
+        seed of the random number generator so the same array always produces the same sample
+
+    Returns
+    -------
+    sample : np.ndarray
+        flat array of sampled values
+    """
+    array = np.asarray(array)
+    if array.size <= n_samples:
+        return array.ravel()
+    indices = np.random.default_rng(seed).integers(0, array.size, n_samples)
+    return array[np.unravel_index(indices, array.shape)]
+
+
+def get_percentile_limits(
+    array: np.ndarray, percentiles: ty.Tuple[float, float] = (1, 99), n_samples: int = 100_000
+) -> ty.Tuple[float, float]:
+    """Estimate intensity limits from percentiles of a subsample of the array, ignoring NaNs.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        array of any shape
+    percentiles : Tuple[float, float]
+        low and high percentile in the range 0-100
+    n_samples : int
+        maximum number of values used to estimate the percentiles, which bounds the cost for very large arrays
+
+    Returns
+    -------
+    low : float
+        value of the low percentile
+    high : float
+        value of the high percentile
+    """
+    p_low, p_high = percentiles
+    if not 0 <= p_low <= p_high <= 100:
+        raise ValueError(f"Percentiles should be between 0 and 100 and in increasing order (not {percentiles})")
+    sample = get_sample(array, n_samples).astype(np.float64)
+    if np.all(np.isnan(sample)):
+        return 0.0, 0.0
+    low, high = np.nanpercentile(sample, [p_low, p_high])
+    return float(low), float(high)
+
+
+def get_histogram_quantiles(counts: np.ndarray, quantiles: ty.Iterable[float], offset: int = 0) -> ty.List[float]:
+    """Compute exact quantiles of integer values from their histogram.
+
+    Parameters
+    ----------
+    counts : np.ndarray
+        number of occurrences of each value, where the first bin corresponds to `offset`
+    quantiles : Iterable[float]
+        quantiles in the range 0-1
+    offset : int
+        value of the first bin
+
+    Returns
+    -------
+    values : List[float]
+        value of each quantile, matching the default (linear) method of `np.quantile`
+    """
+    cumulative = np.cumsum(counts)
+    n_values = int(cumulative[-1])
+    if n_values == 0:
+        raise ValueError("Cannot compute quantiles of an empty histogram")
+    result = []
+    for q in quantiles:
+        position = q * (n_values - 1)
+        index = int(np.floor(position))
+        low = np.searchsorted(cumulative, index, side="right")
+        high = np.searchsorted(cumulative, min(index + 1, n_values - 1), side="right")
+        result.append(float(offset + low + (high - low) * (position - index)))
+    return result
+
+
+def get_quantiles(
+    array: np.ndarray, quantiles: ty.Iterable[float], n_samples: int | None = 1_000_000
+) -> ty.List[float]:
+    """Compute quantiles of the array without sorting all of its values.
+
+    Quantiles of integer arrays with a small range of values (e.g. uint8 or uint16 images) are computed exactly from
+    a histogram of the values. Quantiles of other arrays are estimated from a random subsample of the values.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        array of any shape
+    quantiles : Iterable[float]
+        quantiles in the range 0-1
+    n_samples : int, optional
+        maximum number of values used to estimate quantiles of non-integer arrays - if None, all values are used
+
+    Returns
+    -------
+    values : List[float]
+        value of each quantile, matching the default (linear) method of `np.quantile`
+    """
+    array = np.asarray(array)
+    quantiles = list(quantiles)
+    if any(not 0 <= q <= 1 for q in quantiles):
+        raise ValueError(f"Quantiles should be between 0 and 1 (not {quantiles})")
+    if array.size == 0:
+        raise ValueError("Cannot compute quantiles of an empty array")
+
+    if np.issubdtype(array.dtype, np.integer):
+        if array.dtype in (np.uint8, np.uint16):
+            offset, max_value = 0, int(np.iinfo(array.dtype).max)
+        else:
+            offset, max_value = int(array.min()), int(array.max())
+        if max_value - offset <= np.iinfo(np.uint16).max:
+            # histogram is computed in chunks of rows to bound the size of temporary arrays
+            counts = np.zeros(max_value - offset + 1, dtype=np.int64)
+            step = max(1, 1_000_000 // max(1, array[0].size)) if array.ndim > 1 else array.size
+            for start in range(0, array.shape[0], step):
+                values = array[start : start + step].ravel()
+                if offset != 0:
+                    values = values.astype(np.int64) - offset
+                counts += np.bincount(values, minlength=counts.size)
+            return get_histogram_quantiles(counts, quantiles, offset)
+
+    if n_samples is not None:
+        array = get_sample(array, n_samples)
+    return [float(value) for value in np.quantile(array, quantiles)]
+
+
+def convert_colormap_to_mapper(
+    array, colormap="viridis", palette=None, z_min=None, z_max=None, z_percentiles=None, n_samples: int = 100_000
+):
     """Convert matplotlib colormap to Bokeh color mapper.
 
     Parameters
@@ -34,6 +204,12 @@ def convert_colormap_to_mapper(array, colormap="viridis", palette=None, z_min=No
         starting intensity for the colormap
     z_max : float
         final intensity for the colormap
+    z_percentiles : Tuple[float, float], optional
+        if specified (e.g. `(1, 99)`), the starting and final intensity of the colormap will be estimated from
+        percentiles of a subsample of the array rather than its minimum and maximum. Ignored if `z_min` and `z_max`
+        are specified
+    n_samples : int
+        maximum number of values used to estimate the percentiles
 
     Returns
     -------
@@ -42,15 +218,21 @@ def convert_colormap_to_mapper(array, colormap="viridis", palette=None, z_min=No
     _color_mapper : LinearColorMapper
         Bokeh colormapper
     """
-    array = np.nan_to_num(array)
-    if z_min is None:
-        z_min = np.round(np.min(array), 2)
-    if z_max is None:
-        z_max = np.round(np.max(array), 2)
+    from bokeh.models.mappers import LinearColorMapper
+
+    if z_percentiles is not None and (z_min is None or z_max is None):
+        p_min, p_max = get_percentile_limits(array, z_percentiles, n_samples)
+        z_min = np.round(p_min, 2) if z_min is None else z_min
+        z_max = np.round(p_max, 2) if z_max is None else z_max
+    if z_min is None or z_max is None:
+        array = np.nan_to_num(array)
+        if z_min is None:
+            z_min = np.round(np.min(array), 2)
+        if z_max is None:
+            z_max = np.round(np.max(array), 2)
 
     if palette is None:
-        _colormap = get_colormap(colormap)
-        _palette = [colors.rgb2hex(m) for m in _colormap(np.arange(_colormap.N))]
+        _palette = get_palette(colormap)
     else:
         _palette = palette
 
@@ -59,6 +241,474 @@ def convert_colormap_to_mapper(array, colormap="viridis", palette=None, z_min=No
     return _palette, _color_mapper
 
 
+def downsample_image(array: np.ndarray, factor: int, dtype=None) -> np.ndarray:
+    """Downsample image by averaging non-overlapping `factor` x `factor` blocks.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        2D image array
+    factor : int
+        size of the block along each dimension, edges that do not fill the entire block are averaged separately
+    dtype : np.dtype, optional
+        data type of the returned array
+
+    Returns
+    -------
+    array : np.ndarray
+        downsampled image with shape (ceil(height / factor), ceil(width / factor))
+    """
+    array = np.asarray(array, dtype=np.float64)
+    if factor > 1:
+        height, width = array.shape
+        n_rows, n_cols = -(-height // factor), -(-width // factor)
+        padded = np.full((n_rows * factor, n_cols * factor), np.nan)
+        padded[:height, :width] = array
+        # blocks consisting only of NaNs are expected and should remain NaN
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            array = np.nanmean(padded.reshape(n_rows, factor, n_cols, factor), axis=(1, 3))
+    if dtype is not None:
+        array = array.astype(dtype)
+    return array
+
+
+# direction of boundary edges (east, south, west, north) as (row, column) steps - consecutive values turn right
+_EDGE_STEPS = np.array([[0, 1], [1, 0], [0, -1], [-1, 0]], dtype=np.int64)
+
+
+def _get_boundary_edges(labels: np.ndarray) -> ty.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Return start row, start column, direction and label of every pixel edge between two different labels.
+
+    Edges are directed so that the labelled region is on their right (i.e. pixels are circled clockwise with rows
+    pointing down) and an edge separating two regions is returned once for each of them.
+    """
+    padded = np.pad(labels, 1)
+    above, below = padded[:-1, 1:-1], padded[1:, 1:-1]
+    left, right = padded[1:-1, :-1], padded[1:-1, 1:]
+    rows, cols, directions, ids = [], [], [], []
+    for region, boundary, direction, offset in (
+        (below, above != below, 0, (0, 0)),
+        (above, above != below, 2, (0, 1)),
+        (left, left != right, 1, (0, 0)),
+        (right, left != right, 3, (1, 0)),
+    ):
+        row, col = np.nonzero(boundary & (region != 0))
+        rows.append(row + offset[0])
+        cols.append(col + offset[1])
+        directions.append(np.full(row.size, direction, dtype=np.int64))
+        ids.append(region[row, col])
+    return np.concatenate(rows), np.concatenate(cols), np.concatenate(directions), np.concatenate(ids)
+
+
+def _get_boundary_rings(labels: np.ndarray) -> ty.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Trace all region boundaries at once.
+
+    Returns row and column of the vertices ordered along their rings, the number of vertices in each ring, the label
+    of each ring and its signed area (positive for outer boundaries and negative for holes). Vertices in the middle of
+    straight segments are removed.
+    """
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    rows, cols, directions, ids = _get_boundary_edges(labels)
+    n_edges = rows.size
+    if n_edges == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty, empty, labels.ravel()[:0], np.zeros(0)
+
+    # link each edge to the edge of the same label which starts where it ends, preferring right turns so that regions
+    # which only touch diagonally are traced separately
+    _, label_index = np.unique(ids, return_inverse=True)
+    n_vertices = (labels.shape[0] + 1) * (labels.shape[1] + 1)
+    base = label_index.astype(np.int64) * n_vertices
+    keys = (base + rows * (labels.shape[1] + 1) + cols) * 4 + directions
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    end_rows, end_cols = rows + _EDGE_STEPS[directions, 0], cols + _EDGE_STEPS[directions, 1]
+    end_keys = (base + end_rows * (labels.shape[1] + 1) + end_cols) * 4
+    successor = np.full(n_edges, -1, dtype=np.int64)
+    for turn in (1, 0, 3):
+        missing = np.flatnonzero(successor < 0)
+        candidate = end_keys[missing] + (directions[missing] + turn) % 4
+        index = np.minimum(np.searchsorted(sorted_keys, candidate), n_edges - 1)
+        found = sorted_keys[index] == candidate
+        successor[missing[found]] = order[index[found]]
+
+    # each ring is a cycle of the successor permutation - rank edges by their distance from the first edge of the ring
+    n_rings, ring = connected_components(
+        csr_matrix((np.ones(n_edges, dtype=np.int8), (np.arange(n_edges), successor)), shape=(n_edges, n_edges)),
+        directed=True,
+        connection="weak",
+    )
+    first = np.full(n_rings, n_edges, dtype=np.int64)
+    np.minimum.at(first, ring, np.arange(n_edges))
+    pointer, distance = successor.copy(), np.ones(n_edges, dtype=np.int64)
+    pointer[first], distance[first] = first, 0
+    while np.any(pointer[pointer] != pointer):
+        distance += distance[pointer]
+        pointer = pointer[pointer]
+    lengths = np.bincount(ring, minlength=n_rings)
+    position = (lengths[ring] - distance) % lengths[ring]
+    order = np.lexsort((position, ring))
+    rows, cols, directions, ring = rows[order], cols[order], directions[order], ring[order]
+
+    # drop vertices where the direction does not change
+    starts = np.cumsum(lengths) - lengths
+    previous = np.arange(n_edges) - 1
+    previous[starts] = starts + lengths - 1
+    keep = directions != directions[previous]
+    rows, cols, ring = rows[keep], cols[keep], ring[keep]
+    lengths = np.bincount(ring, minlength=n_rings)
+    starts = np.cumsum(lengths) - lengths
+    following = np.arange(rows.size) + 1
+    following[starts + lengths - 1] = starts
+    area = np.bincount(ring, cols * rows[following] - cols[following] * rows, minlength=n_rings) / 2
+    return rows, cols, lengths, ids[order][keep][starts], area
+
+
+def _contains(ring_rows: np.ndarray, ring_cols: np.ndarray, row: float, col: float) -> bool:
+    """Check whether point lies inside polygon using the even-odd rule."""
+    next_rows, next_cols = np.roll(ring_rows, -1), np.roll(ring_cols, -1)
+    crosses = (ring_rows > row) != (next_rows > row)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        intersect = ring_cols + (row - ring_rows) * (next_cols - ring_cols) / (next_rows - ring_rows)
+    return bool(np.count_nonzero(crosses & (col < intersect)) % 2)
+
+
+def get_label_contours(
+    labels: np.ndarray,
+    tolerance: float = 0.5,
+    x: float = 0,
+    y: float = 0,
+    dw: float | None = None,
+    dh: float | None = None,
+) -> ty.Dict[str, ty.Any]:
+    """Extract outline of every labelled region in an integer label image.
+
+    Outlines follow pixel edges and are traced for all regions at once with vectorized operations, so the cost scales
+    with the number of boundary pixels rather than with the number of regions. Regions made of several disconnected
+    parts produce one polygon per part and holes are retained, matching the `multi_polygons` glyph layout. Only the
+    (optional) polygon simplification is done ring by ring.
+
+    Parameters
+    ----------
+    labels : np.ndarray
+        2D integer array where 0 denotes background and each other value denotes a region
+    tolerance : float
+        maximum distance (in pixels) between the original and simplified contour. Use 0 to disable simplification
+    x : float
+        x-coordinate of the image origin
+    y : float
+        y-coordinate of the image origin
+    dw : float, optional
+        width of the image in data coordinates, by default it is equal to the number of columns
+    dh : float, optional
+        height of the image in data coordinates, by default it is equal to the number of rows
+
+    Returns
+    -------
+    data : dict
+        dictionary with `xs` and `ys` (for each region, list of polygons, each being list of rings - the outer boundary
+        followed by the holes) and `label` (array of region ids) fields
+    """
+    labels = np.asarray(labels)
+    if labels.ndim != 2:
+        raise ValueError("Label image must be 2D")
+    height, width = labels.shape
+    x_scale = (dw if dw is not None else width) / width
+    y_scale = (dh if dh is not None else height) / height
+
+    rows, cols, lengths, ring_labels, area = _get_boundary_rings(labels)
+    splits = np.cumsum(lengths)[:-1]
+    label_ids, ring_index = np.unique(ring_labels, return_inverse=True)
+
+    # outer boundaries are their own parents and holes belong to the outer boundary of the same region containing them
+    parent = np.arange(lengths.size)
+    outer = area > 0
+    n_outer = np.bincount(ring_index[outer], minlength=label_ids.size)
+    single = np.full(label_ids.size, -1)
+    single[ring_index[outer]] = np.flatnonzero(outer)
+    holes = np.flatnonzero(~outer)
+    parent[holes] = single[ring_index[holes]]
+    for hole in holes[n_outer[ring_index[holes]] > 1]:
+        # mid-point of the first edge of the hole cannot lie on another boundary of the same region
+        start = splits[hole - 1] if hole else 0
+        row, col = (rows[start] + rows[start + 1]) / 2, (cols[start] + cols[start + 1]) / 2
+        for candidate in np.flatnonzero(outer & (ring_labels == ring_labels[hole])):
+            if _contains(*_get_ring(rows, cols, lengths, candidate), row, col):
+                parent[hole] = candidate
+                break
+
+    if tolerance > 0:
+        rows, cols, lengths = _simplify_rings(rows, cols, lengths, tolerance)
+        splits = np.cumsum(lengths)[:-1]
+    ring_xs = np.split(x + cols * x_scale, splits)
+    ring_ys = np.split(y + rows * y_scale, splits)
+
+    # group rings by region and polygon, with the outer boundary first
+    xs = [[] for _ in label_ids]
+    ys = [[] for _ in label_ids]
+    polygons: ty.Dict[int, ty.Tuple[ty.List, ty.List]] = {}
+    for index in np.lexsort((~outer, parent, ring_index)):
+        polygon = polygons.get(parent[index])
+        if polygon is None:
+            polygon = polygons[parent[index]] = ([], [])
+            xs[ring_index[index]].append(polygon[0])
+            ys[ring_index[index]].append(polygon[1])
+        polygon[0].append(ring_xs[index])
+        polygon[1].append(ring_ys[index])
+    return {"xs": xs, "ys": ys, "label": label_ids.astype(np.int64)}
+
+
+def _get_ring(rows: np.ndarray, cols: np.ndarray, lengths: np.ndarray, index: int) -> ty.Tuple[np.ndarray, np.ndarray]:
+    """Return vertices of single ring."""
+    start = int(np.sum(lengths[:index]))
+    return rows[start : start + lengths[index]], cols[start : start + lengths[index]]
+
+
+def _simplify_rings(
+    rows: np.ndarray, cols: np.ndarray, lengths: np.ndarray, tolerance: float
+) -> ty.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Simplify closed rings with the Douglas-Peucker algorithm.
+
+    Instead of recursing into each ring separately, every iteration splits all segments of all rings (whose furthest
+    vertex is more than `tolerance` away) at once. Rings with four or fewer vertices are left unchanged.
+    """
+    n_vertices = rows.size
+    index = np.arange(n_vertices)
+    starts = np.cumsum(lengths) - lengths
+    ring = np.repeat(np.arange(lengths.size), lengths)
+    rows, cols = rows.astype(np.float64), cols.astype(np.float64)
+
+    # each ring starts with segments between its first vertex and the vertex furthest from it
+    keep = np.zeros(n_vertices, dtype=bool)
+    keep[starts] = True
+    keep[lengths[ring] <= 4] = True
+    distance = np.hypot(rows - rows[starts][ring], cols - cols[starts][ring])
+    furthest = np.lexsort((-distance, ring))[starts]
+    keep[furthest] = True
+    while True:
+        segment_start = np.maximum.accumulate(np.where(keep, index, 0))
+        # the last segment of each ring ends at its first vertex
+        segment_end = np.minimum.accumulate(np.where(keep, index, n_vertices)[::-1])[::-1]
+        segment_end = np.roll(segment_end, -1)
+        wrapped = (segment_end >= n_vertices) | (ring[np.minimum(segment_end, n_vertices - 1)] != ring)
+        segment_end[wrapped] = starts[ring[wrapped]]
+
+        d_rows, d_cols = rows[segment_end] - rows[segment_start], cols[segment_end] - cols[segment_start]
+        p_rows, p_cols = rows - rows[segment_start], cols - cols[segment_start]
+        norm = np.hypot(d_rows, d_cols)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            distance = np.where(norm > 0, np.abs(d_rows * p_cols - d_cols * p_rows) / norm, np.hypot(p_rows, p_cols))
+        distance[keep] = -1
+
+        # split each segment at its furthest vertex
+        kept = np.flatnonzero(keep)
+        segment_max = np.maximum.reduceat(distance, kept)
+        segment = np.cumsum(keep) - 1
+        candidates = np.flatnonzero((distance > tolerance) & (distance == segment_max[segment]))
+        if candidates.size == 0:
+            break
+        keep[candidates[np.unique(segment[candidates], return_index=True)[1]]] = True
+    return rows[keep], cols[keep], np.bincount(ring[keep], minlength=lengths.size)
+
+
+def get_nonempty_mask(image: np.ndarray) -> np.ndarray:
+    """Return mask of pixels that are neither zero nor NaN. For RGB(A) images, the alpha channel is ignored."""
+    image = np.asarray(image)
+    if image.ndim == 3:
+        return np.any(image[:, :, :3] != 0, axis=2)
+    return np.nan_to_num(image) != 0
+
+
+def get_image_extent(data: ty.Dict) -> ty.Tuple[float, float, float, float]:
+    """Return position (x, y) and size (dw, dh) of the image in data coordinates, defaulting to its shape in pixels."""
+    height, width = np.shape(data["image"][0])[:2]
+    return data.get("x", [0])[0], data.get("y", [0])[0], data.get("dw", [width])[0], data.get("dh", [height])[0]
+
+
+def trim_image(data: ty.Dict) -> ty.Dict:
+    """Crop image to the bounding box of the non-empty pixels while keeping its position in data coordinates.
+
+    Parameters
+    ----------
+    data : dict
+        dictionary with the `image` field (list with single 2D or 3D RGB(A) array) and optionally the `x`, `y`, `dw`
+        and `dh` fields. Any other field containing an array of the same height and width (e.g. `intensity`) is
+        cropped too
+
+    Returns
+    -------
+    data : dict
+        dictionary with cropped `image` and updated `x`, `y`, `dw` and `dh` fields. If the image is empty, only the
+        missing position fields are added
+    """
+    data = dict(data)
+    image = data["image"][0]
+    height, width = image.shape[:2]
+    x, y, dw, dh = get_image_extent(data)
+    data.update(x=[x], y=[y], dw=[dw], dh=[dh])
+    rows, cols = np.nonzero(get_nonempty_mask(image))
+    if rows.size == 0:
+        return data
+
+    row_min, row_max, col_min, col_max = rows.min(), rows.max() + 1, cols.min(), cols.max() + 1
+    for key, value in data.items():
+        if isinstance(value, list) and len(value) == 1 and np.shape(value[0])[:2] == (height, width):
+            data[key] = [value[0][row_min:row_max, col_min:col_max]]
+    x_scale, y_scale = dw / width, dh / height
+    data.update(
+        x=[x + col_min * x_scale],
+        y=[y + row_min * y_scale],
+        dw=[(col_max - col_min) * x_scale],
+        dh=[(row_max - row_min) * y_scale],
+    )
+    return data
+
+
+def crop_to_extent(
+    image: np.ndarray, extent: ty.Sequence[float], new_extent: ty.Sequence[float]
+) -> ty.Tuple[np.ndarray, ty.Tuple[float, float, float, float]]:
+    """Crop image covering `extent` (x, y, dw, dh) to the pixels overlapping the `new_extent`.
+
+    The image can have any resolution. Since the new extent does not have to be aligned with its pixels, the extent of
+    the cropped image is returned too.
+    """
+    height, width = np.shape(image)[:2]
+    x, y, dw, dh = extent
+    new_x, new_y, new_dw, new_dh = new_extent
+    x_scale, y_scale = dw / width, dh / height
+    # small tolerance so that aligned extents are not extended by a pixel due to floating point errors
+    col_min = max(int(np.floor((new_x - x) / x_scale + 1e-6)), 0)
+    col_max = min(int(np.ceil((new_x + new_dw - x) / x_scale - 1e-6)), width)
+    row_min = max(int(np.floor((new_y - y) / y_scale + 1e-6)), 0)
+    row_max = min(int(np.ceil((new_y + new_dh - y) / y_scale - 1e-6)), height)
+    cropped = image[row_min:row_max, col_min:col_max]
+    return cropped, (
+        x + col_min * x_scale,
+        y + row_min * y_scale,
+        (col_max - col_min) * x_scale,
+        (row_max - row_min) * y_scale,
+    )
+
+
+def get_sparse_pixels(
+    image: np.ndarray, x: float = 0, y: float = 0, dw: float | None = None, dh: float | None = None
+) -> ty.Dict[str, np.ndarray]:
+    """Return coordinates (pixel centers in data coordinates) and intensities of the non-empty pixels."""
+    height, width = image.shape
+    x_scale = (dw if dw is not None else width) / width
+    y_scale = (dh if dh is not None else height) / height
+    rows, cols = np.nonzero(get_nonempty_mask(image))
+    return {
+        "x": (x + (cols + 0.5) * x_scale).astype(np.float32),
+        "y": (y + (rows + 0.5) * y_scale).astype(np.float32),
+        "intensity": image[rows, cols].astype(np.float32),
+    }
+
+
+def get_data_nbytes(data: ty.Dict) -> int:
+    """Return approximate number of bytes occupied by the arrays of a data dictionary/ColumnDataSource data."""
+
+    def _get_nbytes(item) -> int:
+        # strings (e.g. data URIs) are serialized as UTF-8 rather than as fixed-width numpy strings
+        if isinstance(item, str):
+            return len(item.encode())
+        return np.asarray(item).nbytes
+
+    n_bytes = 0
+    for value in data.values():
+        if isinstance(value, list):
+            n_bytes += sum(_get_nbytes(item) for item in value)
+        else:
+            n_bytes += _get_nbytes(value)
+    return n_bytes
+
+
+def apply_color_mapper(image: np.ndarray, color_mapper: "LinearColorMapper") -> np.ndarray:
+    """Convert image to uint8 RGBA array the same way Bokeh's linear color mapper does it in the browser.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        2D image array
+    color_mapper : LinearColorMapper
+        color mapper with palette and low/high values
+
+    Returns
+    -------
+    rgba : np.ndarray
+        array of shape (height, width, 4)
+    """
+    from bokeh.models.mappers import LinearColorMapper
+
+    if not isinstance(color_mapper, LinearColorMapper):
+        raise TypeError("Only linear color mapper is supported")
+    image = np.asarray(image, dtype=np.float64)
+    palette = get_rgba_colors(list(color_mapper.palette))
+    low = np.nanmin(image) if color_mapper.low is None else color_mapper.low
+    high = np.nanmax(image) if color_mapper.high is None else color_mapper.high
+    n_colors = len(palette)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        scaled = (image - low) / (high - low) * n_colors if high > low else np.zeros_like(image)
+        index = np.clip(np.nan_to_num(np.floor(scaled)), 0, n_colors - 1).astype(np.intp)
+    rgba = palette[index]
+    for mask, color in (
+        (image < low, color_mapper.low_color),
+        (image > high, color_mapper.high_color),
+        (np.isnan(image), color_mapper.nan_color),
+    ):
+        if color is not None and np.any(mask):
+            rgba[mask] = get_rgba_colors([color])[0]
+    return rgba
+
+
+def get_rgba_colors(colors: ty.Sequence) -> np.ndarray:
+    """Convert colors to uint8 RGBA array of shape (n_colors, 4).
+
+    Hex colors (`#rrggbb` or `#rrggbbaa`), which is what palettes consist of, are parsed directly so matplotlib is
+    only imported for other colors (e.g. named colors).
+    """
+    if all(isinstance(color, str) and color.startswith("#") and len(color) in (7, 9) for color in colors):
+        packed = "".join(color[1:] if len(color) == 9 else f"{color[1:]}ff" for color in colors)
+        return np.frombuffer(bytes.fromhex(packed), dtype=np.uint8).reshape(-1, 4).copy()
+    from matplotlib.colors import to_rgba_array
+
+    return np.round(to_rgba_array(list(colors)) * 255).astype(np.uint8)
+
+
+def encode_image(image: np.ndarray, fmt: str = "png") -> str:
+    """Losslessly compress uint8 image and return it as data URI.
+
+    The image is flipped vertically since the first row is drawn at the bottom of Bokeh image glyphs but at the top
+    of PNG/WebP images.
+
+    Parameters
+    ----------
+    image : np.ndarray
+        2D (grayscale) or 3D (RGB/RGBA) uint8 image array
+    fmt : str
+        image format - `png` or `webp`
+
+    Returns
+    -------
+    uri : str
+        base64-encoded data URI
+    """
+    from PIL import Image
+
+    if fmt not in ("png", "webp"):
+        raise ValueError(f"Format should be either `png` or `webp` (not {fmt})")
+    if image.dtype != np.uint8:
+        raise ValueError("Only 8-bit images can be encoded")
+    buffer = io.BytesIO()
+    options = {"lossless": True} if fmt == "webp" else {}
+    Image.fromarray(np.ascontiguousarray(np.flipud(image))).save(buffer, format=fmt.upper(), **options)
+    return f"data:image/{fmt};base64,{base64.b64encode(buffer.getvalue()).decode()}"
+
+
 def convert_hex_to_rgb_1(hex_str, decimals=3):
     """Convert hex color to rgb in range 0-1."""
     hex_color = hex_str.lstrip("#")
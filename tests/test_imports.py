@@ -0,0 +1,78 @@
+"""Test import time of plotski."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import plotski
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+HEAVY_MODULES = ("bokeh", "matplotlib", "skimage", "numba", "koyo")
+
+CODE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": [name for name in {modules!r} if name in sys.modules]}}))
+"""
+
+
+def _run_import(statement: str, modules=HEAVY_MODULES) -> dict:
+    """Import module in fresh interpreter and return the import time and the heavy modules that were imported."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH", "")]))
+    result = subprocess.run(
+        [sys.executable, "-c", CODE.format(statement=statement, modules=modules)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    "statement, allowed, budget",
+    (
+        ("import plotski", (), 0.5),
+        ("from plotski.rgb import ImageRGBA", (), 1.0),
+        ("from plotski import PlotStore", ("bokeh",), 3.0),
+        (
+            (
+                "import numpy; from plotski.utilities import convert_colormap_to_mapper; "
+                "convert_colormap_to_mapper(numpy.ones((2, 2)), 'magma_r')"
+            ),
+            ("bokeh",),
+            3.0,
+        ),
+        (
+            (
+                "import numpy; from plotski.utilities import apply_color_mapper, convert_colormap_to_mapper, "
+                "encode_image; image = numpy.random.random((4, 4)); "
+                "encode_image(apply_color_mapper(image, convert_colormap_to_mapper(image, 'viridis')[1]))"
+            ),
+            ("bokeh",),
+            3.0,
+        ),
+    ),
+)
+def test_import_budget(statement, allowed, budget):
+    result = _run_import(statement)
+    assert set(result["modules"]) <= set(allowed)
+    assert result["elapsed"] < budget
+
+
+def test_lazy_attributes():
+    from plotski.rgb import ImageRGBA
+    from plotski.store import PlotStore
+
+    assert plotski.PlotStore is PlotStore
+    assert plotski.ImageRGBA is ImageRGBA
+    assert "CustomPlotStore" in dir(plotski)
+    with pytest.raises(AttributeError):
+        _ = plotski.NotAnAttribute
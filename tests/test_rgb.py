@@ -24,7 +24,7 @@ class TestImageRGBA:
         images = get_images(n_images)
         image_rgb = ImageRGBA(images)
         assert image_rgb
-        assert len(image_rgb._original) == len(image_rgb._images) == len(image_rgb._colors) == n_images
+        assert len(image_rgb._original) == len(image_rgb._intensities) == len(image_rgb._colors) == n_images
 
         assert "images=" in repr(image_rgb)
 
@@ -34,10 +34,20 @@ class TestImageRGBA:
         images = get_images(n_images)
         image_rgb = ImageRGBA(images, colors=[[1, 0, 0.7]] * n_images)
         assert image_rgb
-        assert len(image_rgb._original) == len(image_rgb._images) == len(image_rgb._colors) == n_images
+        assert len(image_rgb._original) == len(image_rgb._intensities) == len(image_rgb._colors) == n_images
 
         assert "images=" in repr(image_rgb)
 
+    @staticmethod
+    @pytest.mark.parametrize("dtype", (np.uint8, np.float32))
+    def test_init_dtype(dtype):
+        images = get_images(3)
+        image_rgb = ImageRGBA(images, dtype=dtype)
+        for intensity in image_rgb._intensities:
+            assert intensity.dtype == dtype
+            assert intensity.shape == (10, 10)
+        assert image_rgb.rgba.dtype == np.uint8
+
     @staticmethod
     def test_init_fails():
         with pytest.raises(ValueError):
@@ -62,7 +72,7 @@ class TestImageRGBA:
         images, colors = get_images(n_images), get_colors(n_images)
         image_rgb = ImageRGBA(images, colors)
         assert image_rgb
-        assert len(image_rgb._original) == len(image_rgb._images) == len(image_rgb._colors) == n_images
+        assert len(image_rgb._original) == len(image_rgb._intensities) == len(image_rgb._colors) == n_images
         for color in colors:
             assert color in image_rgb._colors
 
@@ -115,6 +125,14 @@ class TestImageRGBA:
         assert rgba.max() <= max_value
         assert rgba.dtype == dtype
 
+    @staticmethod
+    @pytest.mark.parametrize("n_images", (1, 3, 5))
+    def test_combine_matches_sum(n_images):
+        images = get_images(n_images)
+        image_rgb = ImageRGBA(images)
+        expected = np.clip(np.sum([image_rgb.get_one(i, False, np.float64) for i in range(n_images)], axis=0), 0, 255)
+        np.testing.assert_allclose(image_rgb.combine(dtype=np.float32)[:, :, :3], expected, atol=1)
+
     @staticmethod
     @pytest.mark.parametrize("n_images", (1, 3, 5))
     @pytest.mark.parametrize("channel", (0, 1, 2))
@@ -157,6 +175,13 @@ class TestImageRGBA:
         assert image.min() >= 0
         assert image.max() <= 255
 
+    @staticmethod
+    def test_get_quantiles_exclude_alpha():
+        image_rgb = ImageRGBA(get_images(3))
+        rgba = image_rgb.rgba
+        assert image_rgb.get_quantiles(rgba, [0.98], exclude_alpha=True) == [np.quantile(rgba[:, :, :3], 0.98)]
+        assert image_rgb.get_quantiles(rgba, [0.98], exclude_alpha=False) == [np.quantile(rgba, 0.98)]
+
     @staticmethod
     @pytest.mark.parametrize("n_images", (1, 3, 5))
     @pytest.mark.parametrize("q_low", (-0.5, 1.01))
@@ -186,8 +211,12 @@ class TestImageRGBA:
         with pytest.raises(ValueError):
             image_rgb.recolor(3, new_color)
 
+        # colors in range 0-255 are rescaled
+        image_rgb.recolor(0, (255, 51, 0))
+        assert_array_equal(image_rgb._color_vectors[0], np.asarray([1, 0.2, 0, 1], dtype=np.float32))
+
         with pytest.raises(ValueError):
-            image_rgb.recolor(0, (255, 1, 0))
+            image_rgb.recolor(0, (256, 1, 0))
 
     @staticmethod
     def test_get_one():
@@ -196,6 +225,9 @@ class TestImageRGBA:
 
         im = image_rgb.get_one(0, keep_alpha=True)
         assert im.shape[2] == 4
+        assert np.all(im[:, :, 3] == 1)
+        im = image_rgb.get_one(0, keep_alpha=True, fill_alpha=255)
+        assert np.all(im[:, :, 3] == 255)
         im = image_rgb.get_one(0, keep_alpha=False)
         assert im.shape[2] == 3
 
@@ -214,3 +246,293 @@ class TestImageRGBA:
 
         with pytest.raises(ValueError):
             image_rgb.get_colormap(2, n_bins)
+
+    @staticmethod
+    def test_recolor_incremental():
+        images = get_images(4)
+        image_rgb = ImageRGBA(images, ["#FF0000", "#00FF00", "#0000FF", "#FFFF00"])
+        _ = image_rgb.rgba
+        image_rgb.recolor(1, "#FF00FF")
+        image_rgb.recolor(2, [0.3, 0.7, 0.1])
+
+        expected = ImageRGBA(images, ["#FF0000", "#FF00FF", [0.3, 0.7, 0.1], "#FFFF00"])
+        assert_array_equal(image_rgb.rgba, expected.rgba)
+        assert_array_equal(image_rgb.combine(65535, np.uint16), expected.combine(65535, np.uint16))
+
+    @staticmethod
+    def test_set_visible():
+        images = get_images(3)
+        colors = get_colors(3)
+        image_rgb = ImageRGBA(images, colors)
+        _ = image_rgb.rgba
+        image_rgb.set_visible(1, False)
+        assert_array_equal(image_rgb.rgba, ImageRGBA([images[0], images[2]], [colors[0], colors[2]]).rgba)
+        image_rgb.set_visible(1, True)
+        assert_array_equal(image_rgb.rgba, ImageRGBA(images, colors).rgba)
+
+        with pytest.raises(ValueError):
+            image_rgb.set_visible(3, False)
+
+    @staticmethod
+    def test_add_remove_channel():
+        images = get_images(3)
+        colors = get_colors(3)
+        image_rgb = ImageRGBA(images[:2], colors[:2])
+        _ = image_rgb.rgba
+        image_rgb.add_channel(images[2], colors[2])
+        assert len(image_rgb._intensities) == len(image_rgb._colors) == 3
+        assert_array_equal(image_rgb.rgba, ImageRGBA(images, colors).rgba)
+
+        image_rgb.remove_channel(0)
+        assert len(image_rgb._intensities) == len(image_rgb._colors) == 2
+        assert_array_equal(image_rgb.rgba, ImageRGBA(images[1:], colors[1:]).rgba)
+
+        with pytest.raises(ValueError):
+            image_rgb.add_channel(np.zeros((10, 9)))
+        with pytest.raises(ValueError):
+            image_rgb.remove_channel(3)
+
+    @staticmethod
+    @pytest.mark.parametrize("n_jobs", (2, 4, -1))
+    def test_n_jobs(n_jobs):
+        images = get_images(5)
+        colors = get_colors(5)
+        expected = ImageRGBA(images, colors)
+        image_rgb = ImageRGBA(images, colors, n_jobs=n_jobs)
+        assert image_rgb.n_jobs >= 1
+        for intensity, expected_intensity in zip(image_rgb._intensities, expected._intensities, strict=True):
+            assert_array_equal(intensity, expected_intensity)
+        assert_array_equal(image_rgb.rgba, expected.rgba)
+
+    @staticmethod
+    @pytest.mark.parametrize("tile_size", (7, 64))
+    def test_combine_tiled(tmp_path, tile_size):
+        images, colors = [], get_colors(3)
+        for i, image in enumerate([np.random.rand(20, 23) for _ in range(3)]):
+            image[0, i] = np.nan
+            mmap = np.lib.format.open_memmap(
+                tmp_path / f"channel_{i}.npy", mode="w+", dtype=image.dtype, shape=(20, 23)
+            )
+            mmap[:] = image
+            images.append(mmap)
+
+        expected = ImageRGBA([np.asarray(image) for image in images], colors).rgba
+        assert_array_equal(ImageRGBA.combine_tiled(images, colors, tile_size=tile_size), expected)
+
+        rgba = ImageRGBA.combine_tiled(images, colors, path=tmp_path / "rgba.npy", tile_size=tile_size)
+        assert isinstance(rgba, np.memmap)
+        assert_array_equal(np.load(tmp_path / "rgba.npy", mmap_mode="r"), expected)
+
+        with pytest.raises(ValueError):
+            ImageRGBA.combine_tiled(images, colors[:2])
+
+    @staticmethod
+    def test_apply_contrast_matches_float_path():
+        image_rgb = ImageRGBA(get_images(3))
+        rgba = image_rgb.rgba
+        result = image_rgb.apply_contrast([("quantile_rescale", {"q_low": 0.05, "q_high": 0.9})])
+        assert result.dtype == np.uint8
+        assert_array_equal(result[:, :, 3], rgba[:, :, 3])
+        expected = image_rgb.quantile_rescale(0.05, 0.9).astype(np.float64)
+        np.testing.assert_allclose(result[:, :, :3], expected[:, :, :3], atol=1)
+
+        expected = image_rgb.equalize_histogram(image=rgba[:, :, :3]) * 255
+        np.testing.assert_allclose(image_rgb.apply_contrast(["equalize_histogram"], rgba[:, :, :3]), expected, atol=1)
+
+    @staticmethod
+    @pytest.mark.parametrize("per_channel", (True, False))
+    def test_apply_contrast_chained(per_channel):
+        image_rgb = ImageRGBA(get_images(3))
+        first = ("contrast_stretching", {"in_range": (0.1, 0.9)})
+        second = "equalize_histogram"
+        expected = image_rgb.apply_contrast([first], per_channel=per_channel)
+        expected = image_rgb.apply_contrast([second], expected, per_channel=per_channel)
+        assert_array_equal(image_rgb.apply_contrast([first, second], per_channel=per_channel), expected)
+
+        with pytest.raises(ValueError):
+            image_rgb.apply_contrast(["unknown"])
+        with pytest.raises(ValueError):
+            image_rgb.apply_lut(image_rgb.rgba.astype(np.float32), image_rgb.get_lut([second]))
+
+    @staticmethod
+    @pytest.mark.parametrize("mode", ("channels", "luminance"))
+    def test_adaptive_histogram_tiled(mode):
+        image_rgb = ImageRGBA([np.random.rand(50, 70) for _ in range(3)])
+        rgba = image_rgb.rgba
+        image = image_rgb.adaptive_histogram_tiled(0.02, image=rgba, mode=mode, kernel_size=(8, 12))
+        assert image.dtype == np.uint8
+        assert image.shape == rgba.shape
+        assert_array_equal(image[:, :, 3], rgba[:, :, 3])
+        # result does not depend on the number of threads
+        assert_array_equal(
+            image_rgb.adaptive_histogram_tiled(0.02, image=rgba, mode=mode, kernel_size=(8, 12), n_jobs=3), image
+        )
+
+        with pytest.raises(ValueError):
+            image_rgb.adaptive_histogram_tiled(mode="hsv")
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "shape, kernel_size, clip_limit, n_bins",
+        (((64, 96), None, 0.02, 256), ((101, 77), (10, 9), 0.01, 128), ((120, 90), (7, 33), 0.2, 64)),
+    )
+    def test_adaptive_histogram_tiled_matches_skimage(shape, kernel_size, clip_limit, n_bins):
+        from skimage import exposure
+
+        image = (np.random.default_rng(0).random(shape) ** 2 * 200).astype(np.uint8)
+        expected = exposure.equalize_adapthist(image, kernel_size=kernel_size, clip_limit=clip_limit, nbins=n_bins)
+        result = ImageRGBA(get_images(1)).adaptive_histogram_tiled(
+            clip_limit, image=image, kernel_size=kernel_size, n_bins=n_bins
+        )
+        # only differs by rounding of the uint8 output
+        assert np.abs(result - expected * 255).max() < 1
+
+    @staticmethod
+    def test_adaptive_histogram_tiled_constant_channel():
+        rgba = np.zeros((40, 50, 4), dtype=np.uint8)
+        rgba[:, :, 0] = np.random.default_rng(0).integers(0, 255, (40, 50))
+        rgba[:, :, 3] = 255
+        result = ImageRGBA(get_images(1)).adaptive_histogram_tiled(image=rgba)
+        assert_array_equal(result[:, :, 1:], rgba[:, :, 1:])
+
+    @staticmethod
+    def test_cache():
+        images = get_images(2)
+        image_rgb = ImageRGBA(images, ["#FF0000", "#00FF00"])
+        intensities = image_rgb.intensities
+        assert image_rgb.intensities is intensities
+        assert not intensities.flags.writeable
+        assert image_rgb.rescale(0) is image_rgb.rescale(0)
+        colormap = image_rgb.get_colormap(0)
+        assert image_rgb.get_colormap(0) is colormap
+        histogram = image_rgb.get_histogram()
+        assert image_rgb.get_histogram() is histogram
+        info = image_rgb.cache_info()
+        assert info["hits"] == 4
+        assert info["misses"] == 4
+        assert info["size"] == 4
+        assert info["nbytes"] > 0
+
+        # recolor only invalidates colormap of that image
+        image_rgb.get_colormap(1)
+        image_rgb.recolor(0, "#0000FF")
+        assert image_rgb.get_colormap(0) is not colormap
+        assert_array_equal(image_rgb.get_colormap(0).colors[-1], [0, 0, 1])
+        assert image_rgb.intensities is intensities
+        assert image_rgb.get_histogram() is not histogram
+
+        # clipping changes the RGBA image so histogram must be recomputed
+        histogram = image_rgb.get_histogram()
+        image_rgb.clip_channel(0, 20, 100)
+        assert_array_equal(image_rgb.get_histogram(), image_rgb._get_histogram(image_rgb.rgba))
+        assert image_rgb.rescale(0) is image_rgb.rescale(0)
+
+        image_rgb.add_channel(images[0])
+        assert_array_equal(image_rgb.intensities, np.sum([*images, images[0]], axis=0))
+
+        image_rgb.clear_cache()
+        assert image_rgb.cache_info() == {"hits": 0, "misses": 0, "size": 0, "nbytes": 0}
+
+    @staticmethod
+    def test_cache_read_only():
+        image_rgb = ImageRGBA(get_images(2))
+        for array in (image_rgb.intensities, image_rgb.rescale(0)):
+            with pytest.raises(ValueError):
+                array[0, 0] = 1
+
+    @staticmethod
+    def test_cache_nbytes():
+        images = get_images(3)
+        nbytes = images[0].astype(np.float64).nbytes
+        # budget fits two rescaled channels so the least recently used one is evicted
+        image_rgb = ImageRGBA(images, cache_nbytes=2 * nbytes)
+        rescaled = image_rgb.rescale(0)
+        image_rgb.rescale(1)
+        assert image_rgb.rescale(0) is rescaled
+        image_rgb.rescale(2)
+        assert image_rgb.cache_info()["nbytes"] <= 2 * nbytes
+        assert image_rgb.rescale(0) is rescaled
+        assert image_rgb.cache_info()["misses"] == 3
+
+        image_rgb = ImageRGBA(images, cache_nbytes=0)
+        assert image_rgb.rescale(0) is not image_rgb.rescale(0)
+        assert_array_equal(image_rgb.rescale(0), image_rgb.rescale(0))
+        assert image_rgb.cache_info()["size"] == 0
+
+    @staticmethod
+    @pytest.mark.parametrize("n_jobs", (1, 3))
+    def test_combine_dominant(n_jobs):
+        images = get_images(5)
+        colors = get_colors(5)
+        image_rgb = ImageRGBA(images, colors, n_jobs=n_jobs, mode="dominant")
+        rgba = image_rgb.combine()
+        assert rgba.dtype == np.uint8
+        assert rgba.shape == (10, 10, 4)
+
+        stack = np.stack(image_rgb._intensities)
+        dominant = np.argmax(stack, axis=0)
+        palette = np.stack(image_rgb._color_vectors)
+        expected = (palette[dominant] * np.max(stack, axis=0)[:, :, None]).astype(np.uint8)
+        assert_array_equal(rgba, expected)
+        assert_array_equal(image_rgb.rgba[:, :, :3], expected[:, :, :3])
+
+        image_rgb.set_visible(int(dominant[0, 0]), False)
+        assert not np.array_equal(image_rgb.rgba[0, 0], expected[0, 0])
+        image_rgb.set_visible(int(dominant[0, 0]), True)
+
+        # hiding all images produces empty image, same as additive mode
+        for i in range(5):
+            image_rgb.set_visible(i, False)
+        assert_array_equal(image_rgb.combine(), np.zeros((10, 10, 4), dtype=np.uint8))
+        assert_array_equal(image_rgb.combine(mode="additive"), image_rgb.combine())
+        for i in range(5):
+            image_rgb.set_visible(i, True)
+
+        image_rgb.mode = "additive"
+        assert_array_equal(image_rgb.rgba, ImageRGBA(images, colors).rgba)
+        with pytest.raises(ValueError):
+            image_rgb.mode = "max"
+
+    @staticmethod
+    @pytest.mark.parametrize("mode", ("additive", "dominant"))
+    def test_from_sparse(mode):
+        rng = np.random.default_rng(0)
+        shape, n_channels, n_entries = (13, 17), 4, 100
+        rows, cols = rng.integers(0, shape[0], n_entries), rng.integers(0, shape[1], n_entries)
+        channels, values = rng.integers(0, n_channels, n_entries), rng.random(n_entries)
+        images = np.zeros((n_channels, *shape))
+        np.add.at(images, (channels, rows, cols), values)
+        colors = get_colors(n_channels)
+
+        image_rgb = ImageRGBA.from_sparse(rows, cols, channels, values, shape, colors, mode=mode, n_jobs=2)
+        expected = ImageRGBA(list(images), colors, mode=mode)
+        assert len(image_rgb._intensities) == n_channels
+        assert_array_equal(image_rgb.rgba, expected.rgba)
+        np.testing.assert_allclose(image_rgb.intensities, expected.intensities)
+        assert_array_equal(image_rgb.rescale(1), expected.rescale(1))
+        assert_array_equal(image_rgb.get_one(2), expected.get_one(2))
+
+        image_rgb.recolor(0, "#FFFFFF")
+        expected.recolor(0, "#FFFFFF")
+        assert_array_equal(image_rgb.rgba, expected.rgba)
+
+        with pytest.raises(ValueError):
+            ImageRGBA.from_sparse(rows, cols, channels, -values, shape)
+        with pytest.raises(ValueError):
+            ImageRGBA.from_sparse(rows, cols + 20, channels, values, shape)
+        with pytest.raises(ValueError):
+            ImageRGBA.from_sparse(rows, cols, channels, values, shape, colors[:2])
+        with pytest.raises(ValueError):
+            ImageRGBA.from_sparse(rows, cols, channels - 1, values, shape, colors)
+
+    @staticmethod
+    def test_from_sparse_empty_channel():
+        shape, colors = (5, 6), get_colors(3)
+        rows, cols, channels, values = [0, 1, 2], [1, 2, 3], [0, 0, 2], [1.0, 2.0, 3.0]
+        image_rgb = ImageRGBA.from_sparse(rows, cols, channels, values, shape, colors)
+        images = np.zeros((3, *shape))
+        images[channels, rows, cols] = values
+        expected = ImageRGBA(list(images), colors)
+        assert image_rgb._intensities[1].values.size == 0
+        assert_array_equal(image_rgb.rgba, expected.rgba)
+        assert_array_equal(image_rgb.get_one(1), expected.get_one(1))
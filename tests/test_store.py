@@ -1,9 +1,12 @@
 """Test imimspy.visualise.store.py"""
 
+import json
 import os
 
 import numpy as np
 import pytest
+from bokeh.models import HoverTool
+from numpy.testing import assert_array_equal
 
 try:
     from bokeh.models import Tabs
@@ -48,6 +51,33 @@ class TestPlotStore:
         item_name = store.get_unique_name(tab_name)
         assert item_name not in store.tabs
 
+    @staticmethod
+    def test_get_unique_name_counter(make_store):
+        store = make_store()
+        tab_name = "TEST"
+        store.add_tab(tab_name)
+        # name is not reserved until the item is added
+        assert store.get_unique_name(tab_name) == store.get_unique_name(tab_name) == "item #0"
+        store.tabs[tab_name]["item #1"] = containers.Individual()
+        store.tabs[tab_name][store.get_unique_name(tab_name)] = containers.Individual()
+        assert store.get_unique_name(tab_name) == "item #2"
+        names = [store.add_row(tab_name) for _ in range(1000)]
+        assert len(set(names)) == 1000 and names[-1] == "row #999"
+        assert store.get_unique_name("TEST", "item") == "item #2"
+
+        # counters are reset together with the tab
+        store.add_tab(tab_name, override=True)
+        assert store.get_unique_name(tab_name) == "item #0"
+
+    @staticmethod
+    def test_containers_have_no_dict():
+        for container in (containers.Individual(), containers.Row(), containers.Column(), containers.Grid(n_cols=2)):
+            assert not hasattr(container, "__dict__")
+        grid = containers.Grid(range(5))
+        assert grid.n_cols == 3
+        grid.n_cols = 1
+        assert grid.n_cols == 1
+
     @staticmethod
     def test_add_tab(make_store):
         store = make_store()
@@ -201,6 +231,187 @@ class TestPlotStore:
         store.plot_image(tab_name, {"image": [image]})
         assert "item #0" in store.tabs[tab_name]
 
+    @staticmethod
+    def test_add_image_hover(make_store):
+        store = make_store()
+        image = np.random.random((11, 10))
+        tab_name = "heatmap"
+        _, _, plot = store.plot_image(tab_name, {"image": [image]})
+        assert "hover" not in plot.plots
+
+        _, _, plot = store.plot_image(tab_name, {"image": [image]}, hover_factor=2, hover_dtype=np.float32)
+        hover_image = plot.plots["hover"].data_source.data["image"][0]
+        assert hover_image.shape == (6, 5)
+        assert hover_image.dtype == np.float32
+        np.testing.assert_allclose(hover_image[0, 0], image[0:2, 0:2].mean(), rtol=1e-6)
+        np.testing.assert_allclose(hover_image[-1, 0], image[-1, 0:2].mean(), rtol=1e-6)
+
+        _, _, plot = store.plot_image(tab_name, {"image": [image]}, hover_image=image[::4, ::4])
+        assert plot.plots["hover"].data_source.data["image"][0].shape == (3, 3)
+
+    @staticmethod
+    def test_add_image_trim(make_store):
+        store = make_store()
+        image = np.zeros((20, 30))
+        image[5:8, 10:20] = np.random.random((3, 10)) + 1
+        image[0, :] = np.nan
+        tab_name = "heatmap"
+        _, _, plot = store.plot_image(tab_name, {"image": [image], "dw": [60], "dh": [20]}, trim=True)
+        assert plot.source.data["image"][0].shape == (3, 10)
+        assert plot.extent == (20, 5, 20, 3)
+        assert plot.figure.x_range.start == 20 and plot.figure.x_range.end == 40
+        assert plot.metadata["encoding"]["mode"] == "trim"
+        assert plot.metadata["encoding"]["saved_bytes"] > 0
+
+        # empty image is not trimmed
+        _, _, plot = store.plot_image(tab_name, {"image": [np.zeros((5, 5))]}, trim=True)
+        assert plot.source.data["image"][0].shape == (5, 5)
+
+        # hover image (at half of the resolution) is cropped to the pixels overlapping the trimmed image
+        hover_image = np.arange(150, dtype=np.float32).reshape(10, 15)
+        _, _, plot = store.plot_image(
+            tab_name, {"image": [image], "dw": [60], "dh": [20]}, trim=True, hover_image=hover_image
+        )
+        hover = plot.plots["hover"].data_source.data
+        np.testing.assert_array_equal(hover["image"][0], hover_image[2:4, 5:10])
+        assert (hover["x"][0], hover["y"][0], hover["dw"][0], hover["dh"][0]) == (20, 4, 20, 4)
+
+    @staticmethod
+    def test_add_image_sparse(make_store):
+        store = make_store()
+        image = np.zeros((100, 100))
+        image[10:20, 10:20] = np.random.random((10, 10)) + 1
+        tab_name = "heatmap"
+        _, _, plot = store.plot_image(tab_name, {"image": [image]}, sparse_fraction=0.1)
+        assert plot.plot_type == "image-sparse"
+        assert len(plot.source.data["intensity"]) == 100
+        assert plot.source.data["x"].min() == 10.5
+        assert plot.image_shape == (100, 100)
+        assert plot.figure.x_range.end == 100
+        assert plot.kwargs["colormapper"].low == 0
+        assert plot.metadata["encoding"]["mode"] == "sparse"
+        assert plot.metadata["encoding"]["encoded_bytes"] < image.nbytes / 10
+        assert plot.source.data["intensity"].dtype == np.float32
+
+        # contours are aligned with the image extent rather than with the first pixel
+        labels = np.zeros((100, 100), dtype=np.int32)
+        labels[10:20, 40:50] = 1
+        store.add_label_contours(plot, labels, tolerance=0)
+        source, _ = list(plot.annotations.values())[-1]
+        assert np.min(source.data["xs"][0][0][0]) == 40 and np.min(source.data["ys"][0][0][0]) == 10
+
+        # dense images are not sparse-encoded
+        _, _, plot = store.plot_image(tab_name, {"image": [image + 1]}, sparse_fraction=0.1)
+        assert plot.plot_type == "image"
+        store.save(show=False)
+
+    @staticmethod
+    @pytest.mark.parametrize("encode", ("png", "webp"))
+    def test_add_image_encoded(make_store, encode):
+        store = make_store()
+        y, x = np.mgrid[:100, :120]
+        image = np.sin(x / 10) * np.cos(y / 10)
+        tab_name = "heatmap"
+        _, _, plot = store.plot_image(tab_name, {"image": [image]}, encode=encode, hover_factor=2)
+        assert plot.plot_type == "image-encoded"
+        assert "image" not in plot.source.data
+        assert plot.source.data["url"][0].startswith(f"data:image/{encode};base64,")
+        assert plot.image_shape == (100, 120)
+        assert plot.figure.x_range.end == 120
+        assert plot.plots["hover"].data_source.data["image"][0].shape == (50, 60)
+        assert plot.metadata["encoding"]["mode"] == encode
+        assert plot.metadata["encoding"]["encoded_bytes"] < image.nbytes / 2
+        store.save(show=False)
+
+        with pytest.raises(ValueError):
+            store.plot_image(tab_name, {"image": [image]}, encode=encode, sparse_fraction=0.1)
+
+    @staticmethod
+    def test_add_rgba_image_encoded(make_store):
+        store = make_store()
+        y, x = np.mgrid[:100, :120]
+        rgba = ImageRGBA([np.sin(x / 10) + 1, np.cos(y / 10) + 1])
+        tab_name = "rgba"
+        _, _, plot = store.plot_rgb_image(tab_name, rgba, encode="png", hover_factor=4)
+        assert plot.plot_type == "rgba-encoded"
+        assert plot.source.data["url"][0].startswith("data:image/png;base64,")
+        assert plot.image_shape == (100, 120, 4)
+        assert plot.plots["hover"].data_source.data["image"][0].shape == (25, 30)
+        assert plot.metadata["encoding"]["encoded_bytes"] < rgba.rgba.nbytes
+        store.save(show=False)
+
+    @staticmethod
+    def test_add_rgba_image_trim(make_store):
+        store = make_store()
+        rgba = ImageRGBA([np.pad(np.random.randint(1, 100, (10, 10)), 5)])
+        tab_name = "rgba"
+        _, _, plot = store.plot_rgb_image(tab_name, {"image": [rgba.rgba], "intensity": [rgba.intensities]}, trim=True)
+        assert plot.source.data["image"][0].shape == (10, 10, 4)
+        assert plot.source.data["intensity"][0].shape == (10, 10)
+        assert plot.extent == (5, 5, 10, 10)
+
+    @staticmethod
+    @pytest.mark.parametrize("share", (True, False))
+    def test_plot_images_batch(make_store, share):
+        store = make_store()
+        images = [np.random.random((10, 12)) * i for i in range(1, 5)]
+        tab_name = "images"
+        _, grid_name, plots = store.plot_images_batch(
+            tab_name, images, titles=[f"image {i}" for i in range(4)], share_colormapper=share, link_axes=share
+        )
+        assert len(plots) == len(store.tabs[tab_name][grid_name]) == 4
+        assert isinstance(store[tab_name][grid_name], containers.Grid)
+        mappers = {plot.plots["image"].glyph.color_mapper.id for plot in plots}
+        x_ranges = {plot.figure.x_range.id for plot in plots}
+        assert len(mappers) == len(x_ranges) == (1 if share else 4)
+        if share:
+            assert plots[0].kwargs["colormapper"].high == np.round(images[-1].max(), 2)
+            assert plots[0].figure.x_range.end == 12
+        store.save(show=False)
+
+        with pytest.raises(ValueError):
+            store.plot_images_batch(tab_name, images, titles=["image"])
+
+        _, _, plots = store.plot_images_batch(tab_name, images, z_percentiles=(0, 50), z_samples=100)
+        assert plots[0].kwargs["colormapper"].high < np.round(images[-1].max(), 2)
+
+    @staticmethod
+    def test_plot_from_template(make_store):
+        store = make_store()
+        x = np.arange(10)
+        _, _, template = store.plot_spectrum(
+            "spectra", {"x": x, "y": np.random.random(10)}, title="Sample 0", x_axis_label="m/z", width=300, x_min=2
+        )
+        _, layout_name, plot = store.plot_from_template(
+            "spectra", template, {"x": x, "y": np.random.random(10)}, title="Sample 1"
+        )
+        assert layout_name == "item #1"
+        assert type(plot) is type(template) and plot.plot_type == template.plot_type
+        assert plot.source is not template.source
+        assert plot.figure is not template.figure
+        assert plot.div_title.text == "<b>Sample 1</b>"
+        assert plot.figure.xaxis.axis_label == "m/z"
+        assert plot.figure.width == 300
+        assert plot.kwargs["x_min"] == 2
+
+        # options derived from data are recomputed
+        _, _, template = store.plot_image("heatmap", {"image": [np.random.random((10, 10))]}, cmap="magma")
+        _, _, plot = store.plot_from_template("heatmap", template, {"image": [np.random.random((5, 5)) * 10]})
+        assert plot.kwargs["cmap"] == "magma"
+        assert plot.kwargs["colormapper"] is not template.kwargs["colormapper"]
+        assert plot.kwargs["colormapper"].high > template.kwargs["colormapper"].high
+
+        # hover data belongs to the template's image and is not reused
+        image = np.random.random((10, 10))
+        _, _, template = store.plot_image("heatmap", {"image": [image]}, hover_image=image[::2, ::2], trim=True)
+        _, _, plot = store.plot_from_template("heatmap", template, {"image": [np.random.random((5, 5))]})
+        assert "hover_image" not in plot.kwargs and "hover_extent" not in plot.kwargs
+        _, _, template = store.plot_rgb_image("rgba", ImageRGBA([image, image]), encode="webp")
+        _, _, plot = store.plot_from_template("rgba", template, {"image": [ImageRGBA([image]).rgb]})
+        assert type(plot) is type(template) and plot.encode == "webp"
+        assert "hover_data" in template.kwargs and "hover_data" not in plot.kwargs
+        store.save(show=False)
+
     @staticmethod
     def test_add_rgba_image(make_store):
         store = make_store()
@@ -209,10 +420,73 @@ class TestPlotStore:
         rgba_img = rgba.rgb
         rgba_intensity = rgba.intensities
         tab_name = "rgba"
-        store.plot_rgb_image(tab_name, {"image": rgba_img})
+        _, _, plot = store.plot_rgb_image(tab_name, {"image": rgba_img})
+        assert "colormapper" not in plot.kwargs
         store.plot_rgb_image(tab_name, {"image": [rgba_img], "intensities": [rgba_intensity]})
         assert "item #0" in store.tabs[tab_name]
 
+    @staticmethod
+    @pytest.mark.parametrize("factor", (1, 3))
+    def test_add_rgba_image_hover(make_store, factor):
+        store = make_store()
+        rgba = ImageRGBA([np.random.randint(0, 100, (10, 10)) for _ in range(3)])
+        _, _, plot = store.plot_rgb_image("rgba", rgba, hover_factor=factor, hover_labels=["A", "B", "C"])
+        assert plot.source.data["image"][0].shape == (10, 10, 4)
+        hover = plot.plots["hover"].data_source.data
+        shape = (-(-10 // factor),) * 2
+        assert hover["image"][0].shape == hover["dominant"][0].shape == shape
+        assert hover["image"][0].dtype == np.float32
+        assert hover["channel_0"][0].dtype == hover["dominant"][0].dtype == np.uint8
+        if factor == 1:
+            assert_array_equal(hover["image"][0], rgba.intensities)
+            assert_array_equal(hover["dominant"][0], np.argmax(rgba._intensities, axis=0))
+        tooltips = dict(plot.figure.select_one({"type": HoverTool}).tooltips)
+        assert tooltips["B"] == "@channel_1"
+        # color mapper is computed from the hover intensity
+        colormapper = plot.kwargs["colormapper"]
+        assert plot.plots["hover"].glyph.color_mapper is colormapper
+        assert np.isclose(colormapper.high, hover["image"][0].max(), atol=0.01)
+        _, _, plot = store.plot_rgb_image("rgba", rgba, hover_factor=factor, z_percentiles=(0, 50))
+        assert plot.kwargs["colormapper"].high < colormapper.high
+
+        with pytest.raises(ValueError):
+            store.plot_rgb_image("rgba", rgba, hover_labels=["A"])
+
+        # hidden channels are not part of the hover data, labels can still be specified for all channels
+        rgba.set_visible(1, False)
+        _, _, plot = store.plot_rgb_image("rgba", rgba, hover_factor=factor, hover_labels=["A", "B", "C"])
+        hover = plot.plots["hover"].data_source.data
+        assert "channel_1" not in hover
+        assert not np.any(hover["dominant"][0] == 1)
+        tooltips = dict(plot.figure.select_one({"type": HoverTool}).tooltips)
+        assert "B" not in tooltips and tooltips["C"] == "@channel_2"
+
+        # ties and empty pixels are attributed to the first visible channel
+        rgba.set_visible(0, False)
+        _, _, plot = store.plot_rgb_image("rgba", rgba, hover_factor=factor)
+        hover = plot.plots["hover"].data_source.data
+        assert "channel_0" not in hover
+        assert np.all(hover["dominant"][0] == 2)
+
+    @staticmethod
+    @pytest.mark.parametrize("factor", (1, 4))
+    def test_add_rgba_image_trim_hover(make_store, factor):
+        store = make_store()
+        images = [np.zeros((100, 100)) for _ in range(2)]
+        for image in images:
+            image[30:50, 40:60] = np.random.random((20, 20)) + 1
+        rgba = ImageRGBA(images)
+        _, _, plot = store.plot_rgb_image("rgba", rgba, trim=True, hover_factor=factor)
+        assert plot.extent == (40, 30, 20, 20)
+        hover = plot.plots["hover"].data_source.data
+        if factor == 1:
+            assert (hover["x"][0], hover["y"][0], hover["dw"][0], hover["dh"][0]) == (40, 30, 20, 20)
+            assert_array_equal(hover["image"][0], rgba.intensities[30:50, 40:60].astype(np.float32))
+        else:
+            # hover grid is cropped to the blocks overlapping the trimmed image
+            assert (hover["x"][0], hover["y"][0], hover["dw"][0], hover["dh"][0]) == (40, 28, 20, 24)
+            assert hover["image"][0].shape == hover["channel_0"][0].shape == (6, 5)
+
     @staticmethod
     def test_add_annotations_line(make_store):
         store = make_store()
@@ -258,6 +532,28 @@ class TestPlotStore:
         # add labels
         store.add_labels(plot, {"x": [3, 4], "y": [3, 4], "text": ["label 1", "label 2"]})
 
+    @staticmethod
+    def test_add_label_contours(make_store):
+        store = make_store()
+        labels = np.zeros((20, 10), dtype=np.int32)
+        labels[1:4, 1:4] = 3
+        labels[10:18, 5:10] = 7
+        tab_name = "heatmap"
+        _, _, plot = store.plot_image(tab_name, {"image": [labels], "dw": [5], "dh": [10]})
+        n_annotations = len(plot.annotations)
+        store.add_label_contours(plot, labels, colors=["red", "blue"])
+        assert len(plot.annotations) == n_annotations + 1
+        source, kind = list(plot.annotations.values())[-1]
+        assert kind == "MultiPolygons"
+        np.testing.assert_array_equal(source.data["label"], [3, 7])
+        assert source.data["color"] == ["red", "blue"]
+        # coordinates are scaled to the image extent
+        assert np.min(source.data["xs"][0][0][0]) == 0.5 and np.max(source.data["xs"][0][0][0]) == 2.0
+        assert np.min(source.data["ys"][1][0][0]) == 5.0 and np.max(source.data["ys"][1][0][0]) == 9.0
+
+        with pytest.raises(ValueError):
+            store.add_label_contours(plot, labels, colors=["red"])
+
     @staticmethod
     def test_add_annotations_fail(make_store):
         store = make_store()
@@ -304,6 +600,66 @@ class TestPlotStore:
         store.save(show=False)
         assert os.path.exists(filepath)
 
+    @staticmethod
+    def test_profile(make_store):
+        store = make_store()
+        x, y = np.arange(100), np.random.random(100)
+        events = []
+        with store.profile(callback=events.append) as profiler:
+            _, _, plot = store.plot_spectrum("spectra", {"x": x, "y": y})
+            store.plot_image("heatmap", {"image": [np.random.random((10, 10))]})
+            store.save(show=False)
+        assert events == profiler.events
+        assert {"plot:get_figure", "plot:set_hover", "layout:tab", "save:serialize"} <= set(
+            profiler.summary()["phases"]
+        )
+        assert all(event["tab"] == "spectra" for event in events if event.get("plot", None) == plot.name)
+
+        report = json.loads(profiler.to_json())
+        assert set(report["summary"]["tabs"]) == {"spectra", "heatmap"}
+        assert report["summary"]["plots"][plot.name]["count"] > 0
+        trace = profiler.to_chrome_trace(os.path.join(store.output_dir, "trace.json"))
+        assert len(trace["traceEvents"]) == len(events)
+        assert all(event["ph"] == "X" and event["dur"] >= 0 for event in trace["traceEvents"])
+
+        # profiling is disabled outside of the context manager
+        store.plot_spectrum("spectra", {"x": x, "y": y})
+        assert len(profiler.events) == len(events)
+
+    @staticmethod
+    def test_size_report(make_store):
+        store = make_store()
+        x, y = np.sort(np.random.random(5000)) * 100, np.random.random(5000).astype(np.float32)
+        _, _, first = store.plot_spectrum("spectra", {"x": x, "y": y})
+        _, _, second = store.plot_spectrum("spectra", {"x": x.copy(), "y": y + 1})
+        _, layout_name, image = store.plot_image("heatmap", {"image": [np.random.random((200, 200))]})
+
+        report = store.size_report(image_bytes=100_000)
+        assert report["total_bytes"] == report["document_bytes"] + report["resources_bytes"]
+        plot_report = report["tabs"]["heatmap"]["layouts"][layout_name]["plots"][image.name]
+        assert (
+            plot_report["bytes"]
+            > plot_report["sources"]["source"]["columns"]["image"]
+            > image.source.data["image"][0].nbytes
+        )
+        assert report["top_columns"][0]["plot"] == image.name
+        offenders = {(item["kind"], item["plot"], item["column"]) for item in report["offenders"]}
+        assert ("image", image.name, "image") in offenders
+        assert ("float64", image.name, "image") in offenders
+        assert ("float64", first.name, "x") in offenders
+        assert ("duplicate", second.name, "x") in offenders
+        assert ("float64", first.name, "y") not in offenders
+
+        # report matches the saved document and the store can still be saved
+        filepath, report = store.save(show=False, report=True)
+        assert report["total_bytes"] == os.path.getsize(filepath)
+        assert set(report["tabs"]) == {"spectra", "heatmap"}
+
+        # report does not depend on the order of calls
+        store.save(show=False)
+        assert store.size_report()["document_bytes"] == report["document_bytes"]
+        store.save(show=False)
+
 
 class TestCustomPlotStore:
     @staticmethod
@@ -0,0 +1,170 @@
+"""Test plotski.utilities"""
+
+import numpy as np
+import pytest
+from matplotlib.colors import rgb2hex
+from numpy.testing import assert_array_equal
+
+from plotski._palettes import PALETTES
+from plotski.utilities import (
+    apply_color_mapper,
+    convert_colormap_to_mapper,
+    encode_image,
+    get_colormap,
+    get_label_contours,
+    get_palette,
+    get_percentile_limits,
+    get_quantiles,
+    get_rgba_colors,
+    get_sample,
+)
+
+
+def test_get_sample():
+    array = np.random.random((100, 50))
+    sample = get_sample(array, 1000)
+    assert sample.shape == (1000,)
+    assert np.all(np.isin(sample, array))
+    # sampling is deterministic
+    assert_array_equal(sample, get_sample(array, 1000))
+    # small arrays are returned in full
+    assert get_sample(array, 10_000).size == array.size
+
+
+def test_get_percentile_limits():
+    array = np.arange(100_000, dtype=np.float32).reshape(100, 1000)
+    array[0, :5] = np.nan
+    array[-1, -1] = 1e12  # hot pixel
+    low, high = get_percentile_limits(array, (1, 99), n_samples=10_000)
+    assert low == pytest.approx(1_000, rel=0.2)
+    assert high == pytest.approx(99_000, rel=0.02)
+
+    with pytest.raises(ValueError):
+        get_percentile_limits(array, (99, 1))
+
+
+@pytest.mark.parametrize("dtype", (np.uint8, np.uint16, np.int16, np.int64))
+def test_get_quantiles_integer(dtype):
+    rng = np.random.default_rng(0)
+    array = rng.integers(np.iinfo(np.int8).min, 200, (101, 37)).astype(dtype)
+    quantiles = [0, 0.02, 0.5, 0.731, 0.98, 1]
+    np.testing.assert_allclose(get_quantiles(array, quantiles, n_samples=10), np.quantile(array, quantiles))
+
+
+def test_get_quantiles_float():
+    array = np.random.default_rng(0).random((1000, 1000))
+    np.testing.assert_allclose(get_quantiles(array, [0.1, 0.9], n_samples=100_000), [0.1, 0.9], atol=0.01)
+    assert get_quantiles(array, [0.5], n_samples=None) == [np.quantile(array, 0.5)]
+
+    with pytest.raises(ValueError):
+        get_quantiles(array, [1.5])
+
+
+def test_convert_colormap_to_mapper_percentiles():
+    array = np.random.random((100, 100))
+    array[0, 0] = 1e6
+    _, mapper = convert_colormap_to_mapper(array)
+    assert mapper.high == 1e6
+    _, mapper = convert_colormap_to_mapper(array, z_percentiles=(0, 99))
+    assert mapper.high <= 1
+    _, mapper = convert_colormap_to_mapper(array, z_percentiles=(0, 99), z_min=-1)
+    assert mapper.low == -1
+
+
+def test_get_label_contours():
+    labels = np.zeros((12, 12), dtype=np.int32)
+    labels[0:5, 0:5] = 1
+    labels[2, 2] = 0  # hole
+    labels[7:11, 7:11] = 1  # second part with a hole
+    labels[8, 8] = 0
+    labels[5, 5] = labels[6, 6] = 2  # pixels touching diagonally are separate parts
+    data = get_label_contours(labels, tolerance=0)
+    assert_array_equal(data["label"], [1, 2])
+    assert [len(polygon) for polygon in data["xs"][0]] == [2, 2]
+    assert len(data["xs"][1]) == 2
+    # outer boundary and hole of the first part follow pixel edges
+    assert_array_equal(data["xs"][0][0][0], [0, 5, 5, 0])
+    assert_array_equal(data["ys"][0][0][0], [0, 0, 5, 5])
+    assert_array_equal(data["xs"][0][0][1], [2, 3, 3, 2])
+    assert_array_equal(data["xs"][0][1][1], [8, 9, 9, 8])
+
+    data = get_label_contours(labels, tolerance=0, x=10, y=20, dw=6, dh=24)
+    assert_array_equal(data["xs"][0][0][0], [10, 12.5, 12.5, 10])
+    assert_array_equal(data["ys"][0][0][0], [20, 20, 30, 30])
+    data = get_label_contours(np.zeros((5, 5), dtype=int))
+    assert data["xs"] == data["ys"] == [] and data["label"].size == 0
+
+    with pytest.raises(ValueError):
+        get_label_contours(np.zeros(5, dtype=int))
+
+
+def test_get_label_contours_simplify():
+    yy, xx = np.mgrid[:60, :60]
+    labels = ((yy - 30) ** 2 + (xx - 30) ** 2 < 400).astype(np.int32)
+    exact = get_label_contours(labels, tolerance=0)
+    simple = get_label_contours(labels, tolerance=1)
+    rows, cols = exact["ys"][0][0][0], exact["xs"][0][0][0]
+    simple_rows, simple_cols = simple["ys"][0][0][0], simple["xs"][0][0][0]
+    assert 4 <= simple_rows.size < rows.size
+    # every vertex of the exact outline lies within the tolerance of the simplified one
+    starts = np.column_stack((simple_rows, simple_cols))
+    ends = np.roll(starts, -1, axis=0)
+    points = np.column_stack((rows, cols))[:, None]
+    direction = ends - starts
+    t = np.clip(np.sum((points - starts) * direction, axis=2) / np.sum(direction**2, axis=1), 0, 1)
+    distance = np.linalg.norm(points - (starts + t[..., None] * direction), axis=2).min(axis=1)
+    assert distance.max() <= 1
+
+
+def test_apply_color_mapper():
+    image = np.array([[0.0, 0.5], [1.0, np.nan]])
+    mapper = convert_colormap_to_mapper(image, "viridis", z_min=0, z_max=1)[1]
+    mapper.nan_color = "#ff0000"
+    rgba = apply_color_mapper(image, mapper)
+    assert rgba.shape == (2, 2, 4)
+    assert rgba.dtype == np.uint8
+    assert tuple(rgba[1, 1]) == (255, 0, 0, 255)
+    assert tuple(rgba[0, 0]) != tuple(rgba[1, 0])
+
+
+def test_get_rgba_colors():
+    from matplotlib.colors import to_rgba_array
+
+    colors = ["#000000", "#ff8000", "#12345678", "#FFFFFF"]
+    expected = np.round(to_rgba_array(colors) * 255).astype(np.uint8)
+    assert_array_equal(get_rgba_colors(colors), expected)
+    assert_array_equal(get_rgba_colors(["red", "#00ff00"]), [[255, 0, 0, 255], [0, 255, 0, 255]])
+
+
+@pytest.mark.parametrize("fmt", ("png", "webp"))
+def test_encode_image(fmt):
+    import base64
+    import io
+
+    from PIL import Image
+
+    rgba = np.random.randint(0, 255, (10, 12, 4), dtype=np.uint8)
+    rgba[..., 3] = 255
+    uri = encode_image(rgba, fmt)
+    assert uri.startswith(f"data:image/{fmt};base64,")
+    decoded = np.asarray(Image.open(io.BytesIO(base64.b64decode(uri.split(",", 1)[1]))))
+    assert_array_equal(decoded[..., :3], np.flipud(rgba)[..., :3])
+
+    with pytest.raises(ValueError):
+        encode_image(rgba.astype(np.float32), fmt)
+    with pytest.raises(ValueError):
+        encode_image(rgba, "jpeg")
+
+
+@pytest.mark.parametrize("cmap", sorted({name.removesuffix("_r") for name in PALETTES}))
+def test_get_palette_matches_matplotlib(cmap):
+    for name in (cmap, f"{cmap}_r"):
+        colormap = get_colormap(name)
+        assert get_palette(name) == [rgb2hex(color) for color in colormap(np.arange(colormap.N))]
+
+
+def test_get_palette_fallback():
+    assert "tab10" not in PALETTES
+    assert get_palette("tab10") == [rgb2hex(color) for color in get_colormap("tab10")(np.arange(10))]
+    with pytest.raises((KeyError, ValueError)):
+        get_palette("not-a-colormap")
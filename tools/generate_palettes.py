@@ -0,0 +1,93 @@
+"""Generate ``src/plotski/_palettes.py`` with precomputed palettes of common matplotlib colormaps.
+
+Each palette is stored as hex string of the packed 8-bit RGB values (6 characters per color) so the module stays small
+and can be loaded without importing matplotlib. Reversed (``_r``) palettes are only stored when they differ from the
+reversed base palette. Re-run this script after upgrading matplotlib::
+
+    python tools/generate_palettes.py
+"""
+
+from __future__ import annotations
+
+import textwrap
+from pathlib import Path
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.colors import rgb2hex
+
+OUTPUT = Path(__file__).resolve().parents[1] / "src" / "plotski" / "_palettes.py"
+COLORMAPS = (
+    # perceptually uniform
+    "viridis",
+    "plasma",
+    "inferno",
+    "magma",
+    "cividis",
+    "turbo",
+    # sequential
+    "Greys",
+    "gray",
+    "binary",
+    "bone",
+    "hot",
+    "afmhot",
+    "Blues",
+    "Reds",
+    "Greens",
+    "Purples",
+    "Oranges",
+    "YlOrRd",
+    "YlGnBu",
+    # diverging
+    "coolwarm",
+    "RdBu",
+    "bwr",
+    "seismic",
+    "Spectral",
+    "PiYG",
+    # miscellaneous
+    "jet",
+    "rainbow",
+)
+
+
+def get_hex_palette(name: str) -> list[str]:
+    """Return palette of the colormap the same way `plotski.utilities.convert_colormap_to_mapper` does."""
+    colormap = mpl.colormaps[name]
+    return [rgb2hex(color) for color in colormap(np.arange(colormap.N))]
+
+
+def pack_palette(palette: list[str]) -> str:
+    """Pack palette into single hex string."""
+    return "".join(color.lstrip("#") for color in palette)
+
+
+def main() -> None:
+    palettes = {}
+    for name in COLORMAPS:
+        palette = get_hex_palette(name)
+        palettes[name] = pack_palette(palette)
+        reversed_palette = get_hex_palette(f"{name}_r")
+        if reversed_palette != palette[::-1]:
+            palettes[f"{name}_r"] = pack_palette(reversed_palette)
+
+    lines = [
+        '"""Precomputed palettes of common matplotlib colormaps.',
+        "",
+        f"Generated by `tools/generate_palettes.py` using matplotlib {mpl.__version__} - do not edit manually.",
+        '"""',
+        "",
+        "PALETTES = {",
+    ]
+    for name, packed in palettes.items():
+        lines.append(f'    "{name}": (')
+        lines.extend(f'        "{chunk}"' for chunk in textwrap.wrap(packed, 108))
+        lines.append("    ),")
+    lines.append("}")
+    OUTPUT.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"Saved {len(palettes)} palettes to {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()